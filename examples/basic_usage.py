@@ -2,20 +2,144 @@
 Basic usage examples for time_series_slicer library.
 """
 
+import functools
+
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 from time_series_slicer import TimeSeriesSlicer, slice_by_time, slice_by_window
 
-
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+
+@njit(parallel=True, fastmath=True)
+def _window_stats_kernel(arr, win, step):
+    """
+    Rolling mean/std per window: add the incoming rows, subtract the outgoing.
+
+    Each column is an independent running sum, so columns are spread over
+    ``prange`` while the windows of one column advance sequentially.
+    """
+    n_rows, n_features = arr.shape
+    n_windows = (n_rows - win) // step + 1
+    means = np.empty((n_windows, n_features))
+    stds = np.empty((n_windows, n_features))
+
+    for j in prange(n_features):
+        running_sum = 0.0
+        running_sumsq = 0.0
+        for i in range(win):
+            running_sum += arr[i, j]
+            running_sumsq += arr[i, j] * arr[i, j]
+
+        for w in range(n_windows):
+            if w > 0:
+                start = w * step
+                prev = start - step
+                for i in range(prev, start):
+                    running_sum -= arr[i, j]
+                    running_sumsq -= arr[i, j] * arr[i, j]
+                for i in range(prev + win, start + win):
+                    running_sum += arr[i, j]
+                    running_sumsq += arr[i, j] * arr[i, j]
+            mean = running_sum / win
+            means[w, j] = mean
+            stds[w, j] = np.sqrt(max(running_sumsq / win - mean * mean, 0.0))
+
+    return means, stds
+
+
+def window_stats(arr, win, step, use_numba=True):
+    """
+    Compute per-window mean and (population) std of a 2D float array.
+
+    Args:
+        arr: Array of shape (n_rows, n_features)
+        win: Window length in rows
+        step: Step between window starts in rows
+        use_numba: Use the compiled kernel when numba is installed
+
+    Returns:
+        Tuple of (means, stds), each of shape (n_windows, n_features)
+    """
+    arr = np.ascontiguousarray(arr, dtype=np.float64)
+    if len(arr) < win:
+        empty = np.empty((0, arr.shape[1]))
+        return empty, empty.copy()
+
+    if use_numba and HAS_NUMBA:
+        return _window_stats_kernel(arr, win, step)
+
+    # Same rolling-sum algorithm, expressed with prefix sums
+    csum = np.zeros((len(arr) + 1, arr.shape[1]))
+    csumsq = np.zeros_like(csum)
+    np.cumsum(arr, axis=0, out=csum[1:])
+    np.cumsum(arr * arr, axis=0, out=csumsq[1:])
+    starts = np.arange(0, len(arr) - win + 1, step)
+    means = (csum[starts + win] - csum[starts]) / win
+    variances = (csumsq[starts + win] - csumsq[starts]) / win - means * means
+    return means, np.sqrt(np.maximum(variances, 0.0))
+
+
+# Hourly index shared by every sample DataFrame (DatetimeIndex is immutable)
+_SAMPLE_INDEX = pd.date_range('2024-01-01', periods=1000, freq='H')
+
+
+class RollingAggregator:
+    """
+    Running mean/std of a window that slides forward over an array.
+
+    Overlapping windows share most of their rows, so advancing only touches
+    the rows that enter and leave the window.
+    """
+
+    def __init__(self, values):
+        self.count = len(values)
+        self.running_sum = values.sum()
+        self.running_sumsq = np.dot(values, values)
+
+    def advance(self, new_slice, old_slice):
+        """Add the rows entering the window and remove the rows leaving it."""
+        self.count += len(new_slice) - len(old_slice)
+        self.running_sum += new_slice.sum() - old_slice.sum()
+        self.running_sumsq += np.dot(new_slice, new_slice) - np.dot(old_slice, old_slice)
+
+    @property
+    def mean(self):
+        return self.running_sum / self.count
+
+    @property
+    def std(self):
+        return np.sqrt(max(self.running_sumsq / self.count - self.mean ** 2, 0.0))
+
+
+@functools.lru_cache(maxsize=1)
 def create_sample_data():
-    """Create sample time series data for demonstration."""
-    dates = pd.date_range('2024-01-01', periods=1000, freq='H')
-    data = pd.DataFrame({
-        'value': np.random.randn(1000).cumsum(),
-        'temperature': 20 + np.random.randn(1000) * 5,
-        'humidity': 50 + np.random.randn(1000) * 10
-    }, index=dates)
+    """
+    Create sample time series data for demonstration.
+
+    The result is cached and shared by all examples, none of which mutate it.
+    """
+    # Column-major block: each column is one contiguous buffer, which is what
+    # the per-column reductions and filters in the examples scan over.
+    # Filled by a single draw, then scaled in place.
+    rng = np.random.default_rng(42)
+    values = np.empty((3, 1000)).T
+    rng.standard_normal(out=values)
+    np.cumsum(values[:, 0], out=values[:, 0])
+    values[:, 1] *= 5
+    values[:, 1] += 20
+    values[:, 2] *= 10
+    values[:, 2] += 50
+    data = pd.DataFrame(values, index=_SAMPLE_INDEX, columns=['value', 'temperature', 'humidity'], copy=False)
     return data
 
 
@@ -63,30 +187,38 @@ def example_window_slicing():
     print("="*60)
 
     data = create_sample_data()
-    slicer = TimeSeriesSlicer(data)
 
-    # Fixed-size windows (24 hours each)
+    # Fixed-size windows (24 hours each), reduced over a strided view of
+    # the underlying array instead of one DataFrame per window
     print("\nCreating 24-hour windows:")
-    window_count = 0
-    for window in slicer.slice_by_window(window_size=24, step_size=24):
-        window_count += 1
-        mean_temp = window['temperature'].mean()
+    temperature = data['temperature'].to_numpy()
+    windows = np.lib.stride_tricks.sliding_window_view(temperature, 24)[::24]
+    mean_temps = windows.mean(axis=1)
+    for window_count, mean_temp in enumerate(mean_temps[:5], 1):  # Show only first 5 windows
         print(f"Window {window_count}: Mean temperature = {mean_temp:.2f}°C")
-        if window_count >= 5:  # Show only first 5 windows
-            break
 
-    # Overlapping time-based windows
+    # Overlapping time-based windows: consecutive windows share 4 of their
+    # 7 days, so only the rows entering and leaving are aggregated per step
     print("\nCreating overlapping 7-day windows (3-day step):")
-    window_count = 0
-    for window in slicer.slice_by_window(
-        window_size=timedelta(days=7),
-        step_size=timedelta(days=3),
-        overlap=True
-    ):
-        window_count += 1
-        print(f"Window {window_count}: {window.index[0]} to {window.index[-1]}")
-        if window_count >= 3:  # Show only first 3 windows
+    window_size, step_size = timedelta(days=7), timedelta(days=3)
+    temperature = data['temperature'].to_numpy()
+    index = data.index
+
+    start_time = index[0]
+    lo, hi = 0, index.searchsorted(start_time + window_size, side='right')
+    aggregator = RollingAggregator(temperature[lo:hi])
+    for window_count in range(1, 4):  # Show only first 3 windows
+        if start_time + window_size > index[-1]:
             break
+        print(f"Window {window_count}: {index[lo]} to {index[hi - 1]}, "
+              f"mean temperature = {aggregator.mean:.2f}°C "
+              f"(std {aggregator.std:.2f}°C)")
+
+        start_time += step_size
+        new_lo = index.searchsorted(start_time)
+        new_hi = index.searchsorted(start_time + window_size, side='right')
+        aggregator.advance(temperature[hi:new_hi], temperature[lo:new_lo])
+        lo, hi = new_lo, new_hi
 
 
 def example_train_test_split():
@@ -166,21 +298,26 @@ def example_ml_pipeline():
     train_data, test_data = slicer.split_by_ratio([0.8, 0.2])
     print(f"\nDataset split - Train: {train_data.shape}, Test: {test_data.shape}")
 
-    # Create training windows
-    train_slicer = TimeSeriesSlicer(train_data)
+    # Create training windows as per-window feature rows (mean/std per column)
     print("\nCreating training windows (sequence length: 24):")
-
-    window_count = 0
-    for window in train_slicer.slice_by_window(window_size=24, step_size=6):
-        # In a real scenario, you would prepare features and train your model here
-        window_count += 1
-
-    print(f"Created {window_count} training windows")
-
-    # Prepare test data
-    test_slicer = TimeSeriesSlicer(test_data)
-    test_windows = list(test_slicer.slice_by_window(window_size=24, step_size=24))
-    print(f"Created {len(test_windows)} test windows")
+    means, stds = window_stats(train_data.to_numpy(), win=24, step=6)
+    features = np.hstack([means, stds])
+    # In a real scenario, you would train your model on these features here
+
+    print(f"Created {len(features)} training windows ({features.shape[1]} features each)")
+
+    # Prepare test data as one (n_windows, 24, n_features) float32 tensor.
+    # The window count follows from the length alone, and also guards short
+    # inputs that sliding_window_view would reject.
+    n_test_windows = max(0, (len(test_data) - 24) // 24 + 1)
+    test_values = test_data.to_numpy(dtype=np.float32)
+    if n_test_windows:
+        test_windows = np.lib.stride_tricks.sliding_window_view(
+            test_values, (24, test_values.shape[1])
+        )[::24, 0]
+    else:
+        test_windows = np.empty((0, 24, test_values.shape[1]), dtype=np.float32)
+    print(f"Created {n_test_windows} test windows, tensor shape {test_windows.shape}")
 
 
 def main():
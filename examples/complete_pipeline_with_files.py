@@ -29,39 +29,41 @@ CUSTOMIZATION:
 
 import sys
 import os
+import contextlib
+import importlib
+import io
 import json
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Add parent directory to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from investment_calculator.modules import (
-    scenario_generator,
-    tax_engine,
-    user_profile,
-    optimizer,
-    reporting
-)
+# Pipeline modules are imported inside the step that uses them, so startup
+# and STEP 1 do not wait on pandas/scipy/matplotlib imports.
 
 
-def remove_comments(obj):
-    """Recursively remove fields starting with underscore from dict/list structures."""
-    if isinstance(obj, dict):
-        return {k: remove_comments(v) for k, v in obj.items() if not k.startswith('_')}
-    elif isinstance(obj, list):
-        return [remove_comments(item) for item in obj]
-    else:
-        return obj
+def _without_comments(pairs):
+    """Build a JSON object while dropping fields starting with underscore."""
+    return {k: v for k, v in pairs if not k.startswith('_')}
 
 
 def load_json_config(filename):
     """Load JSON configuration file."""
     filepath = Path(__file__).parent / 'input_files' / filename
+    # Comment fields are dropped while parsing, in the same pass. orjson has no
+    # object hook, so config files are always read with the standard parser;
+    # they are small, and orjson is kept for writing results.
     with open(filepath, 'r') as f:
-        config = json.load(f)
-    # Remove comment fields recursively
-    return remove_comments(config)
+        return json.load(f, object_pairs_hook=_without_comments)
 
 
 def save_results(results, output_dir='outputs'):
@@ -71,23 +73,39 @@ def save_results(results, output_dir='outputs'):
 
     # Save HTML report
     if 'report' in results and results['report'].get('html'):
-        with open(output_path / 'investment_report.html', 'w') as f:
-            f.write(results['report']['html'])
+        (output_path / 'investment_report.html').write_bytes(results['report']['html'].encode('utf-8'))
         print(f"  ✓ Saved: {output_path / 'investment_report.html'}")
 
     # Save portfolio as JSON
     if 'optimal_portfolio' in results:
-        with open(output_path / 'optimal_portfolio.json', 'w') as f:
-            json.dump(results['optimal_portfolio'], f, indent=2)
+        if orjson is not None:
+            (output_path / 'optimal_portfolio.json').write_bytes(orjson.dumps(
+                results['optimal_portfolio'],
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+            ))
+        else:
+            with open(output_path / 'optimal_portfolio.json', 'w') as f:
+                json.dump(results['optimal_portfolio'], f, indent=2)
         print(f"  ✓ Saved: {output_path / 'optimal_portfolio.json'}")
 
-    # Save figures
+    # Save figures (PNG rendering is CPU-bound and independent per figure)
     if 'figures' in results:
-        for name, fig_data in results['figures'].items():
-            if 'figure' in fig_data:
-                fig_path = output_path / f"{name}.png"
-                fig_data['figure'].savefig(fig_path, dpi=150, bbox_inches='tight')
-                print(f"  ✓ Saved: {fig_path}")
+        figures = [
+            (output_path / f"{name}.png", fig_data['figure'])
+            for name, fig_data in results['figures'].items()
+            if fig_data.get('figure') is not None
+        ]
+        if figures:
+            with ProcessPoolExecutor(max_workers=min(len(figures), os.cpu_count() or 1)) as executor:
+                for fig_path in executor.map(_save_figure, figures):
+                    print(f"  ✓ Saved: {fig_path}")
+
+
+def _save_figure(item):
+    """Render one (path, figure) pair to PNG; runs in a worker process."""
+    fig_path, figure = item
+    figure.savefig(fig_path, dpi=150, bbox_inches='tight')
+    return fig_path
 
 
 def print_section(title):
@@ -97,8 +115,34 @@ def print_section(title):
     print("=" * 70)
 
 
+class Section:
+    """
+    Buffer everything printed in a pipeline section and write it at once.
+
+    The section header is printed on entry; the buffered text is written to
+    the real stdout on exit, including when the section raises.
+    """
+
+    def __init__(self, title):
+        self.title = title
+        self._buffer = io.StringIO()
+        self._redirect = contextlib.redirect_stdout(self._buffer)
+
+    def __enter__(self):
+        self._redirect.__enter__()
+        print_section(self.title)
+        return self
+
+    def __exit__(self, *exc_info):
+        self._redirect.__exit__(*exc_info)
+        sys.stdout.write(self._buffer.getvalue())
+        sys.stdout.flush()
+        return False
+
+
 def main():
     """Run complete pipeline."""
+    start_ns = time.perf_counter_ns()
     start_time = datetime.now()
 
     print("=" * 70)
@@ -117,278 +161,294 @@ def main():
     # ========================================================================
     # STEP 1: LOAD CONFIGURATIONS
     # ========================================================================
-    print_section("STEP 1: LOADING CONFIGURATIONS")
-
-    print("\nLoading JSON configuration files...")
-
-    # Load all configs
-    scenario_config = load_json_config('scenario_config.json')
-    tax_config_data = load_json_config('tax_config_us.json')
-    user_profile_data = load_json_config('user_profile_aggressive.json')
-    optimization_config = load_json_config('optimization_config.json')
-
-    print(f"  ✓ scenario_config.json")
-    print(f"  ✓ tax_config_us.json")
-    print(f"  ✓ user_profile_aggressive.json")
-    print(f"  ✓ optimization_config.json")
-
-    print(f"\nConfiguration summary:")
-    print(f"  Scenarios to generate: {scenario_config['num_scenarios']}")
-    print(f"  Time horizon: {scenario_config['time_horizon']} years")
-    print(f"  Tax jurisdiction: {tax_config_data['jurisdiction']}")
-    print(f"  Investor age: {user_profile_data['user_profile']['personal_info']['age']}")
-    print(f"  Risk tolerance: {user_profile_data['user_profile']['investment_preferences']['risk_tolerance']}")
-    print(f"  Optimization objective: {optimization_config['optimization_objective']}")
+    with Section("STEP 1: LOADING CONFIGURATIONS"):
+        # Warm up the heaviest import (matplotlib via reporting) while configs load
+        threading.Thread(
+            target=importlib.import_module,
+            args=('investment_calculator.modules.reporting',),
+            daemon=True
+        ).start()
+
+        print("\nLoading JSON configuration files...")
+
+        # Load all configs (independent files, read concurrently)
+        config_files = [
+            'scenario_config.json',
+            'tax_config_us.json',
+            'user_profile_aggressive.json',
+            'optimization_config.json'
+        ]
+        with ThreadPoolExecutor(max_workers=len(config_files)) as executor:
+            scenario_config, tax_config_data, user_profile_data, optimization_config = (
+                executor.map(load_json_config, config_files)
+            )
+
+        for filename in config_files:
+            print(f"  ✓ {filename}")
+
+        print(f"\nConfiguration summary:")
+        print(f"  Scenarios to generate: {scenario_config['num_scenarios']}")
+        print(f"  Time horizon: {scenario_config['time_horizon']} years")
+        print(f"  Tax jurisdiction: {tax_config_data['jurisdiction']}")
+        print(f"  Investor age: {user_profile_data['user_profile']['personal_info']['age']}")
+        print(f"  Risk tolerance: {user_profile_data['user_profile']['investment_preferences']['risk_tolerance']}")
+        print(f"  Optimization objective: {optimization_config['optimization_objective']}")
 
     # ========================================================================
     # STEP 2: GENERATE ECONOMIC SCENARIOS
     # ========================================================================
-    print_section("STEP 2: GENERATING ECONOMIC SCENARIOS")
+    with Section("STEP 2: GENERATING ECONOMIC SCENARIOS"):
+        from investment_calculator.modules import scenario_generator
 
-    print(f"\nGenerating {scenario_config['num_scenarios']} scenarios...")
+        print(f"\nGenerating {scenario_config['num_scenarios']} scenarios...")
 
-    gen = scenario_generator.ScenarioGenerator(random_seed=42)
-    scenario_results = gen.generate(scenario_config)
+        gen = scenario_generator.ScenarioGenerator(random_seed=42)
+        scenario_results = gen.generate(scenario_config)
 
-    scenarios_df = scenario_results['scenarios']
-    diagnostics = scenario_results['diagnostics']
+        scenarios_df = scenario_results['scenarios']
+        diagnostics = scenario_results['diagnostics']
 
-    print(f"✓ Generated {scenarios_df['scenario_id'].nunique()} scenarios")
-    print(f"\nDiagnostics:")
-    print(f"  Mean stock return: {diagnostics['mean_returns']['stock_return']:.2%}")
-    print(f"  Mean bond return: {diagnostics['mean_returns']['bond_return']:.2%}")
-    print(f"  Mean real estate return: {diagnostics['mean_returns']['real_estate_return']:.2%}")
-    print(f"  Stock volatility: {diagnostics['volatilities']['stock_return']:.2%}")
-    print(f"  Stock-bond correlation: {diagnostics['correlations'].loc['stock_return', 'bond_return']:.2f}")
+        print(f"✓ Generated {diagnostics['num_scenarios']} scenarios")
+        print(f"\nDiagnostics:")
+        print(f"  Mean stock return: {diagnostics['mean_returns']['stock_return']:.2%}")
+        print(f"  Mean bond return: {diagnostics['mean_returns']['bond_return']:.2%}")
+        print(f"  Mean real estate return: {diagnostics['mean_returns']['real_estate_return']:.2%}")
+        print(f"  Stock volatility: {diagnostics['volatilities']['stock_return']:.2%}")
+        correlations = diagnostics['correlations']
+        stock_idx = correlations.index.get_loc('stock_return')
+        bond_idx = correlations.columns.get_loc('bond_return')
+        print(f"  Stock-bond correlation: {correlations.to_numpy()[stock_idx, bond_idx]:.2f}")
 
     # ========================================================================
     # STEP 3: APPLY TAX TREATMENT
     # ========================================================================
-    print_section("STEP 3: APPLYING TAX TREATMENT")
-
-    print(f"\nApplying {tax_config_data['jurisdiction']} tax rules...")
-
-    engine = tax_engine.TaxEngine()
-
-    # Get preset tax configuration for jurisdiction
-    tax_config_preset = tax_engine.TaxConfigPreset.get_preset(tax_config_data['jurisdiction'])
-
-    # Apply taxes
-    tax_results = engine.apply_taxes({
-        'scenarios': scenarios_df,
-        'tax_config': tax_config_preset,
-        'investment_allocation': tax_config_data['investment_allocation']
-    })
-
-    after_tax_scenarios = tax_results['after_tax_scenarios']
-
-    print(f"✓ Calculated after-tax returns")
-
-    if 'tax_tables' in tax_results and 'effective_tax_rate' in tax_results['tax_tables']:
-        effective_rates = tax_results['tax_tables']['effective_tax_rate']
-        if not effective_rates.empty:
-            print(f"\nTax Impact:")
-            print(f"  Mean effective tax rate: {effective_rates['effective_tax_rate'].mean():.1%}")
-            print(f"  Tax drag on returns: {after_tax_scenarios['annual_tax_drag'].mean():.2%}")
-
-    print(f"\nAllocation across account types:")
-    for asset, allocation in tax_config_data['investment_allocation'].items():
-        # Skip comment fields
-        if asset.startswith('_') or not isinstance(allocation, dict):
-            continue
-        print(f"  {asset}:")
-        for account_type, pct in allocation.items():
-            # Skip comment fields in nested dicts
-            if account_type.startswith('_') or not isinstance(pct, (int, float)):
+    with Section("STEP 3: APPLYING TAX TREATMENT"):
+        from investment_calculator.modules import tax_engine
+
+        print(f"\nApplying {tax_config_data['jurisdiction']} tax rules...")
+
+        engine = tax_engine.TaxEngine()
+
+        # Get preset tax configuration for jurisdiction
+        tax_config_preset = tax_engine.TaxConfigPreset.get_preset(tax_config_data['jurisdiction'])
+
+        # Apply taxes
+        tax_results = engine.apply_taxes({
+            'scenarios': scenarios_df,
+            'scenario_arrays': scenario_results['arrays'],
+            'tax_config': tax_config_preset,
+            'investment_allocation': tax_config_data['investment_allocation']
+        })
+
+        after_tax_scenarios = tax_results['after_tax_scenarios']
+
+        print(f"✓ Calculated after-tax returns")
+
+        if 'tax_tables' in tax_results and 'effective_tax_rate' in tax_results['tax_tables']:
+            effective_rates = tax_results['tax_tables']['effective_tax_rate']
+            if not effective_rates.empty:
+                print(f"\nTax Impact:")
+                print(f"  Mean effective tax rate: {effective_rates['effective_tax_rate'].mean():.1%}")
+                print(f"  Tax drag on returns: {after_tax_scenarios['annual_tax_drag'].mean():.2%}")
+
+        print(f"\nAllocation across account types:")
+        for asset, allocation in tax_config_data['investment_allocation'].items():
+            # Skip comment fields
+            if asset.startswith('_') or not isinstance(allocation, dict):
                 continue
-            print(f"    {account_type}: {pct:.0%}")
+            print(f"  {asset}:")
+            for account_type, pct in allocation.items():
+                # Skip comment fields in nested dicts
+                if account_type.startswith('_') or not isinstance(pct, (int, float)):
+                    continue
+                print(f"    {account_type}: {pct:.0%}")
 
     # ========================================================================
     # STEP 4: PROCESS USER PROFILE
     # ========================================================================
-    print_section("STEP 4: PROCESSING USER PROFILE")
+    with Section("STEP 4: PROCESSING USER PROFILE"):
+        from investment_calculator.modules import user_profile
 
-    manager = user_profile.UserProfileManager()
+        manager = user_profile.UserProfileManager()
 
-    print(f"\nProcessing user profile...")
+        print(f"\nProcessing user profile...")
 
-    profile_results = manager.process(user_profile_data)
+        profile_results = manager.process(user_profile_data)
 
-    validated = profile_results['validated_profile']
-    risk_prof = profile_results['risk_profile']
-    life_stages = profile_results['life_stages']
-    summary_stats = profile_results['summary_statistics']
+        validated = profile_results['validated_profile']
+        risk_prof = profile_results['risk_profile']
+        life_stages = profile_results['life_stages']
+        summary_stats = profile_results['summary_statistics']
 
-    print(f"✓ Profile processed and validated")
+        print(f"✓ Profile processed and validated")
 
-    if profile_results['validation_warnings']:
-        print(f"\nWarnings:")
-        for warning in profile_results['validation_warnings']:
-            print(f"  ⚠ {warning}")
+        if profile_results['validation_warnings']:
+            print(f"\nWarnings:")
+            for warning in profile_results['validation_warnings']:
+                print(f"  ⚠ {warning}")
 
-    print(f"\nRisk Profile:")
-    print(f"  Risk score: {risk_prof['score']:.0f}/100")
-    print(f"  Recommended allocation:")
-    for asset, weight in risk_prof['recommended_allocation'].items():
-        print(f"    {asset}: {weight:.1%}")
+        print(f"\nRisk Profile:")
+        print(f"  Risk score: {risk_prof['score']:.0f}/100")
+        print(f"  Recommended allocation:")
+        for asset, weight in risk_prof['recommended_allocation'].items():
+            print(f"    {asset}: {weight:.1%}")
 
-    print(f"\nLife Stages:")
-    for stage, info in life_stages.items():
-        print(f"  {stage.capitalize()}: Age {info['start']}-{info['end']} ({info['duration']} years)")
+        print(f"\nLife Stages:")
+        for stage, info in life_stages.items():
+            print(f"  {stage.capitalize()}: Age {info['start']}-{info['end']} ({info['duration']} years)")
 
-    print(f"\nInvestment Plan:")
-    print(f"  Total contributions: ${summary_stats['total_contributions']:,.0f}")
-    print(f"  Contribution years: {summary_stats['contribution_years']}")
-    print(f"  Average annual: ${summary_stats['average_annual_contribution']:,.0f}")
+        print(f"\nInvestment Plan:")
+        print(f"  Total contributions: ${summary_stats['total_contributions']:,.0f}")
+        print(f"  Contribution years: {summary_stats['contribution_years']}")
+        print(f"  Average annual: ${summary_stats['average_annual_contribution']:,.0f}")
 
     # ========================================================================
     # STEP 5: OPTIMIZE PORTFOLIO
     # ========================================================================
-    print_section("STEP 5: OPTIMIZING PORTFOLIO")
-
-    print(f"\nOptimizing with objective: {optimization_config['optimization_objective']}")
-
-    opt = optimizer.PortfolioOptimizer()
-
-    # Build optimization config
-    opt_config = {
-        'scenarios': after_tax_scenarios,
-        'user_constraints': validated['constraints'],
-        'investment_time_series': profile_results['investment_time_series'],
-        'optimization_objective': optimization_config['optimization_objective'],
-        'optimization_params': optimization_config['optimization_params'],
-        'goal_amount': optimization_config['goal_amount']
-    }
+    with Section("STEP 5: OPTIMIZING PORTFOLIO"):
+        from investment_calculator.modules import optimizer
+
+        print(f"\nOptimizing with objective: {optimization_config['optimization_objective']}")
+
+        opt = optimizer.PortfolioOptimizer()
+
+        # Build optimization config
+        opt_config = {
+            'scenarios': after_tax_scenarios,
+            'scenario_arrays': tax_results['after_tax_arrays'],
+            'user_constraints': validated['constraints'],
+            'investment_time_series': profile_results['investment_time_series'],
+            'optimization_objective': optimization_config['optimization_objective'],
+            'optimization_params': optimization_config['optimization_params'],
+            'goal_amount': optimization_config['goal_amount']
+        }
 
-    optimization_results = opt.optimize(opt_config)
+        optimization_results = opt.optimize(opt_config)
 
-    optimal = optimization_results['optimal_portfolio']
-    sim_stats = optimization_results['simulation_results']['statistics']
-    goal_analysis = optimization_results['goal_analysis']
+        optimal = optimization_results['optimal_portfolio']
+        sim_stats = optimization_results['simulation_results']['statistics']
+        goal_analysis = optimization_results['goal_analysis']
 
-    print(f"✓ Optimization complete")
+        print(f"✓ Optimization complete")
 
-    print(f"\nOptimal Portfolio:")
-    for asset, weight in optimal['weights'].items():
-        print(f"  {asset}: {weight:.1%}")
+        print(f"\nOptimal Portfolio:")
+        for asset, weight in optimal['weights'].items():
+            print(f"  {asset}: {weight:.1%}")
 
-    print(f"\nExpected Performance:")
-    print(f"  Expected return: {optimal['expected_return']:.2%}")
-    print(f"  Expected volatility: {optimal['expected_volatility']:.2%}")
-    print(f"  Sharpe ratio: {optimal['sharpe_ratio']:.2f}")
-    print(f"  Max drawdown: {optimal['max_drawdown']:.1%}")
+        print(f"\nExpected Performance:")
+        print(f"  Expected return: {optimal['expected_return']:.2%}")
+        print(f"  Expected volatility: {optimal['expected_volatility']:.2%}")
+        print(f"  Sharpe ratio: {optimal['sharpe_ratio']:.2f}")
+        print(f"  Max drawdown: {optimal['max_drawdown']:.1%}")
 
-    print(f"\nMonte Carlo Simulation ({scenario_config['num_scenarios']} scenarios):")
-    print(f"  Median terminal wealth: ${sim_stats['median_terminal_wealth']:,.0f}")
-    print(f"  Mean terminal wealth: ${sim_stats['mean_terminal_wealth']:,.0f}")
-    print(f"  5th percentile: ${sim_stats['percentiles']['5']:,.0f}")
-    print(f"  95th percentile: ${sim_stats['percentiles']['95']:,.0f}")
+        print(f"\nMonte Carlo Simulation ({scenario_config['num_scenarios']} scenarios):")
+        print(f"  Median terminal wealth: ${sim_stats['median_terminal_wealth']:,.0f}")
+        print(f"  Mean terminal wealth: ${sim_stats['mean_terminal_wealth']:,.0f}")
+        print(f"  5th percentile: ${sim_stats['percentiles']['5']:,.0f}")
+        print(f"  95th percentile: ${sim_stats['percentiles']['95']:,.0f}")
 
-    print(f"\nGoal Analysis:")
-    print(f"  Target: ${goal_analysis['goal_amount']:,.0f}")
-    print(f"  Probability of achieving: {goal_analysis['probability_of_achieving']:.1%}")
+        print(f"\nGoal Analysis:")
+        print(f"  Target: ${goal_analysis['goal_amount']:,.0f}")
+        print(f"  Probability of achieving: {goal_analysis['probability_of_achieving']:.1%}")
 
     # ========================================================================
     # STEP 6: GENERATE REPORT
     # ========================================================================
-    print_section("STEP 6: GENERATING COMPREHENSIVE REPORT")
-
-    print(f"\nGenerating visualizations and report...")
-
-    reporter = reporting.ReportGenerator()
-
-    report_results = reporter.generate({
-        'scenarios': scenario_results,
-        'tax_results': tax_results,
-        'user_profile': profile_results,
-        'optimization_results': optimization_results,
-        'report_config': {
-            'report_type': 'detailed',
-            'language': 'en',
-            'format': 'html',
-            'charts': [
-                'wealth_trajectories',
-                'efficient_frontier',
-                'allocation_pie',
-                'monte_carlo_histogram',
-                'tax_impact_waterfall'
-            ]
-        },
-        'visualization_preferences': {
-            'color_scheme': 'default',
-            'save_figures': True,
-            'figure_dpi': 150
-        }
-    })
-
-    print(f"✓ Report generated")
-    print(f"\nGenerated charts:")
-    for chart_name in report_results['figures'].keys():
-        print(f"  ✓ {chart_name}")
-
-    print(f"\nGenerated tables:")
-    for table_name in report_results['tables'].keys():
-        print(f"  ✓ {table_name}")
+    with Section("STEP 6: GENERATING COMPREHENSIVE REPORT"):
+        from investment_calculator.modules import reporting
+
+        print(f"\nGenerating visualizations and report...")
+
+        reporter = reporting.ReportGenerator()
+
+        report_results = reporter.generate({
+            'scenarios': scenario_results,
+            'tax_results': tax_results,
+            'user_profile': profile_results,
+            'optimization_results': optimization_results,
+            'report_config': {
+                'report_type': 'detailed',
+                'language': 'en',
+                'format': 'html',
+                'charts': [
+                    'wealth_trajectories',
+                    'efficient_frontier',
+                    'allocation_pie',
+                    'monte_carlo_histogram',
+                    'tax_impact_waterfall'
+                ]
+            },
+            'visualization_preferences': {
+                'color_scheme': 'default',
+                'save_figures': True,
+                'figure_dpi': 150
+            }
+        })
+
+        print(f"✓ Report generated")
+        print(f"\nGenerated charts:")
+        for chart_name in report_results['figures'].keys():
+            print(f"  ✓ {chart_name}")
+
+        print(f"\nGenerated tables:")
+        for table_name in report_results['tables'].keys():
+            print(f"  ✓ {table_name}")
 
     # ========================================================================
     # STEP 7: SAVE RESULTS
     # ========================================================================
-    print_section("STEP 7: SAVING RESULTS")
-
-    print(f"\nSaving all results to 'outputs/' directory...")
-
-    # Combine results for saving
-    all_results = {
-        'report': report_results['report'],
-        'figures': report_results['figures'],
-        'optimal_portfolio': optimal,
-        'simulation_statistics': sim_stats,
-        'goal_analysis': goal_analysis
-    }
+    with Section("STEP 7: SAVING RESULTS"):
+        print(f"\nSaving all results to 'outputs/' directory...")
+
+        # Combine results for saving
+        all_results = {
+            'report': report_results['report'],
+            'figures': report_results['figures'],
+            'optimal_portfolio': optimal,
+            'simulation_statistics': sim_stats,
+            'goal_analysis': goal_analysis
+        }
 
-    save_results(all_results)
+        save_results(all_results)
 
     # ========================================================================
     # SUMMARY
     # ========================================================================
-    print_section("EXECUTIVE SUMMARY")
-
-    exec_summary = report_results['executive_summary']
+    with Section("EXECUTIVE SUMMARY"):
+        exec_summary = report_results['executive_summary']
 
-    print(f"\n{exec_summary['one_page_summary']}")
+        print(f"\n{exec_summary['one_page_summary']}")
 
-    print(f"\nKey Findings:")
-    for i, finding in enumerate(exec_summary['key_findings'], 1):
-        print(f"  {i}. {finding}")
+        print(f"\nKey Findings:")
+        for i, finding in enumerate(exec_summary['key_findings'], 1):
+            print(f"  {i}. {finding}")
 
-    print(f"\nRecommendations:")
-    for i, rec in enumerate(exec_summary['recommendations'], 1):
-        print(f"  {i}. {rec}")
+        print(f"\nRecommendations:")
+        for i, rec in enumerate(exec_summary['recommendations'], 1):
+            print(f"  {i}. {rec}")
 
-    print(f"\nRisks & Warnings:")
-    for i, risk in enumerate(exec_summary['risks_and_warnings'], 1):
-        print(f"  {i}. {risk}")
+        print(f"\nRisks & Warnings:")
+        for i, risk in enumerate(exec_summary['risks_and_warnings'], 1):
+            print(f"  {i}. {risk}")
 
     # ========================================================================
     # COMPLETION
     # ========================================================================
-    end_time = datetime.now()
-    duration = (end_time - start_time).total_seconds()
-
-    print_section("PIPELINE COMPLETE!")
-
-    print(f"\n✓ All 5 modules executed successfully")
-    print(f"✓ All results saved to 'outputs/' directory")
-    print(f"\nTotal runtime: {duration:.1f} seconds")
-    print(f"\nNext steps:")
-    print(f"  1. Open outputs/investment_report.html in your browser")
-    print(f"  2. Review the charts in outputs/ directory")
-    print(f"  3. Check outputs/optimal_portfolio.json for raw data")
-    print(f"\nTo customize:")
-    print(f"  - Edit files in examples/input_files/")
-    print(f"  - Run this script again")
-
-    print("\n" + "=" * 70)
+    duration = (time.perf_counter_ns() - start_ns) / 1e9
+
+    with Section("PIPELINE COMPLETE!"):
+        print(f"\n✓ All 5 modules executed successfully")
+        print(f"✓ All results saved to 'outputs/' directory")
+        print(f"\nTotal runtime: {duration:.1f} seconds")
+        print(f"\nNext steps:")
+        print(f"  1. Open outputs/investment_report.html in your browser")
+        print(f"  2. Review the charts in outputs/ directory")
+        print(f"  3. Check outputs/optimal_portfolio.json for raw data")
+        print(f"\nTo customize:")
+        print(f"  - Edit files in examples/input_files/")
+        print(f"  - Run this script again")
+
+        print("\n" + "=" * 70)
 
     return all_results
 
@@ -67,8 +67,8 @@ def main():
 
     scenarios_df = scenario_results['scenarios']
     print(f"✓ Generated {len(scenarios_df)} scenario data points")
-    print(f"  Scenarios: {scenarios_df['scenario_id'].nunique()}")
-    print(f"  Time periods: {scenarios_df['time_period'].nunique()}")
+    print(f"  Scenarios: {scenario_results['num_scenarios']}")
+    print(f"  Time periods: {scenario_results['num_periods']}")
     print(f"\nDiagnostics:")
     print(f"  Mean stock return: {scenario_results['diagnostics']['mean_returns']['stock_return']:.2%}")
     print(f"  Mean bond return: {scenario_results['diagnostics']['mean_returns']['bond_return']:.2%}")
@@ -115,6 +115,7 @@ def main():
 
     tax_results = engine.apply_taxes({
         'scenarios': scenarios_df,
+        'scenario_arrays': scenario_results['arrays'],
         'tax_config': tax_config,
         'investment_allocation': allocation
     })
@@ -228,6 +229,7 @@ def main():
 
     optimization_config = {
         'scenarios': after_tax_scenarios,
+        'scenario_arrays': tax_results['after_tax_arrays'],
         'user_constraints': profile_results['validated_profile']['constraints'],
         'investment_time_series': profile_results['investment_time_series'],
         'optimization_objective': 'max_sharpe',
@@ -321,13 +323,20 @@ def main():
 
     report = reporter.generate(report_config)
 
+    # Figures are only rendered when save_figures or interactive is set;
+    # otherwise each entry carries just its chart data
+    rendered = [name for name, fig_data in report['figures'].items()
+                if fig_data.get('figure') is not None]
+
     print(f"\n✓ Report generated")
-    print(f"  Figures created: {len(report['figures'])}")
+    print(f"  Figures rendered: {len(rendered)}")
+    print(f"  Chart data prepared: {len(report['figures'])}")
     print(f"  Tables created: {len(report['tables'])}")
 
-    print(f"\nGenerated figures:")
+    print(f"\nChart data:")
     for figure_name in report['figures'].keys():
-        print(f"  - {figure_name}")
+        status = "rendered" if figure_name in rendered else "data only"
+        print(f"  - {figure_name} ({status})")
 
     print(f"\nGenerated tables:")
     for table_name in report['tables'].keys():
@@ -138,28 +138,32 @@ def main():
     print("-" * 50)
 
     # High contribution years (> $8,000/year)
-    high_contrib = slicer.slice_by_value('contribution', min_value=8000)
+    high_contrib = slicer.slice_by_value_stats('contribution', min_value=8000, period_column='period')
     print(f"\nHigh contribution years (>$8,000/year):")
-    print(f"  Number of years: {len(high_contrib)}")
-    print(f"  Total contributions: ${high_contrib['contribution'].sum():,.0f}")
-    print(f"  Years: {high_contrib['period'].min():.0f} - {high_contrib['period'].max():.0f}")
+    print(f"  Number of years: {high_contrib.count}")
+    print(f"  Total contributions: ${high_contrib.total:,.0f}")
+    print(f"  Years: {high_contrib.period_min:.0f} - {high_contrib.period_max:.0f}")
 
     # Low contribution years (< $7,000/year)
-    low_contrib = slicer.slice_by_value('contribution', max_value=7000)
+    low_contrib = slicer.slice_by_value_stats('contribution', max_value=7000, period_column='period')
     print(f"\nLow contribution years (<$7,000/year):")
-    print(f"  Number of years: {len(low_contrib)}")
-    print(f"  Total contributions: ${low_contrib['contribution'].sum():,.0f}")
+    print(f"  Number of years: {low_contrib.count}")
+    print(f"  Total contributions: ${low_contrib.total:,.0f}")
 
     # 3. Rolling windows
     print("\n3. ROLLING WINDOWS (5-year windows):")
     print("-" * 50)
 
+    # One (num_windows, 5) array per column; averages come from a single reduction
+    contribution_windows = slicer.window_values(5, 'contribution')
+    period_windows = slicer.window_values(5, 'period')
+    avg_contributions = contribution_windows.mean(axis=1)
+
     window_results = []
-    for i, window in enumerate(slicer.slice_by_window(window_size=5, overlap=False)):
-        avg_contribution = window['contribution'].mean()
+    for i, (periods, avg_contribution) in enumerate(zip(period_windows, avg_contributions)):
         window_results.append({
             'window': i + 1,
-            'years': f"{window['period'].iloc[0]:.0f}-{window['period'].iloc[-1]:.0f}",
+            'years': f"{periods[0]:.0f}-{periods[-1]:.0f}",
             'avg_contribution': avg_contribution
         })
 
@@ -10,18 +10,50 @@ This package helps investors make informed decisions by calculating optimal inve
 strategies based on personal variables, economic scenarios, and tax implications.
 """
 
-from .gse import GlobalScenarioEngine, EconomicScenario, ScenarioType
-from .gse_plus import TaxIntegratedScenarioEngine, TaxConfig, AccountType, TaxTreatment
-from .moca import MOCA, PortfolioOptimizer, InvestmentResult, PortfolioStatistics, OptimizationMethod
-from .personal_variables import PersonalVariables, InvestmentProfile, RiskTolerance, InvestmentGoal
-from .utils import validate_inputs, calculate_returns, validate_allocation
+import importlib
 
 __version__ = "1.0.0"
 
+# Public names and the submodule defining each. Submodules are imported on
+# first access (PEP 562), so e.g. validate_allocation does not load the
+# optimization engines.
+_LAZY_EXPORTS = {
+    # GSE exports
+    "GlobalScenarioEngine": "gse",
+    "EconomicScenario": "gse",
+    "ScenarioBatch": "gse",
+    "ScenarioType": "gse",
+
+    # GSE+ exports
+    "TaxIntegratedScenarioEngine": "gse_plus",
+    "TaxConfig": "gse_plus",
+    "AccountType": "gse_plus",
+    "TaxTreatment": "gse_plus",
+
+    # MOCA exports
+    "MOCA": "moca",
+    "PortfolioOptimizer": "moca",
+    "InvestmentResult": "moca",
+    "PortfolioStatistics": "moca",
+    "OptimizationMethod": "moca",
+
+    # Personal variables exports
+    "PersonalVariables": "personal_variables",
+    "InvestmentProfile": "personal_variables",
+    "RiskTolerance": "personal_variables",
+    "InvestmentGoal": "personal_variables",
+
+    # Utilities
+    "validate_inputs": "utils",
+    "calculate_returns": "utils",
+    "validate_allocation": "utils",
+}
+
 __all__ = [
     # GSE exports
     "GlobalScenarioEngine",
     "EconomicScenario",
+    "ScenarioBatch",
     "ScenarioType",
 
     # GSE+ exports
@@ -48,3 +80,16 @@ __all__ = [
     "calculate_returns",
     "validate_allocation",
 ]
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        module = importlib.import_module(f".{_LAZY_EXPORTS[name]}", __name__)
+        value = getattr(module, name)
+        globals()[name] = value  # Later lookups skip __getattr__
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -52,10 +52,7 @@ def main():
     )
     gse_plus = TaxIntegratedScenarioEngine(tax_config=tax_config)
 
-    tax_scenarios = [
-        gse_plus.generate_tax_integrated_scenario(scenario, AccountType.TAXABLE)
-        for scenario in scenarios
-    ]
+    tax_scenarios = gse_plus.generate_tax_integrated_scenarios(scenarios, AccountType.TAXABLE)
 
     # 4. Run investment analysis
     moca = MOCA(investment_profile=profile)
@@ -11,13 +11,25 @@ Generates economic scenarios for investment analysis including:
 Supports both historical scenarios and Monte Carlo simulation.
 """
 
+import sys
+
 import numpy as np
 import pandas as pd
-from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import List, Dict, Optional, Tuple, Union
 from enum import Enum
 
 
+# dataclass(slots=True) needs Python 3.10; older interpreters keep __dict__
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+_BIT_GENERATORS = {
+    "pcg64": np.random.PCG64,
+    "sfc64": np.random.SFC64,
+}
+
+
 class ScenarioType(Enum):
     """Types of economic scenarios"""
     HISTORICAL = "historical"
@@ -28,7 +40,81 @@ class ScenarioType(Enum):
     CUSTOM = "custom"
 
 
-@dataclass
+# Enum .value goes through a descriptor; table lookups are cheaper per scenario
+_SCENARIO_TYPE_VALUES = {scenario_type: scenario_type.value for scenario_type in ScenarioType}
+
+# DataFrame column name of each scenario array
+_DATAFRAME_COLUMNS = {
+    "inflation_rate": "inflation_rates",
+    "interest_rate": "interest_rates",
+    "stock_return": "stock_returns",
+    "bond_return": "bond_returns",
+    "real_estate_return": "real_estate_returns",
+    "gdp_growth": "gdp_growth",
+}
+
+# default_params (mean, std) keys of each indicator, in scenario order
+_INDICATOR_PARAM_KEYS = (
+    ("inflation_mean", "inflation_std"),
+    ("interest_mean", "interest_std"),
+    ("stock_return_mean", "stock_return_std"),
+    ("bond_return_mean", "bond_return_std"),
+    ("real_estate_mean", "real_estate_std"),
+    ("gdp_growth_mean", "gdp_growth_std"),
+)
+
+# Fraction of the default volatility used by the baseline scenario
+_BASELINE_STD_SCALES = (0.3, 0.3, 0.5, 0.5, 0.5, 0.3)
+
+# (mean, std) of each indicator in the optimistic and pessimistic scenarios
+_OPTIMISTIC_PARAMS = np.array([
+    [0.02, 0.01],
+    [0.035, 0.015],
+    [0.12, 0.15],
+    [0.06, 0.05],
+    [0.10, 0.10],
+    [0.035, 0.015],
+])
+_PESSIMISTIC_PARAMS = np.array([
+    [0.03, 0.025],
+    [0.025, 0.025],
+    [0.06, 0.25],
+    [0.03, 0.10],
+    [0.04, 0.18],
+    [0.015, 0.03],
+])
+
+# Monte Carlo indicators as linear combinations of (base, inflation, market)
+# shocks. Stocks and GDP are positively correlated, bonds and stocks are
+# negatively correlated, inflation and interest rates are positively correlated.
+_MC_SHOCK_WEIGHTS = np.array([
+    [0.7, 0.3, 0.0],
+    [0.5, 0.5, 0.0],
+    [0.2, 0.0, 0.8],
+    [0.7, 0.0, -0.3],
+    [0.5, 0.0, 0.5],
+    [0.4, 0.0, 0.6],
+])
+
+# Position of each default_params key in the (indicator, [mean, std]) array
+_MC_PARAM_INDEX = {
+    key: (i, j)
+    for i, keys in enumerate(_INDICATOR_PARAM_KEYS)
+    for j, key in enumerate(keys)
+}
+
+
+_INDICATOR_ATTRIBUTES = {
+    "inflation": "inflation_rates",
+    "interest_rates": "interest_rates",
+    "stock_returns": "stock_returns",
+    "bond_returns": "bond_returns",
+    "real_estate_returns": "real_estate_returns",
+    "gdp_growth": "gdp_growth",
+}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class EconomicScenario:
     """
     Represents a single economic scenario with various economic indicators.
@@ -44,7 +130,8 @@ class EconomicScenario:
         real_estate_returns (np.ndarray): Real estate returns
         gdp_growth (np.ndarray): GDP growth rates
         probability (float): Probability of this scenario occurring
-        metadata (Dict): Additional scenario metadata
+        metadata (Optional[Dict]): Additional scenario metadata; None when the
+            scenario has none
     """
 
     scenario_id: str
@@ -57,7 +144,7 @@ class EconomicScenario:
     real_estate_returns: np.ndarray
     gdp_growth: np.ndarray
     probability: float = 1.0
-    metadata: Dict = field(default_factory=dict)
+    metadata: Optional[Dict] = None
 
     def __post_init__(self):
         """Validate scenario data"""
@@ -74,23 +161,55 @@ class EconomicScenario:
         if not all(len(arr) == self.years for arr in arrays):
             raise ValueError("All economic indicator arrays must have length equal to years")
 
+    @classmethod
+    def _from_validated(cls, **fields) -> "EconomicScenario":
+        """
+        Create a scenario from arrays already known to have length ``years``.
+
+        Used by the engine's own generators, which build every array with
+        that length, to skip the per-array checks of __post_init__. All
+        fields must be given.
+
+        Returns:
+            EconomicScenario: Scenario holding the given fields
+        """
+        scenario = cls.__new__(cls)
+        for name, value in fields.items():
+            setattr(scenario, name, value)
+        return scenario
+
+    def get_metadata(self, key: str, default=None):
+        """
+        Look up a metadata entry, treating missing metadata as empty.
+
+        Args:
+            key (str): Metadata key
+            default: Value returned when the key is absent
+
+        Returns:
+            The metadata value, or ``default``
+        """
+        if self.metadata is None:
+            return default
+        return self.metadata.get(key, default)
+
     def to_dataframe(self) -> pd.DataFrame:
         """
         Convert scenario to a pandas DataFrame.
 
+        The columns share memory with the scenario arrays rather than copying
+        them; copy the frame before modifying its values in place.
+
         Returns:
             pd.DataFrame: Scenario data with years as index
         """
         return pd.DataFrame(
             {
-                "inflation_rate": self.inflation_rates,
-                "interest_rate": self.interest_rates,
-                "stock_return": self.stock_returns,
-                "bond_return": self.bond_returns,
-                "real_estate_return": self.real_estate_returns,
-                "gdp_growth": self.gdp_growth,
+                column: getattr(self, attribute)
+                for column, attribute in _DATAFRAME_COLUMNS.items()
             },
-            index=pd.Index(range(1, self.years + 1), name="year"),
+            index=pd.RangeIndex(1, self.years + 1, name="year"),
+            copy=False,
         )
 
     def get_summary_statistics(self) -> Dict[str, Dict[str, float]]:
@@ -100,28 +219,204 @@ class EconomicScenario:
         Returns:
             Dict[str, Dict[str, float]]: Statistics for each indicator
         """
-        indicators = {
-            "inflation": self.inflation_rates,
-            "interest_rates": self.interest_rates,
-            "stock_returns": self.stock_returns,
-            "bond_returns": self.bond_returns,
-            "real_estate_returns": self.real_estate_returns,
-            "gdp_growth": self.gdp_growth,
-        }
+        # One (6, years) array so each statistic is a single reduction
+        values = np.stack([getattr(self, attribute) for attribute in _INDICATOR_ATTRIBUTES.values()])
+        means = values.mean(axis=1)
+        stds = values.std(axis=1)
+        mins = values.min(axis=1)
+        maxs = values.max(axis=1)
+        medians = _median(values)
 
         stats = {}
-        for name, values in indicators.items():
+        for i, name in enumerate(_INDICATOR_ATTRIBUTES):
             stats[name] = {
-                "mean": float(np.mean(values)),
-                "std": float(np.std(values)),
-                "min": float(np.min(values)),
-                "max": float(np.max(values)),
-                "median": float(np.median(values)),
+                "mean": float(means[i]),
+                "std": float(stds[i]),
+                "min": float(mins[i]),
+                "max": float(maxs[i]),
+                "median": float(medians[i]),
             }
 
         return stats
 
 
+@dataclass
+class ScenarioBatch:
+    """
+    Many scenarios of one type and length stored as stacked arrays.
+
+    Each indicator is a single (n_scenarios, years) array instead of one small
+    array per scenario, so statistics over all scenarios are one reduction
+    along axis 1. Indexing returns an EconomicScenario whose arrays are row
+    views into the batch.
+
+    Attributes:
+        scenario_ids (List[str]): Identifier of each scenario
+        scenario_type (ScenarioType): Type shared by all scenarios
+        years (int): Number of years in each scenario
+        inflation_rates (np.ndarray): Annual inflation rates, shape (n_scenarios, years)
+        interest_rates (np.ndarray): Risk-free interest rates, shape (n_scenarios, years)
+        stock_returns (np.ndarray): Stock market returns, shape (n_scenarios, years)
+        bond_returns (np.ndarray): Bond market returns, shape (n_scenarios, years)
+        real_estate_returns (np.ndarray): Real estate returns, shape (n_scenarios, years)
+        gdp_growth (np.ndarray): GDP growth rates, shape (n_scenarios, years)
+        probabilities (Optional[np.ndarray]): Probability of each scenario, shape
+            (n_scenarios,); None when all scenarios are equally likely
+        uniform_probability (Optional[float]): Probability of every scenario when
+            probabilities is None (default: 1 / n_scenarios)
+        metadata (Optional[List[Dict]]): Additional metadata of each scenario; when
+            None, scenario i is given {"simulation_index": i + 1} on access
+    """
+
+    scenario_ids: List[str]
+    scenario_type: ScenarioType
+    years: int
+    inflation_rates: np.ndarray
+    interest_rates: np.ndarray
+    stock_returns: np.ndarray
+    bond_returns: np.ndarray
+    real_estate_returns: np.ndarray
+    gdp_growth: np.ndarray
+    probabilities: Optional[np.ndarray] = None
+    uniform_probability: Optional[float] = None
+    metadata: Optional[List[Dict]] = None
+
+    def __post_init__(self):
+        """Validate batch shapes"""
+        shape = (len(self.scenario_ids), self.years)
+        for attribute in _INDICATOR_ATTRIBUTES.values():
+            if np.shape(getattr(self, attribute)) != shape:
+                raise ValueError("All economic indicator arrays must have shape (n_scenarios, years)")
+        if self.probabilities is not None:
+            if len(self.probabilities) != len(self.scenario_ids):
+                raise ValueError("probabilities must have one entry per scenario")
+        elif self.uniform_probability is None and self.scenario_ids:
+            self.uniform_probability = 1.0 / len(self.scenario_ids)
+        if self.metadata is not None and len(self.metadata) != len(self.scenario_ids):
+            raise ValueError("metadata must have one entry per scenario")
+
+    def __len__(self) -> int:
+        return len(self.scenario_ids)
+
+    def __getitem__(self, index: int) -> EconomicScenario:
+        """Return scenario ``index`` backed by row views of the batch arrays"""
+        index = range(len(self))[index]
+        if not isinstance(index, int):
+            raise TypeError("ScenarioBatch indices must be integers")
+        return EconomicScenario._from_validated(
+            scenario_id=self.scenario_ids[index],
+            scenario_type=self.scenario_type,
+            years=self.years,
+            inflation_rates=self.inflation_rates[index],
+            interest_rates=self.interest_rates[index],
+            stock_returns=self.stock_returns[index],
+            bond_returns=self.bond_returns[index],
+            real_estate_returns=self.real_estate_returns[index],
+            gdp_growth=self.gdp_growth[index],
+            probability=(
+                float(self.probabilities[index]) if self.probabilities is not None
+                else self.uniform_probability
+            ),
+            metadata=(
+                self.metadata[index] if self.metadata is not None
+                else {"simulation_index": index + 1}
+            ),
+        )
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """
+        Convert the batch to a long pandas DataFrame.
+
+        Each column is a flattened view of a batch array, so no indicator data
+        is copied; copy the frame before modifying its values in place.
+
+        Returns:
+            pd.DataFrame: Scenario data indexed by (scenario_id, year)
+        """
+        index = pd.MultiIndex.from_product(
+            [self.scenario_ids, range(1, self.years + 1)],
+            names=["scenario_id", "year"],
+        )
+        return pd.DataFrame(
+            {
+                column: getattr(self, attribute).reshape(-1)
+                for column, attribute in _DATAFRAME_COLUMNS.items()
+            },
+            index=index,
+            copy=False,
+        )
+
+    def scenario_probabilities(self) -> np.ndarray:
+        """
+        Probability of each scenario, expanding the uniform probability if needed.
+
+        Returns:
+            np.ndarray: Probabilities, shape (n_scenarios,)
+        """
+        if self.probabilities is not None:
+            return self.probabilities
+        return np.full(len(self), self.uniform_probability)
+
+    def get_summary_statistics(self) -> Dict[str, Dict[str, np.ndarray]]:
+        """
+        Calculate summary statistics for every scenario in the batch.
+
+        Returns:
+            Dict[str, Dict[str, np.ndarray]]: Statistics for each indicator,
+            each an array with one value per scenario
+        """
+        return _row_statistics(
+            {name: getattr(self, attribute) for name, attribute in _INDICATOR_ATTRIBUTES.items()}
+        )
+
+
+_STATISTIC_NAMES = ("mean", "std", "min", "max", "median")
+
+
+def _median(values: np.ndarray) -> np.ndarray:
+    """
+    Median along the last axis, selecting only the middle element(s).
+
+    Gives the same result as np.median(values, axis=-1) without its generic
+    reduction overhead, which dominates for rows of a few dozen years.
+    """
+    if not np.issubdtype(values.dtype, np.inexact):
+        values = values.astype(float)
+
+    n = values.shape[-1]
+    middle = n // 2
+    if n % 2:
+        median = np.partition(values, middle, axis=-1)[..., middle]
+    else:
+        partitioned = np.partition(values, [middle - 1, middle], axis=-1)
+        median = (partitioned[..., middle - 1] + partitioned[..., middle]) / 2
+
+    # Like np.median, any NaN in a row makes its median NaN
+    has_nan = np.isnan(values).any(axis=-1)
+    if has_nan.any():
+        median = np.where(has_nan, np.nan, median)
+    return median
+
+
+def _row_statistics(indicators: Dict[str, np.ndarray]) -> Dict[str, Dict[str, np.ndarray]]:
+    """Mean, std, min, max and median of every row of each (n_scenarios, years) indicator"""
+    stats = {}
+    for name, values in indicators.items():
+        stats[name] = {
+            "mean": np.mean(values, axis=1),
+            "std": np.std(values, axis=1),
+            "min": np.min(values, axis=1),
+            "max": np.max(values, axis=1),
+            "median": _median(values),
+        }
+
+    return stats
+
+
 class GlobalScenarioEngine:
     """
     Global Scenario Engine (GSE) for generating economic scenarios.
@@ -130,16 +425,28 @@ class GlobalScenarioEngine:
     investment analysis and portfolio optimization.
     """
 
-    def __init__(self, random_seed: Optional[int] = None):
+    def __init__(self, random_seed: Optional[int] = None, bit_generator: str = "pcg64"):
         """
         Initialize the Global Scenario Engine.
 
         Args:
             random_seed (Optional[int]): Random seed for reproducibility
+            bit_generator (str): Bit generator for the engine's random stream,
+                "pcg64" (default) or "sfc64" (faster for very large batches)
         """
+        if bit_generator not in _BIT_GENERATORS:
+            raise ValueError(
+                f"Unknown bit_generator '{bit_generator}'. "
+                f"Use one of: {', '.join(_BIT_GENERATORS)}"
+            )
+
         self.random_seed = random_seed
-        if random_seed is not None:
-            np.random.seed(random_seed)
+        self.bit_generator = bit_generator
+        # Each engine owns its stream; the global NumPy state is left alone.
+        # The seed sequence also provides independent worker streams.
+        self._seed_sequence = np.random.SeedSequence(random_seed)
+        self.rng = np.random.Generator(_BIT_GENERATORS[bit_generator](self._seed_sequence))
+        self._cuda_rng = None
 
         # Historical average values (US-based, can be configured)
         self.default_params = {
@@ -157,6 +464,29 @@ class GlobalScenarioEngine:
             "gdp_growth_std": 0.02,
         }
 
+    def _draw_indicators(self, params: np.ndarray, years: int) -> np.ndarray:
+        """
+        Draw independent normal paths for the six indicators in one call.
+
+        Args:
+            params (np.ndarray): (mean, std) of each indicator, shape (6, 2)
+            years (int): Number of years to simulate
+
+        Returns:
+            np.ndarray: Indicator paths, shape (6, years)
+        """
+        paths = self.rng.standard_normal((len(params), years))
+        paths *= params[:, 1, None]
+        paths += params[:, 0, None]
+        return paths
+
+    def _baseline_params(self) -> np.ndarray:
+        """(mean, std) of each indicator in the baseline scenario, shape (6, 2)"""
+        return np.array([
+            [self.default_params[mean_key], self.default_params[std_key] * scale]
+            for (mean_key, std_key), scale in zip(_INDICATOR_PARAM_KEYS, _BASELINE_STD_SCALES)
+        ])
+
     def generate_baseline_scenario(self, years: int) -> EconomicScenario:
         """
         Generate a baseline (expected) economic scenario using mean values.
@@ -170,38 +500,9 @@ class GlobalScenarioEngine:
         scenario_id = "baseline"
 
         # Use mean values with small random variations
-        inflation = np.random.normal(
-            self.default_params["inflation_mean"],
-            self.default_params["inflation_std"] * 0.3,
-            years,
-        )
-        interest = np.random.normal(
-            self.default_params["interest_mean"],
-            self.default_params["interest_std"] * 0.3,
-            years,
-        )
-        stocks = np.random.normal(
-            self.default_params["stock_return_mean"],
-            self.default_params["stock_return_std"] * 0.5,
-            years,
-        )
-        bonds = np.random.normal(
-            self.default_params["bond_return_mean"],
-            self.default_params["bond_return_std"] * 0.5,
-            years,
-        )
-        real_estate = np.random.normal(
-            self.default_params["real_estate_mean"],
-            self.default_params["real_estate_std"] * 0.5,
-            years,
-        )
-        gdp = np.random.normal(
-            self.default_params["gdp_growth_mean"],
-            self.default_params["gdp_growth_std"] * 0.3,
-            years,
-        )
+        inflation, interest, stocks, bonds, real_estate, gdp = self._draw_indicators(self._baseline_params(), years)
 
-        return EconomicScenario(
+        return EconomicScenario._from_validated(
             scenario_id=scenario_id,
             scenario_type=ScenarioType.BASELINE,
             years=years,
@@ -228,14 +529,9 @@ class GlobalScenarioEngine:
         scenario_id = "optimistic"
 
         # Use higher means, lower volatility
-        inflation = np.random.normal(0.02, 0.01, years)
-        interest = np.random.normal(0.035, 0.015, years)
-        stocks = np.random.normal(0.12, 0.15, years)
-        bonds = np.random.normal(0.06, 0.05, years)
-        real_estate = np.random.normal(0.10, 0.10, years)
-        gdp = np.random.normal(0.035, 0.015, years)
+        inflation, interest, stocks, bonds, real_estate, gdp = self._draw_indicators(_OPTIMISTIC_PARAMS, years)
 
-        return EconomicScenario(
+        return EconomicScenario._from_validated(
             scenario_id=scenario_id,
             scenario_type=ScenarioType.OPTIMISTIC,
             years=years,
@@ -262,14 +558,9 @@ class GlobalScenarioEngine:
         scenario_id = "pessimistic"
 
         # Use lower means, higher volatility
-        inflation = np.random.normal(0.03, 0.025, years)
-        interest = np.random.normal(0.025, 0.025, years)
-        stocks = np.random.normal(0.06, 0.25, years)
-        bonds = np.random.normal(0.03, 0.10, years)
-        real_estate = np.random.normal(0.04, 0.18, years)
-        gdp = np.random.normal(0.015, 0.03, years)
+        inflation, interest, stocks, bonds, real_estate, gdp = self._draw_indicators(_PESSIMISTIC_PARAMS, years)
 
-        return EconomicScenario(
+        return EconomicScenario._from_validated(
             scenario_id=scenario_id,
             scenario_type=ScenarioType.PESSIMISTIC,
             years=years,
@@ -283,11 +574,58 @@ class GlobalScenarioEngine:
             metadata={"description": "Pessimistic scenario with below-average growth and high volatility"},
         )
 
+    def _parallel_standard_normal(self, shape: Tuple[int, ...], dtype: type, n_workers: int) -> np.ndarray:
+        """
+        Draw standard normals on several threads, split along the first axis.
+
+        NumPy releases the GIL while filling arrays, so the chunks are drawn
+        concurrently. With PCG64 each chunk comes from a jump-ahead copy of the
+        engine's bit generator; the streams are 2^127 steps apart and cannot
+        overlap. The engine then jumps past them, so later calls use fresh
+        streams. SFC64 has no jump-ahead and uses children of the engine's seed
+        sequence instead.
+        """
+        out = np.empty(shape, dtype=dtype)
+        bounds = np.linspace(0, shape[0], n_workers + 1).astype(int)
+
+        parent = self.rng.bit_generator
+        if hasattr(parent, "jumped"):
+            streams = [np.random.Generator(parent.jumped(k)) for k in range(1, n_workers + 1)]
+            parent.state = parent.jumped(n_workers + 1).state
+        else:
+            bit_generator = _BIT_GENERATORS[self.bit_generator]
+            streams = [np.random.Generator(bit_generator(child)) for child in self._seed_sequence.spawn(n_workers)]
+
+        def fill(worker: int) -> None:
+            streams[worker].standard_normal(out=out[bounds[worker]:bounds[worker + 1]], dtype=dtype)
+
+        with ThreadPoolExecutor(max_workers=n_workers) as executor:
+            list(executor.map(fill, range(n_workers)))
+
+        return out
+
+    def _cuda_backend(self):
+        """
+        CuPy module and the engine's GPU generator, created on first use.
+
+        The GPU generator is seeded from the engine's own stream, so seeded
+        engines stay reproducible on the GPU as well.
+        """
+        try:
+            import cupy
+        except ImportError as exc:
+            raise ImportError("device='cuda' requires CuPy to be installed") from exc
+
+        if self._cuda_rng is None:
+            self._cuda_rng = cupy.random.default_rng(int(self.rng.integers(2**63)))
+        return cupy, self._cuda_rng
+
     def generate_monte_carlo_scenarios(
         self,
         years: int,
         n_scenarios: int = 1000,
         custom_params: Optional[Dict[str, float]] = None,
+        dtype: type = np.float64,
     ) -> List[EconomicScenario]:
         """
         Generate multiple scenarios using Monte Carlo simulation.
@@ -296,76 +634,130 @@ class GlobalScenarioEngine:
             years (int): Number of years to simulate
             n_scenarios (int): Number of scenarios to generate
             custom_params (Optional[Dict]): Custom parameters to override defaults
+            dtype (type): Floating point type of the generated arrays
+                (np.float64 or np.float32)
 
         Returns:
             List[EconomicScenario]: List of Monte Carlo scenarios
         """
-        params = self.default_params.copy()
-        if custom_params:
-            params.update(custom_params)
-
-        scenarios = []
-        probability = 1.0 / n_scenarios
-
-        for i in range(n_scenarios):
-            scenario_id = f"mc_{i+1:04d}"
+        return list(self.generate_monte_carlo_batch(years, n_scenarios, custom_params, dtype))
 
-            # Generate correlated returns
-            # Stocks and GDP are positively correlated
-            # Bonds and stocks are negatively correlated
-            # Inflation and interest rates are positively correlated
+    def generate_monte_carlo_batch(
+        self,
+        years: int,
+        n_scenarios: int = 1000,
+        custom_params: Optional[Dict[str, float]] = None,
+        dtype: type = np.float64,
+        device: str = "cpu",
+        n_workers: int = 1,
+    ) -> ScenarioBatch:
+        """
+        Generate Monte Carlo scenarios as a single stacked batch.
 
-            base_shock = np.random.randn(years)
-            inflation_shock = np.random.randn(years)
-            market_shock = np.random.randn(years)
+        Passing dtype=np.float32 halves the memory of large batches; shocks
+        are then drawn in single precision and every indicator stays float32.
+        With device="cuda" the shocks are drawn and correlated on the GPU with
+        CuPy and the finished indicator block is copied back to host memory.
 
-            inflation = (
-                params["inflation_mean"]
-                + params["inflation_std"] * (0.7 * base_shock + 0.3 * inflation_shock)
-            )
-
-            interest = (
-                params["interest_mean"]
-                + params["interest_std"] * (0.5 * base_shock + 0.5 * inflation_shock)
-            )
+        Args:
+            years (int): Number of years to simulate
+            n_scenarios (int): Number of scenarios to generate
+            custom_params (Optional[Dict]): Custom parameters to override defaults
+            dtype (type): Floating point type of the generated arrays
+                (np.float64 or np.float32)
+            device (str): "cpu" (default) or "cuda" (requires CuPy)
+            n_workers (int): Threads drawing the shocks on the CPU. With more
+                than one, each thread fills a contiguous block of scenarios from
+                its own independent stream, so results depend on n_workers but
+                not on thread scheduling
 
-            stocks = (
-                params["stock_return_mean"]
-                + params["stock_return_std"] * (0.8 * market_shock + 0.2 * base_shock)
-            )
+        Returns:
+            ScenarioBatch: Monte Carlo scenarios with (n_scenarios, years) arrays
+        """
+        if device == "cpu":
+            xp, rng = np, self.rng
+        elif device == "cuda":
+            xp, rng = self._cuda_backend()
+        else:
+            raise ValueError(f"Unknown device '{device}'. Use 'cpu' or 'cuda'")
+        if n_workers < 1:
+            raise ValueError("n_workers must be at least 1")
+
+        # (mean, std) of each indicator, in the engine's precision
+        params = np.array(
+            [
+                [self.default_params[mean_key], self.default_params[std_key]]
+                for mean_key, std_key in _INDICATOR_PARAM_KEYS
+            ],
+            dtype=dtype,
+        )
+        for name, value in (custom_params or {}).items():
+            if name in _MC_PARAM_INDEX:
+                params[_MC_PARAM_INDEX[name]] = value
 
-            bonds = (
-                params["bond_return_mean"]
-                + params["bond_return_std"] * (-0.3 * market_shock + 0.7 * base_shock)
-            )
+        probability = 1.0 / n_scenarios
 
-            real_estate = (
-                params["real_estate_mean"]
-                + params["real_estate_std"] * (0.5 * market_shock + 0.5 * base_shock)
-            )
+        # One draw for all scenarios: base, inflation and market shocks
+        if xp is np and n_workers > 1:
+            shocks = self._parallel_standard_normal((n_scenarios, 3, years), dtype, n_workers)
+        else:
+            shocks = rng.standard_normal((n_scenarios, 3, years), dtype=dtype)
+
+        # Correlate the shocks with a single matrix product, (6, 3) @ (3, n * years)
+        mixed = xp.asarray(_MC_SHOCK_WEIGHTS, dtype=dtype) @ shocks.transpose(1, 0, 2).reshape(3, -1)
+        mixed = mixed.reshape(len(_INDICATOR_PARAM_KEYS), n_scenarios, years)
+
+        device_params = xp.asarray(params)
+        mixed *= device_params[:, 1, None, None]
+        mixed += device_params[:, 0, None, None]
+        if xp is not np:
+            mixed = xp.asnumpy(mixed)
+        inflation, interest, stocks, bonds, real_estate, gdp = mixed
+
+        return ScenarioBatch(
+            scenario_ids=[f"mc_{i+1:04d}" for i in range(n_scenarios)],
+            scenario_type=ScenarioType.MONTE_CARLO,
+            years=years,
+            inflation_rates=inflation,
+            interest_rates=interest,
+            stock_returns=stocks,
+            bond_returns=bonds,
+            real_estate_returns=real_estate,
+            gdp_growth=gdp,
+            uniform_probability=probability,
+        )
 
-            gdp = (
-                params["gdp_growth_mean"]
-                + params["gdp_growth_std"] * (0.6 * market_shock + 0.4 * base_shock)
-            )
+    def generate_monte_carlo_statistics(
+        self,
+        years: int,
+        n_scenarios: int = 1000,
+        custom_params: Optional[Dict[str, float]] = None,
+        dtype: type = np.float64,
+        device: str = "cpu",
+        n_workers: int = 1,
+    ) -> Tuple[ScenarioBatch, pd.DataFrame]:
+        """
+        Generate Monte Carlo scenarios and their statistics without scenario objects.
 
-            scenario = EconomicScenario(
-                scenario_id=scenario_id,
-                scenario_type=ScenarioType.MONTE_CARLO,
-                years=years,
-                inflation_rates=inflation,
-                interest_rates=interest,
-                stock_returns=stocks,
-                bond_returns=bonds,
-                real_estate_returns=real_estate,
-                gdp_growth=gdp,
-                probability=probability,
-                metadata={"simulation_index": i + 1},
-            )
+        For callers that only need summary statistics: no EconomicScenario is
+        created, and the table comes from the batch's column-wise reductions.
 
-            scenarios.append(scenario)
+        Args:
+            years (int): Number of years to simulate
+            n_scenarios (int): Number of scenarios to generate
+            custom_params (Optional[Dict]): Custom parameters to override defaults
+            dtype (type): Floating point type of the generated arrays
+            device (str): "cpu" (default) or "cuda" (requires CuPy)
+            n_workers (int): Threads drawing the shocks on the CPU
 
-        return scenarios
+        Returns:
+            Tuple[ScenarioBatch, pd.DataFrame]: The scenarios and their
+            analyze_scenarios table
+        """
+        batch = self.generate_monte_carlo_batch(
+            years, n_scenarios, custom_params, dtype=dtype, device=device, n_workers=n_workers
+        )
+        return batch, self.analyze_scenarios(batch)
 
     def generate_standard_scenarios(self, years: int) -> List[EconomicScenario]:
         """
@@ -398,6 +790,9 @@ class GlobalScenarioEngine:
         """
         Create a custom scenario with user-defined values.
 
+        Indicators left as None are drawn from the baseline distribution;
+        if all six are given, no random numbers are drawn.
+
         Args:
             scenario_id (str): Unique identifier
             years (int): Number of years
@@ -412,49 +807,111 @@ class GlobalScenarioEngine:
         Returns:
             EconomicScenario: Custom scenario
         """
-        # Use baseline values if not provided
-        baseline = self.generate_baseline_scenario(years)
+        indicators = [inflation, interest, stocks, bonds, real_estate, gdp]
+
+        # Draw baseline values only for the indicators not provided
+        missing = [i for i, values in enumerate(indicators) if values is None]
+        if missing:
+            drawn = self._draw_indicators(self._baseline_params()[missing], years)
+            for i, values in zip(missing, drawn):
+                indicators[i] = values
+        inflation, interest, stocks, bonds, real_estate, gdp = indicators
 
         return EconomicScenario(
             scenario_id=scenario_id,
             scenario_type=ScenarioType.CUSTOM,
             years=years,
-            inflation_rates=inflation if inflation is not None else baseline.inflation_rates,
-            interest_rates=interest if interest is not None else baseline.interest_rates,
-            stock_returns=stocks if stocks is not None else baseline.stock_returns,
-            bond_returns=bonds if bonds is not None else baseline.bond_returns,
-            real_estate_returns=real_estate if real_estate is not None else baseline.real_estate_returns,
-            gdp_growth=gdp if gdp is not None else baseline.gdp_growth,
+            inflation_rates=inflation,
+            interest_rates=interest,
+            stock_returns=stocks,
+            bond_returns=bonds,
+            real_estate_returns=real_estate,
+            gdp_growth=gdp,
             probability=probability,
             metadata={"description": "Custom user-defined scenario"},
         )
 
-    def analyze_scenarios(self, scenarios: List[EconomicScenario]) -> pd.DataFrame:
+    def summary_dataframe(self, scenarios: List[EconomicScenario]) -> pd.DataFrame:
         """
-        Analyze and compare multiple scenarios.
+        Tabulate mean and volatility of stock and bond returns per scenario.
+
+        Scenarios of equal length are stacked so each statistic is a single
+        reduction over all scenarios.
 
         Args:
-            scenarios (List[EconomicScenario]): List of scenarios to analyze
+            scenarios (List[EconomicScenario]): Scenarios to summarize
 
         Returns:
-            pd.DataFrame: Comparison of scenario statistics
+            pd.DataFrame: One row per scenario with columns scenario_id, type,
+            stock_mean, stock_std, bond_mean, bond_std
         """
-        results = []
+        summary = {
+            "scenario_id": [scenario.scenario_id for scenario in scenarios],
+            "type": [_SCENARIO_TYPE_VALUES[scenario.scenario_type] for scenario in scenarios],
+        }
 
-        for scenario in scenarios:
-            stats = scenario.get_summary_statistics()
+        for prefix, attribute in (("stock", "stock_returns"), ("bond", "bond_returns")):
+            values = [getattr(scenario, attribute) for scenario in scenarios]
+            if len({len(v) for v in values}) == 1:
+                stacked = np.stack(values)
+                summary[f"{prefix}_mean"] = stacked.mean(axis=1)
+                summary[f"{prefix}_std"] = stacked.std(axis=1)
+            else:
+                summary[f"{prefix}_mean"] = [float(np.mean(v)) for v in values]
+                summary[f"{prefix}_std"] = [float(np.std(v)) for v in values]
 
-            row = {
-                "scenario_id": scenario.scenario_id,
-                "type": scenario.scenario_type.value,
-                "probability": scenario.probability,
+        return pd.DataFrame(summary)
+
+    def analyze_scenarios(self, scenarios: Union[List[EconomicScenario], ScenarioBatch]) -> pd.DataFrame:
+        """
+        Analyze and compare multiple scenarios.
+
+        Args:
+            scenarios (Union[List[EconomicScenario], ScenarioBatch]): Scenarios to
+                analyze; a batch is reduced column-wise without per-scenario objects
+
+        Returns:
+            pd.DataFrame: Comparison of scenario statistics
+        """
+        if isinstance(scenarios, ScenarioBatch):
+            columns = {
+                "scenario_id": scenarios.scenario_ids,
+                "type": [scenarios.scenario_type.value] * len(scenarios),
+                "probability": scenarios.scenario_probabilities(),
             }
+            stats = scenarios.get_summary_statistics()
 
-            # Flatten statistics
-            for indicator, indicator_stats in stats.items():
-                for stat_name, value in indicator_stats.items():
-                    row[f"{indicator}_{stat_name}"] = value
+        elif not scenarios:
+            return pd.DataFrame()
 
-            results.append(row)
+        else:
+            columns = {
+                "scenario_id": [scenario.scenario_id for scenario in scenarios],
+                "type": [_SCENARIO_TYPE_VALUES[scenario.scenario_type] for scenario in scenarios],
+                "probability": np.array([scenario.probability for scenario in scenarios], dtype=float),
+            }
 
-        return pd.DataFrame(results)
+            if len({scenario.years for scenario in scenarios}) == 1:
+                # Stack each indicator and reduce all scenarios at once
+                stats = _row_statistics({
+                    name: np.stack([getattr(scenario, attribute) for scenario in scenarios])
+                    for name, attribute in _INDICATOR_ATTRIBUTES.items()
+                })
+            else:
+                # Scenarios of different lengths cannot be stacked; fill
+                # preallocated columns one scenario at a time
+                stats = {
+                    name: {stat_name: np.empty(len(scenarios)) for stat_name in _STATISTIC_NAMES}
+                    for name in _INDICATOR_ATTRIBUTES
+                }
+                for i, scenario in enumerate(scenarios):
+                    for indicator, indicator_stats in scenario.get_summary_statistics().items():
+                        for stat_name, value in indicator_stats.items():
+                            stats[indicator][stat_name][i] = value
+
+        # Flatten statistics
+        for indicator, indicator_stats in stats.items():
+            for stat_name, values in indicator_stats.items():
+                columns[f"{indicator}_{stat_name}"] = values
+
+        return pd.DataFrame(columns, copy=False)
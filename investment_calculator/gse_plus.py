@@ -13,10 +13,20 @@ investment returns. Includes:
 import numpy as np
 import pandas as pd
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple, Union
 from enum import Enum
 
-from .gse import EconomicScenario, GlobalScenarioEngine
+from .gse import _DATACLASS_SLOTS, _DATAFRAME_COLUMNS, EconomicScenario, GlobalScenarioEngine, ScenarioBatch
+
+
+# TaxIntegratedScenario attributes of the arrays returned by _after_tax_returns
+_AFTER_TAX_FIELDS = (
+    "after_tax_stock_returns",
+    "after_tax_bond_returns",
+    "after_tax_real_estate_returns",
+    "tax_drag",
+    "cumulative_taxes_paid",
+)
 
 
 class AccountType(Enum):
@@ -27,6 +37,13 @@ class AccountType(Enum):
     TAX_ADVANTAGED_EDUCATION = "tax_advantaged_education"  # e.g., 529 plan
 
 
+# Enum .value goes through a descriptor; table lookups are cheaper per row
+_ACCOUNT_TYPE_VALUES = {account_type: account_type.value for account_type in AccountType}
+
+# Accounts whose annual returns are not taxed
+_UNTAXED_ACCOUNTS = frozenset({AccountType.TAX_FREE, AccountType.TAX_DEFERRED})
+
+
 class TaxTreatment(Enum):
     """Tax treatment for different income types"""
     ORDINARY_INCOME = "ordinary_income"
@@ -36,7 +53,7 @@ class TaxTreatment(Enum):
     NON_QUALIFIED_DIVIDENDS = "non_qualified_dividends"
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class TaxConfig:
     """
     Tax configuration for different jurisdictions and scenarios.
@@ -98,7 +115,7 @@ class TaxConfig:
         return self.long_term_cap_gains_rate + self.state_tax_rate
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class TaxIntegratedScenario:
     """
     Economic scenario with tax calculations applied.
@@ -129,92 +146,110 @@ class TaxIntegratedScenario:
 
     def _calculate_after_tax_returns(self):
         """Calculate after-tax returns for each asset class"""
-        years = self.base_scenario.years
-
-        if self.account_type == AccountType.TAX_FREE:
-            # Roth IRA - no taxes on gains
-            self.after_tax_stock_returns = self.base_scenario.stock_returns.copy()
-            self.after_tax_bond_returns = self.base_scenario.bond_returns.copy()
-            self.after_tax_real_estate_returns = self.base_scenario.real_estate_returns.copy()
-            self.tax_drag = np.zeros(years)
-
-        elif self.account_type == AccountType.TAX_DEFERRED:
-            # Traditional IRA/401k - taxes paid on withdrawal, not annually
-            # For annual calculations, we keep pre-tax returns but note tax liability
-            self.after_tax_stock_returns = self.base_scenario.stock_returns.copy()
-            self.after_tax_bond_returns = self.base_scenario.bond_returns.copy()
-            self.after_tax_real_estate_returns = self.base_scenario.real_estate_returns.copy()
-            self.tax_drag = np.zeros(years)  # Tax paid later
-
-        else:  # TAXABLE account
-            # Stocks: combination of dividends (2% yield) and capital gains
-            dividend_yield = 0.02
-            dividend_tax = self.tax_config.qualified_dividend_rate
-            ltcg_tax = self.tax_config.effective_ltcg_rate
-
-            # Assume dividends taxed annually, capital gains deferred
-            # Simplified: annual tax on dividends only
-            stock_dividend_drag = dividend_yield * dividend_tax
-            self.after_tax_stock_returns = self.base_scenario.stock_returns - stock_dividend_drag
-
-            # Bonds: interest taxed as ordinary income
-            bond_tax = self.tax_config.effective_ordinary_rate
-            self.after_tax_bond_returns = self.base_scenario.bond_returns * (1 - bond_tax)
-
-            # Real estate: rental income + appreciation, taxed as ordinary and LTCG
-            # Simplified: 40% of return is rental income (ordinary), 60% is appreciation (LTCG)
-            rental_portion = 0.4
-            appreciation_portion = 0.6
-            rental_tax = self.tax_config.effective_ordinary_rate
-            appreciation_tax = self.tax_config.effective_ltcg_rate * 0.2  # Only realized portion
-
-            real_estate_drag = (
-                self.base_scenario.real_estate_returns * rental_portion * rental_tax
-                + self.base_scenario.real_estate_returns * appreciation_portion * appreciation_tax
-            )
-            self.after_tax_real_estate_returns = self.base_scenario.real_estate_returns - real_estate_drag
+        after_tax = _after_tax_returns(
+            self.base_scenario.stock_returns,
+            self.base_scenario.bond_returns,
+            self.base_scenario.real_estate_returns,
+            self.tax_config,
+            self.account_type,
+        )
+        self._set_after_tax_returns(*after_tax)
 
-            # Calculate total tax drag
-            self.tax_drag = np.array([
-                stock_dividend_drag
-                + (self.base_scenario.bond_returns[i] * bond_tax)
-                + real_estate_drag[i]
-                for i in range(years)
-            ])
+    def _set_after_tax_returns(
+        self,
+        stock_returns: np.ndarray,
+        bond_returns: np.ndarray,
+        real_estate_returns: np.ndarray,
+        tax_drag: np.ndarray,
+        cumulative_taxes_paid: np.ndarray,
+    ):
+        """Store precomputed after-tax arrays"""
+        self.after_tax_stock_returns = stock_returns
+        self.after_tax_bond_returns = bond_returns
+        self.after_tax_real_estate_returns = real_estate_returns
+        self.tax_drag = tax_drag
+        self.cumulative_taxes_paid = cumulative_taxes_paid
+
+    @classmethod
+    def from_after_tax_returns(
+        cls,
+        base_scenario: EconomicScenario,
+        tax_config: TaxConfig,
+        account_type: AccountType,
+        stock_returns: np.ndarray,
+        bond_returns: np.ndarray,
+        real_estate_returns: np.ndarray,
+        tax_drag: np.ndarray,
+        cumulative_taxes_paid: np.ndarray,
+    ) -> "TaxIntegratedScenario":
+        """
+        Create a scenario from after-tax arrays computed elsewhere (e.g. in a batch).
 
-        # Calculate cumulative taxes
-        self.cumulative_taxes_paid = np.cumsum(self.tax_drag)
+        Returns:
+            TaxIntegratedScenario: Scenario holding the given arrays
+        """
+        scenario = cls.__new__(cls)
+        scenario.base_scenario = base_scenario
+        scenario.tax_config = tax_config
+        scenario.account_type = account_type
+        scenario._set_after_tax_returns(
+            stock_returns, bond_returns, real_estate_returns, tax_drag, cumulative_taxes_paid
+        )
+        return scenario
 
     def calculate_withdrawal_tax(
         self,
-        withdrawal_amount: float,
+        withdrawal_amount: Union[float, np.ndarray],
         is_qualified_withdrawal: bool = True,
-    ) -> float:
+    ) -> Union[float, np.ndarray]:
         """
         Calculate tax on withdrawal from the account.
 
         Args:
-            withdrawal_amount (float): Amount to withdraw
+            withdrawal_amount (Union[float, np.ndarray]): Amount to withdraw, or an
+                array of amounts taxed element-wise
             is_qualified_withdrawal (bool): Whether withdrawal is qualified (no penalty)
 
         Returns:
-            float: Total tax on withdrawal
+            Union[float, np.ndarray]: Total tax on withdrawal, shaped like withdrawal_amount
         """
-        if self.account_type == AccountType.TAX_FREE:
+        if self.account_type is AccountType.TAX_FREE:
             # Roth IRA - qualified withdrawals are tax-free
-            return 0.0 if is_qualified_withdrawal else withdrawal_amount * self.tax_config.early_withdrawal_penalty
-
-        elif self.account_type == AccountType.TAX_DEFERRED:
+            rate = 0.0
+        elif self.account_type is AccountType.TAX_DEFERRED:
             # Traditional IRA - pay ordinary income tax
-            tax = withdrawal_amount * self.tax_config.tax_deferred_withdrawal_rate
-            if not is_qualified_withdrawal:
-                tax += withdrawal_amount * self.tax_config.early_withdrawal_penalty
-            return tax
-
+            rate = self.tax_config.tax_deferred_withdrawal_rate
         else:  # TAXABLE
-            # For taxable accounts, assume withdrawal is from gains (LTCG)
-            tax = withdrawal_amount * self.tax_config.effective_ltcg_rate
-            return tax
+            # For taxable accounts, assume withdrawal is from gains (LTCG);
+            # there is no early withdrawal penalty
+            return withdrawal_amount * self.tax_config.effective_ltcg_rate
+
+        if not is_qualified_withdrawal:
+            rate += self.tax_config.early_withdrawal_penalty
+        return withdrawal_amount * rate
+
+    def to_dict(self) -> Dict[str, np.ndarray]:
+        """
+        Columns of to_dataframe as arrays, without building a DataFrame.
+
+        Useful for collecting many scenarios and constructing one DataFrame
+        at the end. The arrays are the scenario's own, not copies.
+
+        Returns:
+            Dict[str, np.ndarray]: Pre-tax and after-tax columns by name
+        """
+        columns = {
+            column: getattr(self.base_scenario, attribute)
+            for column, attribute in _DATAFRAME_COLUMNS.items()
+        }
+        columns.update(
+            after_tax_stock_return=self.after_tax_stock_returns,
+            after_tax_bond_return=self.after_tax_bond_returns,
+            after_tax_real_estate_return=self.after_tax_real_estate_returns,
+            tax_drag=self.tax_drag,
+            cumulative_taxes=self.cumulative_taxes_paid,
+        )
+        return columns
 
     def to_dataframe(self) -> pd.DataFrame:
         """
@@ -223,16 +258,11 @@ class TaxIntegratedScenario:
         Returns:
             pd.DataFrame: Scenario data with both pre-tax and after-tax returns
         """
-        df = self.base_scenario.to_dataframe()
-
-        # Add after-tax columns
-        df["after_tax_stock_return"] = self.after_tax_stock_returns
-        df["after_tax_bond_return"] = self.after_tax_bond_returns
-        df["after_tax_real_estate_return"] = self.after_tax_real_estate_returns
-        df["tax_drag"] = self.tax_drag
-        df["cumulative_taxes"] = self.cumulative_taxes_paid
-
-        return df
+        # All columns in one construction rather than inserting them one by one
+        return pd.DataFrame(
+            self.to_dict(),
+            index=pd.RangeIndex(1, self.base_scenario.years + 1, name="year"),
+        )
 
     def get_effective_tax_rate(self) -> float:
         """
@@ -241,22 +271,169 @@ class TaxIntegratedScenario:
         Returns:
             float: Effective tax rate
         """
-        total_pre_tax_return = (
-            np.sum(self.base_scenario.stock_returns)
-            + np.sum(self.base_scenario.bond_returns)
-            + np.sum(self.base_scenario.real_estate_returns)
-        )
+        if self.account_type in _UNTAXED_ACCOUNTS:
+            # Annual returns are untaxed
+            return 0.0
 
-        total_after_tax_return = (
-            np.sum(self.after_tax_stock_returns)
-            + np.sum(self.after_tax_bond_returns)
-            + np.sum(self.after_tax_real_estate_returns)
-        )
+        return self._effective_tax_rate(_total_pre_tax_return(self.base_scenario))
 
-        if total_pre_tax_return == 0:
+    def _effective_tax_rate(self, total_pre_tax_return: float) -> float:
+        """
+        Effective tax rate given the summed pre-tax returns of the base scenario.
+
+        Lets callers holding several accounts on one base scenario sum its
+        returns once.
+        """
+        if self.account_type in _UNTAXED_ACCOUNTS or total_pre_tax_return == 0:
             return 0.0
 
-        return (total_pre_tax_return - total_after_tax_return) / total_pre_tax_return
+        # Pre-tax minus after-tax returns is the annual tax drag
+        return np.sum(self.tax_drag) / total_pre_tax_return
+
+
+def _total_pre_tax_return(scenario: EconomicScenario) -> float:
+    """Sum of a scenario's stock, bond and real estate returns over all years"""
+    return (
+        np.sum(scenario.stock_returns)
+        + np.sum(scenario.bond_returns)
+        + np.sum(scenario.real_estate_returns)
+    )
+
+
+def _read_only_view(values: np.ndarray) -> np.ndarray:
+    """Return a view of an array that cannot be written through"""
+    view = values.view()
+    view.flags.writeable = False
+    return view
+
+
+def _annual_tax_rates(tax_config: TaxConfig, account_type: AccountType) -> Tuple[float, float, float]:
+    """
+    Annual taxes of an account on each asset class's return.
+
+    Returns:
+        Tuple of (stock dividend drag, bond tax rate, real estate tax rate);
+        all zero for accounts whose annual returns are not taxed
+    """
+    if account_type in _UNTAXED_ACCOUNTS:
+        # Roth IRA - no taxes on gains; Traditional IRA/401k - taxes paid on
+        # withdrawal, not annually
+        return 0.0, 0.0, 0.0
+
+    # TAXABLE account: read each configured rate once
+    ordinary_rate = tax_config.effective_ordinary_rate
+    ltcg_rate = tax_config.effective_ltcg_rate
+    dividend_tax = tax_config.qualified_dividend_rate
+
+    # Stocks: combination of dividends (2% yield) and capital gains
+    dividend_yield = 0.02
+
+    # Assume dividends taxed annually, capital gains deferred
+    # Simplified: annual tax on dividends only
+    stock_dividend_drag = dividend_yield * dividend_tax
+
+    # Bonds: interest taxed as ordinary income
+    bond_tax = ordinary_rate
+
+    # Real estate: rental income + appreciation, taxed as ordinary and LTCG
+    # Simplified: 40% of return is rental income (ordinary), 60% is appreciation (LTCG)
+    rental_portion = 0.4
+    appreciation_portion = 0.6
+    rental_tax = ordinary_rate
+    appreciation_tax = ltcg_rate * 0.2  # Only realized portion
+    real_estate_tax = rental_portion * rental_tax + appreciation_portion * appreciation_tax
+
+    return stock_dividend_drag, bond_tax, real_estate_tax
+
+
+def _after_tax_returns(
+    stock_returns: np.ndarray,
+    bond_returns: np.ndarray,
+    real_estate_returns: np.ndarray,
+    tax_config: TaxConfig,
+    account_type: AccountType,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Apply account taxes to pre-tax returns.
+
+    Works on arrays of any shape whose last axis is years, so a single
+    scenario (years,) and a stack of scenarios (n_scenarios, years) go
+    through the same formulas. Every account type goes through the same
+    formulas with its own rates from _annual_tax_rates.
+
+    Returns:
+        Tuple of (stock, bond, real estate) after-tax returns, tax drag and
+        cumulative taxes paid, all with the input shape
+    """
+    stock_dividend_drag, bond_tax, real_estate_tax = _annual_tax_rates(tax_config, account_type)
+
+    if not (stock_dividend_drag or bond_tax or real_estate_tax):
+        # No annual taxes: the returns stay pre-tax and are shared with the
+        # pre-tax arrays as read-only views, not copied. Tax drag and
+        # cumulative taxes are one read-only zero broadcast to their shape,
+        # in the floating point type of the returns.
+        zero = np.zeros((), dtype=np.result_type(stock_returns, 0.0))
+        tax_drag = np.broadcast_to(zero, np.shape(stock_returns))
+        return (
+            _read_only_view(stock_returns),
+            _read_only_view(bond_returns),
+            _read_only_view(real_estate_returns),
+            tax_drag,
+            tax_drag,
+        )
+
+    after_tax_stock_returns = stock_returns - stock_dividend_drag
+    after_tax_bond_returns = bond_returns * (1 - bond_tax)
+    after_tax_real_estate_returns = real_estate_returns * (1 - real_estate_tax)
+
+    # Calculate total tax drag, accumulating in place
+    tax_drag = bond_returns * bond_tax
+    tax_drag += stock_dividend_drag
+    real_estate_drag = real_estate_returns * real_estate_tax
+    tax_drag += real_estate_drag
+
+    # Calculate cumulative taxes, reusing the real estate drag buffer
+    cumulative_taxes_paid = np.cumsum(tax_drag, axis=-1, out=real_estate_drag)
+
+    return (
+        after_tax_stock_returns,
+        after_tax_bond_returns,
+        after_tax_real_estate_returns,
+        tax_drag,
+        cumulative_taxes_paid,
+    )
+
+
+def _final_balances(
+    returns: np.ndarray,
+    initial_investment: float,
+    annual_contribution: float,
+) -> np.ndarray:
+    """
+    Final balance of portfolios grown by yearly returns.
+
+    Each year the balance earns that year's return and then receives the
+    annual contribution. In closed form, the initial investment grows by
+    every year's return and each contribution by the returns of the years
+    after it, so the recurrence reduces to products over trailing years.
+
+    Args:
+        returns (np.ndarray): Yearly returns, shape (n_portfolios, years)
+        initial_investment (float): Starting balance
+        annual_contribution (float): Amount added at the end of every year
+
+    Returns:
+        np.ndarray: Final balance of each portfolio, shape (n_portfolios,)
+    """
+    # trailing_growth[:, k] = prod(1 + returns[:, k:]) along each row
+    trailing_growth = np.cumprod((1 + returns)[:, ::-1], axis=1)[:, ::-1]
+    if trailing_growth.shape[1] == 0:
+        return np.full(len(returns), float(initial_investment))
+
+    return (
+        initial_investment * trailing_growth[:, 0]
+        + annual_contribution * (trailing_growth[:, 1:].sum(axis=1) + 1)
+    )
 
 
 class TaxIntegratedScenarioEngine:
@@ -302,6 +479,96 @@ class TaxIntegratedScenarioEngine:
             account_type=account_type,
         )
 
+    def apply_taxes_batch(
+        self,
+        stock_returns: np.ndarray,
+        bond_returns: np.ndarray,
+        real_estate_returns: np.ndarray,
+        account_type: AccountType,
+        dtype: Optional[type] = None,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Apply tax calculations to stacked returns of many scenarios.
+
+        Works on (n_scenarios, years) arrays, such as those of a ScenarioBatch,
+        without building a TaxIntegratedScenario per scenario. Results keep the
+        floating point type of the returns; passing dtype=np.float32 computes
+        in single precision, halving the memory of large sweeps.
+
+        Args:
+            stock_returns (np.ndarray): Pre-tax stock returns, shape (n_scenarios, years)
+            bond_returns (np.ndarray): Pre-tax bond returns, shape (n_scenarios, years)
+            real_estate_returns (np.ndarray): Pre-tax real estate returns, shape (n_scenarios, years)
+            account_type (AccountType): Type of investment account
+            dtype (Optional[type]): Floating point type to compute in (default: that of the returns)
+
+        Returns:
+            Dict[str, np.ndarray]: After-tax returns, tax drag and cumulative taxes
+            paid, keyed by TaxIntegratedScenario attribute name, each of shape
+            (n_scenarios, years)
+        """
+        after_tax = _after_tax_returns(
+            np.asarray(stock_returns, dtype=dtype),
+            np.asarray(bond_returns, dtype=dtype),
+            np.asarray(real_estate_returns, dtype=dtype),
+            self.tax_config,
+            account_type,
+        )
+        return dict(zip(_AFTER_TAX_FIELDS, after_tax))
+
+    def generate_tax_integrated_scenarios(
+        self,
+        scenarios: Union[List[EconomicScenario], ScenarioBatch],
+        account_type: AccountType,
+    ) -> List[TaxIntegratedScenario]:
+        """
+        Apply tax calculations to many economic scenarios at once.
+
+        Scenarios of equal length are stacked into (n_scenarios, years)
+        arrays and taxed in one pass; each returned scenario holds views into
+        the stacked results. A ScenarioBatch is taxed from its arrays directly.
+
+        Args:
+            scenarios (Union[List[EconomicScenario], ScenarioBatch]): Base economic scenarios
+            account_type (AccountType): Type of investment account
+
+        Returns:
+            List[TaxIntegratedScenario]: Scenarios with tax calculations applied,
+            in input order
+        """
+        if isinstance(scenarios, ScenarioBatch):
+            after_tax = _after_tax_returns(
+                scenarios.stock_returns,
+                scenarios.bond_returns,
+                scenarios.real_estate_returns,
+                self.tax_config,
+                account_type,
+            )
+        elif len({scenario.years for scenario in scenarios}) != 1:
+            # Empty input or mixed horizons: no common (n_scenarios, years) shape
+            return [
+                self.generate_tax_integrated_scenario(scenario, account_type)
+                for scenario in scenarios
+            ]
+        else:
+            after_tax = _after_tax_returns(
+                np.stack([scenario.stock_returns for scenario in scenarios]),
+                np.stack([scenario.bond_returns for scenario in scenarios]),
+                np.stack([scenario.real_estate_returns for scenario in scenarios]),
+                self.tax_config,
+                account_type,
+            )
+
+        return [
+            TaxIntegratedScenario.from_after_tax_returns(
+                scenario,
+                self.tax_config,
+                account_type,
+                *(values[i] for values in after_tax),
+            )
+            for i, scenario in enumerate(scenarios)
+        ]
+
     def generate_all_account_scenarios(
         self,
         years: int,
@@ -338,65 +605,82 @@ class TaxIntegratedScenarioEngine:
         initial_investment: float,
         annual_contribution: float = 0.0,
         asset_allocation: Optional[Dict[str, float]] = None,
+        account_types: Optional[List[AccountType]] = None,
     ) -> pd.DataFrame:
         """
         Compare investment growth across different account types.
 
+        All account types share one baseline scenario, and their portfolios are
+        grown together as rows of a (n_account_types, years) array.
+
         Args:
             years (int): Number of years to simulate
             initial_investment (float): Initial investment amount
             annual_contribution (float): Annual contribution
             asset_allocation (Optional[Dict]): Asset allocation (stocks, bonds, real_estate)
+            account_types (Optional[List[AccountType]]): Account types to compare
+                (default: taxable, tax-deferred and tax-free)
 
         Returns:
             pd.DataFrame: Comparison of account types
         """
+        return pd.DataFrame(self._compare_account_types_raw(
+            years, initial_investment, annual_contribution, asset_allocation, account_types
+        ))
+
+    def _compare_account_types_raw(
+        self,
+        years: int,
+        initial_investment: float,
+        annual_contribution: float = 0.0,
+        asset_allocation: Optional[Dict[str, float]] = None,
+        account_types: Optional[List[AccountType]] = None,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Columns of compare_account_types as arrays with one entry per account type.
+
+        Returns:
+            Dict[str, np.ndarray]: Comparison columns, in display order
+        """
         if asset_allocation is None:
             asset_allocation = {"stocks": 0.7, "bonds": 0.25, "real_estate": 0.05}
+        if account_types is None:
+            account_types = [AccountType.TAXABLE, AccountType.TAX_DEFERRED, AccountType.TAX_FREE]
 
-        scenarios = self.generate_all_account_scenarios(years)
-
-        results = []
-        for account_type, scenario in scenarios.items():
-            # Simulate portfolio growth
-            balance = initial_investment
-            total_contributions = initial_investment
-            balances = []
-
-            for year in range(years):
-                # Calculate weighted return
-                weighted_return = (
-                    asset_allocation["stocks"] * scenario.after_tax_stock_returns[year]
-                    + asset_allocation["bonds"] * scenario.after_tax_bond_returns[year]
-                    + asset_allocation["real_estate"] * scenario.after_tax_real_estate_returns[year]
-                )
-
-                # Apply return
-                balance *= (1 + weighted_return)
-
-                # Add annual contribution
-                balance += annual_contribution
-                total_contributions += annual_contribution
-
-                balances.append(balance)
-
-            final_balance = balances[-1]
-            total_gains = final_balance - total_contributions
-
-            # Calculate withdrawal tax
-            withdrawal_tax = scenario.calculate_withdrawal_tax(final_balance, is_qualified_withdrawal=True)
-            after_tax_balance = final_balance - withdrawal_tax
-
-            results.append({
-                "account_type": account_type.value,
-                "final_balance": final_balance,
-                "after_withdrawal_tax": after_tax_balance,
-                "total_contributions": total_contributions,
-                "total_gains": total_gains,
-                "effective_tax_rate": scenario.get_effective_tax_rate(),
-                "cumulative_taxes_paid": scenario.cumulative_taxes_paid[-1],
-                "withdrawal_tax": withdrawal_tax,
-                "net_benefit": after_tax_balance - total_contributions,
-            })
-
-        return pd.DataFrame(results)
+        base = self.gse.generate_baseline_scenario(years)
+        scenarios = [self.generate_tax_integrated_scenario(base, account_type) for account_type in account_types]
+
+        stock_weight = asset_allocation["stocks"]
+        bond_weight = asset_allocation["bonds"]
+        re_weight = asset_allocation["real_estate"]
+
+        # Weighted after-tax return of every account type for every year
+        weighted_returns = (
+            stock_weight * np.stack([s.after_tax_stock_returns[:years] for s in scenarios])
+            + bond_weight * np.stack([s.after_tax_bond_returns[:years] for s in scenarios])
+            + re_weight * np.stack([s.after_tax_real_estate_returns[:years] for s in scenarios])
+        )
+
+        balances = _final_balances(weighted_returns, initial_investment, annual_contribution)
+        total_contributions = initial_investment + annual_contribution * years
+
+        withdrawal_taxes = np.array([
+            scenario.calculate_withdrawal_tax(final_balance, is_qualified_withdrawal=True)
+            for scenario, final_balance in zip(scenarios, balances.tolist())
+        ])
+        after_tax_balances = balances - withdrawal_taxes
+
+        # Every account shares the base scenario, so its returns are summed once
+        total_pre_tax_return = _total_pre_tax_return(base)
+
+        return {
+            "account_type": np.array([_ACCOUNT_TYPE_VALUES[account_type] for account_type in account_types], dtype=object),
+            "final_balance": balances,
+            "after_withdrawal_tax": after_tax_balances,
+            "total_contributions": np.full(len(scenarios), total_contributions),
+            "total_gains": balances - total_contributions,
+            "effective_tax_rate": np.array([scenario._effective_tax_rate(total_pre_tax_return) for scenario in scenarios]),
+            "cumulative_taxes_paid": np.array([scenario.cumulative_taxes_paid[-1] for scenario in scenarios]),
+            "withdrawal_tax": withdrawal_taxes,
+            "net_benefit": after_tax_balances - total_contributions,
+        }
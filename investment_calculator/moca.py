@@ -19,6 +19,22 @@ from .gse_plus import TaxIntegratedScenario, AccountType
 from .personal_variables import PersonalVariables, InvestmentProfile
 
 
+# Allocation keys that count towards each simulated asset class
+_ASSET_CLASS_KEYS = (
+    ("stocks", "domestic_stocks", "international_stocks", "emerging_markets"),
+    ("bonds", "government_bonds", "corporate_bonds"),
+    ("real_estate",),
+)
+
+
+def _asset_class_weights(asset_allocation: Dict[str, float]) -> np.ndarray:
+    """Stock, bond and real estate weights of an allocation, in that order"""
+    return np.array([
+        sum(asset_allocation.get(key, 0.0) for key in keys)
+        for keys in _ASSET_CLASS_KEYS
+    ])
+
+
 class OptimizationMethod(Enum):
     """Portfolio optimization methods"""
     MEAN_VARIANCE = "mean_variance"
@@ -476,12 +492,10 @@ class MOCA:
 
         cumulative_contrib = initial
 
+        stock_weight, bond_weight, re_weight = _asset_class_weights(asset_allocation)
+
         for year in range(years):
             # Calculate weighted return
-            stock_weight = asset_allocation.get("stocks", 0.0) + asset_allocation.get("domestic_stocks", 0.0) + asset_allocation.get("international_stocks", 0.0) + asset_allocation.get("emerging_markets", 0.0)
-            bond_weight = asset_allocation.get("bonds", 0.0) + asset_allocation.get("government_bonds", 0.0) + asset_allocation.get("corporate_bonds", 0.0)
-            re_weight = asset_allocation.get("real_estate", 0.0)
-
             weighted_return = (
                 stock_weight * scenario.after_tax_stock_returns[year]
                 + bond_weight * scenario.after_tax_bond_returns[year]
@@ -526,9 +540,56 @@ class MOCA:
         Returns:
             List[InvestmentResult]: Results for all scenarios
         """
+        pv = self.profile.personal_vars
+        years = pv.investment_horizon
+
+        if not scenarios or any(len(s.after_tax_stock_returns) < years for s in scenarios):
+            self.results = [
+                self.simulate_investment(scenario, asset_allocation)
+                for scenario in scenarios
+            ]
+            return self.results
+
+        initial = pv.current_savings
+        annual_contrib = pv.monthly_contribution * 12
+
+        # Weighted returns of all scenarios at once: (n_scenarios, years)
+        stock_weight, bond_weight, re_weight = _asset_class_weights(asset_allocation)
+        returns = (
+            stock_weight * np.stack([s.after_tax_stock_returns[:years] for s in scenarios])
+            + bond_weight * np.stack([s.after_tax_bond_returns[:years] for s in scenarios])
+            + re_weight * np.stack([s.after_tax_real_estate_returns[:years] for s in scenarios])
+        )
+
+        # Step every scenario's balance forward together, one year at a time
+        balances = np.empty_like(returns)
+        balance = np.full(len(scenarios), initial, dtype=float)
+        for year in range(years):
+            balance = balance * (1 + returns[:, year])
+            balance += annual_contrib
+            balances[:, year] = balance
+
+        # Contributions do not depend on the scenario
+        contributions = []
+        cumulative_contrib = initial
+        for _ in range(years):
+            cumulative_contrib += annual_contrib
+            contributions.append(cumulative_contrib)
+        contributions = np.array(contributions)
+
         self.results = [
-            self.simulate_investment(scenario, asset_allocation)
-            for scenario in scenarios
+            InvestmentResult(
+                scenario_id=scenario.base_scenario.scenario_id,
+                asset_allocation=asset_allocation,
+                initial_investment=initial,
+                annual_contribution=annual_contrib,
+                years=years,
+                balances=balances[i],
+                contributions=contributions.copy(),
+                returns=returns[i],
+                probability=scenario.base_scenario.probability,
+            )
+            for i, scenario in enumerate(scenarios)
         ]
         return self.results
 
@@ -568,11 +629,8 @@ class MOCA:
             mean_return = np.mean(annualized_returns)
             mean_sharpe = np.mean(sharpe_ratios)
 
-        # Calculate percentiles
-        p5 = np.percentile(final_balances, 5)
-        p25 = np.percentile(final_balances, 25)
-        p75 = np.percentile(final_balances, 75)
-        p95 = np.percentile(final_balances, 95)
+        # Calculate percentiles (median included) in one pass
+        p5, p25, p50, p75, p95 = np.percentile(final_balances, [5, 25, 50, 75, 95])
 
         # Probability of loss
         initial_contributions = results[0].total_contributions
@@ -591,7 +649,7 @@ class MOCA:
 
         return PortfolioStatistics(
             mean_final_balance=mean_balance,
-            median_final_balance=np.median(final_balances),
+            median_final_balance=p50,
             std_final_balance=np.std(final_balances),
             percentile_5=p5,
             percentile_25=p25,
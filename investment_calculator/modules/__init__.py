@@ -19,13 +19,7 @@ Example usage:
 For a complete workflow example, see examples/complete_workflow_modules.py
 """
 
-from investment_calculator.modules import (
-    scenario_generator,
-    tax_engine,
-    user_profile,
-    optimizer,
-    reporting
-)
+import importlib
 
 __all__ = [
     'scenario_generator',
@@ -45,3 +39,15 @@ MODULE_DESCRIPTIONS = {
     'optimizer': 'Optimize portfolio allocation and simulate outcomes',
     'reporting': 'Generate comprehensive reports and visualizations'
 }
+
+
+def __getattr__(name):
+    # Submodules are imported on first access (PEP 562), so using the tax
+    # engine alone does not load matplotlib through the reporting module
+    if name in __all__:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -6,6 +6,8 @@ This module optimizes portfolio allocation and simulates investment outcomes acr
 INPUT STRUCTURE:
 {
     'scenarios': pd.DataFrame,          # After-tax scenarios from Module 2
+    'scenario_arrays': dict,            # Optional: 'after_tax_arrays' from Module 2
+                                       # (derived from 'scenarios' if omitted)
     'user_constraints': dict,           # From Module 3 validated profile
     'investment_time_series': pd.DataFrame,  # From Module 3
     'optimization_objective': str,      # 'max_return', 'max_sharpe', 'min_volatility',
@@ -33,13 +35,25 @@ OUTPUT STRUCTURE:
 }
 """
 
+import os
 import numpy as np
 import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
 from scipy.optimize import minimize
 from enum import Enum
 
+from investment_calculator.modules.scenario_generator import (
+    group_by_scenario,
+    scenarios_to_arrays
+)
+
+
+# Scenarios simulated together; 2048 annual paths of 30 years take ~1 MB
+# for wealth and growth combined
+SIMULATION_BLOCK_SIZE = 2048
+
 
 class OptimizationObjective(Enum):
     """Portfolio optimization objectives"""
@@ -88,13 +102,21 @@ class PortfolioOptimizer:
         # Validate configuration
         validated_config = self._validate_config(config)
 
-        scenarios_df = validated_config['scenarios']
+        scenarios_df = group_by_scenario(validated_config['scenarios'])
         objective = validated_config['optimization_objective']
         params = validated_config['optimization_params']
         constraints = validated_config['user_constraints']
 
+        # Work on (scenarios × periods) return arrays rather than the long DataFrame
+        return_columns = self._select_return_columns(scenarios_df)
+        scenario_arrays = validated_config['scenario_arrays']
+        if scenario_arrays is None or not all(col in scenario_arrays for col in return_columns.values()):
+            scenario_arrays = scenarios_to_arrays(scenarios_df, list(return_columns.values()))
+        return_arrays = {asset: scenario_arrays[col] for asset, col in return_columns.items()}
+        scenario_ids = pd.unique(scenarios_df['scenario_id'])
+
         # Extract returns for optimization
-        asset_returns = self._extract_asset_returns(scenarios_df)
+        asset_returns = self._extract_asset_returns(scenario_ids, return_arrays)
 
         # Run optimization
         optimal_portfolio = self._run_optimization(
@@ -113,7 +135,8 @@ class PortfolioOptimizer:
 
         # Run simulations
         simulation_results = self._run_simulations(
-            scenarios_df,
+            scenario_ids,
+            return_arrays,
             optimal_portfolio,
             validated_config['investment_time_series'],
             params
@@ -148,6 +171,32 @@ class PortfolioOptimizer:
             'goal_analysis': goal_analysis
         }
 
+    def optimize_multi(self, configs: List[Dict]) -> List[Dict]:
+        """
+        Run several independent optimizations in parallel processes.
+
+        Useful for sweeping objectives or parameters over the same scenarios.
+        Each config is dispatched to :meth:`optimize` in a worker process;
+        passing 'scenario_arrays' keeps the per-task payload to plain arrays.
+
+        Args:
+            configs: List of configuration dictionaries (see module docstring)
+
+        Returns:
+            List of optimization results, in the same order as ``configs``
+
+        Example:
+            >>> configs = [{**base_config, 'optimization_objective': obj}
+            ...            for obj in ['max_sharpe', 'min_volatility', 'max_return']]
+            >>> results = opt.optimize_multi(configs)
+        """
+        if len(configs) <= 1:
+            return [self.optimize(config) for config in configs]
+
+        max_workers = min(len(configs), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(_optimize_config, configs))
+
     def _validate_config(self, config: Dict) -> Dict:
         """
         Validate and complete configuration.
@@ -163,6 +212,7 @@ class PortfolioOptimizer:
 
         validated = {
             'scenarios': config['scenarios'],
+            'scenario_arrays': config.get('scenario_arrays'),
             'user_constraints': config.get('user_constraints', {}),
             'investment_time_series': config.get('investment_time_series', pd.DataFrame()),
             'optimization_objective': config.get('optimization_objective', 'max_sharpe'),
@@ -190,41 +240,55 @@ class PortfolioOptimizer:
 
         return validated
 
-    def _extract_asset_returns(self, scenarios_df: pd.DataFrame) -> pd.DataFrame:
+    def _select_return_columns(self, scenarios_df: pd.DataFrame) -> Dict[str, str]:
         """
-        Extract asset returns from scenarios DataFrame.
+        Pick the return column used for each asset.
 
         Args:
             scenarios_df: Scenarios with after-tax returns
 
         Returns:
-            DataFrame of asset returns (scenarios × assets)
+            Dictionary mapping asset name to its return column
         """
         # Identify return columns (after_tax versions if available)
-        return_columns = []
-        asset_names = []
+        return_columns = {}
 
         for col in scenarios_df.columns:
             if 'return' in col.lower() and 'after_tax' in col.lower():
-                return_columns.append(col)
                 # Extract asset name
                 asset_name = col.replace('_after_tax', '').replace('_return', '')
-                asset_names.append(asset_name)
+                return_columns[asset_name] = col
 
         if not return_columns:
             # Fallback to pre-tax returns
             for col in scenarios_df.columns:
                 if 'return' in col.lower() and col not in ['interest_rate', 'inflation', 'gdp_growth']:
-                    return_columns.append(col)
                     asset_name = col.replace('_return', '')
-                    asset_names.append(asset_name)
+                    return_columns[asset_name] = col
 
-        # Create pivot table: scenarios × assets
-        # Group by scenario_id and calculate mean returns
-        returns_by_scenario = scenarios_df.groupby('scenario_id')[return_columns].mean()
-        returns_by_scenario.columns = asset_names
+        return return_columns
 
-        return returns_by_scenario
+    def _extract_asset_returns(
+        self,
+        scenario_ids: np.ndarray,
+        return_arrays: Dict[str, np.ndarray]
+    ) -> pd.DataFrame:
+        """
+        Extract mean asset returns per scenario.
+
+        Args:
+            scenario_ids: Scenario labels, one per row of the return arrays
+            return_arrays: (n_scenarios, n_steps) return array per asset
+
+        Returns:
+            DataFrame of asset returns (scenarios × assets), sorted by scenario_id
+        """
+        returns_by_scenario = pd.DataFrame(
+            {asset: returns.mean(axis=1) for asset, returns in return_arrays.items()},
+            index=pd.Index(scenario_ids, name='scenario_id')
+        )
+
+        return returns_by_scenario.sort_index()
 
     def _run_optimization(
         self,
@@ -481,7 +545,8 @@ class PortfolioOptimizer:
 
     def _run_simulations(
         self,
-        scenarios_df: pd.DataFrame,
+        scenario_ids: np.ndarray,
+        return_arrays: Dict[str, np.ndarray],
         optimal_portfolio: Dict,
         time_series: pd.DataFrame,
         params: Dict
@@ -490,7 +555,8 @@ class PortfolioOptimizer:
         Run Monte Carlo simulations with optimal portfolio.
 
         Args:
-            scenarios_df: After-tax scenarios
+            scenario_ids: Scenario labels, one per row of the return arrays
+            return_arrays: (n_scenarios, n_steps) after-tax return array per asset
             optimal_portfolio: Optimal portfolio weights
             time_series: Investment time series
             params: Parameters
@@ -500,65 +566,49 @@ class PortfolioOptimizer:
         """
         weights = optimal_portfolio['weights']
 
-        # Simulate terminal wealth for each scenario
-        terminal_wealth_list = []
-        wealth_paths = []
-
-        scenario_ids = scenarios_df['scenario_id'].unique()
-
-        for scenario_id in scenario_ids:
-            scenario_data = scenarios_df[scenarios_df['scenario_id'] == scenario_id]
-
-            # Simulate wealth path for this scenario
-            wealth_path, terminal_wealth = self._simulate_wealth_path(
-                scenario_data,
-                weights,
-                time_series,
-                params
-            )
-
-            terminal_wealth_list.append({
-                'scenario_id': scenario_id,
-                'wealth': terminal_wealth,
-                'real_wealth': terminal_wealth  # Could adjust for inflation
-            })
-
-            wealth_paths.append(wealth_path)
-
-        terminal_wealth_df = pd.DataFrame(terminal_wealth_list)
+        # Portfolio return of every scenario and period at once
+        n_scenarios, n_periods = next(iter(return_arrays.values())).shape
+        portfolio_returns = np.zeros((n_scenarios, n_periods))
+        for asset, weight in weights.items():
+            if asset in return_arrays:
+                portfolio_returns += weight * return_arrays[asset]
+
+        # Simulate wealth paths for all scenarios
+        wealth_paths_array = self._simulate_wealth_paths(portfolio_returns, time_series)
+        wealth_values = wealth_paths_array[:, -1]
+
+        terminal_wealth_df = pd.DataFrame({
+            'scenario_id': scenario_ids,
+            'wealth': wealth_values,
+            'real_wealth': wealth_values  # Could adjust for inflation
+        })
 
         # Calculate percentiles
-        wealth_values = terminal_wealth_df['wealth'].values
         terminal_wealth_df['percentile'] = terminal_wealth_df['wealth'].rank(pct=True) * 100
 
         # Calculate statistics
+        var_95, cvar_95 = _lower_tail_risk(wealth_values, 0.05)
+
+        # One partition for all reported percentiles; the median is the 50th
+        percentile_levels = ['5', '25', '50', '75', '95']
+        percentile_values = np.percentile(wealth_values, [5, 25, 50, 75, 95])
+        percentiles = {level: float(value) for level, value in zip(percentile_levels, percentile_values)}
+
         statistics = {
             'mean_terminal_wealth': float(wealth_values.mean()),
-            'median_terminal_wealth': float(np.median(wealth_values)),
+            'median_terminal_wealth': percentiles['50'],
             'std_terminal_wealth': float(wealth_values.std()),
-            'percentiles': {
-                '5': float(np.percentile(wealth_values, 5)),
-                '25': float(np.percentile(wealth_values, 25)),
-                '50': float(np.percentile(wealth_values, 50)),
-                '75': float(np.percentile(wealth_values, 75)),
-                '95': float(np.percentile(wealth_values, 95))
-            },
+            'percentiles': percentiles,
             'probability_of_success': 0.0,  # Will be calculated in goal_analysis
             'shortfall_risk': 0.0,
-            'var_95': float(np.percentile(wealth_values, 5)),
-            'cvar_95': float(wealth_values[wealth_values <= np.percentile(wealth_values, 5)].mean())
+            'var_95': var_95,
+            'cvar_95': cvar_95
         }
 
         # Create wealth paths DataFrame
-        max_len = max(len(path) for path in wealth_paths)
-        wealth_paths_array = np.zeros((len(scenario_ids), max_len))
-
-        for i, path in enumerate(wealth_paths):
-            wealth_paths_array[i, :len(path)] = path
-
         wealth_paths_df = pd.DataFrame(
             wealth_paths_array,
-            columns=[f"year_{i}" for i in range(max_len)]
+            columns=[f"year_{i}" for i in range(n_periods + 1)]
         )
         wealth_paths_df.insert(0, 'scenario_id', scenario_ids)
 
@@ -568,66 +618,54 @@ class PortfolioOptimizer:
             'statistics': statistics
         }
 
-    def _simulate_wealth_path(
+    def _simulate_wealth_paths(
         self,
-        scenario_data: pd.DataFrame,
-        weights: Dict,
-        time_series: pd.DataFrame,
-        params: Dict
-    ) -> Tuple[np.ndarray, float]:
+        portfolio_returns: np.ndarray,
+        time_series: pd.DataFrame
+    ) -> np.ndarray:
         """
-        Simulate wealth path for a single scenario.
+        Simulate wealth paths for all scenarios.
 
         Args:
-            scenario_data: Scenario data
-            weights: Portfolio weights
+            portfolio_returns: Portfolio return per scenario and period,
+                shape (n_scenarios, n_periods)
             time_series: Investment time series
-            params: Parameters
 
         Returns:
-            Tuple of (wealth_path, terminal_wealth)
+            Wealth paths of shape (n_scenarios, n_periods + 1), starting
+            with the initial wealth
         """
         # Simplified simulation
         # In reality, this would incorporate contributions, withdrawals, rebalancing
 
-        n_periods = len(scenario_data)
-        wealth_path = np.zeros(n_periods + 1)
+        n_scenarios, n_periods = portfolio_returns.shape
+        wealth_paths = np.zeros((n_scenarios, n_periods + 1))
 
         # Initial wealth (from time_series if available)
         initial_wealth = 10000  # Default
         if not time_series.empty and 'contribution' in time_series.columns:
             initial_wealth = time_series['contribution'].iloc[0] if len(time_series) > 0 else 10000
 
-        wealth_path[0] = initial_wealth
-
-        # Iterate through periods
-        for t in range(n_periods):
-            period_data = scenario_data.iloc[t]
-
-            # Calculate portfolio return
-            portfolio_return = 0.0
-            for asset, weight in weights.items():
-                return_col = f"{asset}_return_after_tax"
-                if return_col not in period_data:
-                    return_col = f"{asset}_after_tax"
-                if return_col not in period_data:
-                    return_col = f"{asset}_return"
-
-                if return_col in period_data:
-                    portfolio_return += weight * period_data[return_col]
+        wealth_paths[:, 0] = initial_wealth
 
-            # Add contribution/withdrawal if available
-            contribution = 0.0
-            if not time_series.empty and t < len(time_series):
-                if 'net_flow' in time_series.columns:
-                    contribution = time_series.iloc[t]['net_flow']
+        # Contribution/withdrawal per period if available
+        contributions = np.zeros(n_periods)
+        if not time_series.empty and 'net_flow' in time_series.columns:
+            n_flows = min(n_periods, len(time_series))
+            contributions[:n_flows] = time_series['net_flow'].to_numpy(dtype=float)[:n_flows]
 
-            # Update wealth
-            wealth_path[t + 1] = wealth_path[t] * (1 + portfolio_return) + contribution
+        # Step scenarios forward one period at a time, in blocks of rows that
+        # are contiguous in memory and small enough to stay in cache
+        growth = 1 + portfolio_returns
+        for start in range(0, n_scenarios, SIMULATION_BLOCK_SIZE):
+            block_wealth = wealth_paths[start:start + SIMULATION_BLOCK_SIZE]
+            block_growth = growth[start:start + SIMULATION_BLOCK_SIZE]
 
-        terminal_wealth = wealth_path[-1]
+            for t in range(n_periods):
+                np.multiply(block_wealth[:, t], block_growth[:, t], out=block_wealth[:, t + 1])
+                block_wealth[:, t + 1] += contributions[t]
 
-        return wealth_path, terminal_wealth
+        return wealth_paths
 
     def _create_rebalancing_schedule(
         self,
@@ -714,10 +752,11 @@ class PortfolioOptimizer:
         terminal_wealth = simulation_results['terminal_wealth']['wealth'].values
 
         if goal_amount is None:
-            goal_amount = np.median(terminal_wealth)
+            # Median already computed with the simulation statistics
+            goal_amount = simulation_results['statistics']['median_terminal_wealth']
 
-        # Calculate probability of achieving goal
-        probability_of_achieving = (terminal_wealth >= goal_amount).mean()
+        # Calculate probability of achieving goal (empirical, no distribution fit)
+        probability_of_achieving = np.count_nonzero(terminal_wealth >= goal_amount) / terminal_wealth.size
 
         # Expected surplus/deficit
         surplus_deficit = terminal_wealth - goal_amount
@@ -734,6 +773,47 @@ class PortfolioOptimizer:
         }
 
 
+def _lower_tail_risk(values: np.ndarray, tail_probability: float) -> Tuple[float, float]:
+    """
+    Value at risk and conditional value at risk of the lower tail.
+
+    VaR is the ``tail_probability`` quantile with linear interpolation (as
+    ``np.percentile``) and CVaR the mean of the values at or below it. Both
+    come from one O(n) ``np.partition`` instead of repeated percentile calls.
+
+    Args:
+        values: 1-D sample, e.g. terminal wealth per scenario
+        tail_probability: Lower tail probability (0.05 for 95% VaR)
+
+    Returns:
+        Tuple of (VaR, CVaR)
+    """
+    position = (values.size - 1) * tail_probability
+    lo = int(np.floor(position))
+    hi = min(lo + 1, values.size - 1)
+    partitioned = np.partition(values, [lo, hi])
+
+    # Same interpolation as np.percentile's 'linear' method
+    below, above = partitioned[lo], partitioned[hi]
+    t = position - lo
+    if t >= 0.5:
+        var = above - (above - below) * (1 - t)
+    else:
+        var = below + (above - below) * t
+
+    # Only the hi + 1 smallest values can lie at or below VaR, unless it ties
+    # with values further up
+    tail = partitioned[:hi + 1] if var < above else partitioned
+    cvar = tail[tail <= var].mean()
+
+    return float(var), float(cvar)
+
+
+def _optimize_config(config: Dict) -> Dict:
+    """Worker entry point for :meth:`PortfolioOptimizer.optimize_multi`."""
+    return PortfolioOptimizer().optimize(config)
+
+
 # Convenience functions
 def quick_optimize(
     scenarios_df: pd.DataFrame,
@@ -30,7 +30,8 @@ INPUT STRUCTURE:
 OUTPUT STRUCTURE:
 {
     'report': dict,
-    'figures': dict,
+    'figures': dict,                # name -> {'figure', 'path', 'data'}; 'figure' is None
+                                    # unless save_figures or interactive is set
     'tables': dict,
     'executive_summary': dict,
     'interactive_dashboard': dict
@@ -40,8 +41,6 @@ OUTPUT STRUCTURE:
 import numpy as np
 import pandas as pd
 from typing import Dict, List, Optional, Any
-import matplotlib.pyplot as plt
-import matplotlib.colors as mcolors
 from datetime import datetime
 import json
 
@@ -224,40 +223,49 @@ class ReportGenerator:
         else:
             colors = ColorScheme.DEFAULT
 
+        # Figures that are neither saved nor shown are not drawn: each entry
+        # then holds only its data, with 'figure' set to None
+        render = viz_prefs['save_figures'] or viz_prefs['interactive']
+
         # Generate requested charts
         if 'wealth_trajectories' in chart_types:
             figures['wealth_trajectories'] = self._create_wealth_trajectories(
                 config['optimization_results'],
                 colors,
-                viz_prefs
+                viz_prefs,
+                render
             )
 
         if 'efficient_frontier' in chart_types:
             figures['efficient_frontier'] = self._create_efficient_frontier(
                 config['optimization_results'],
                 colors,
-                viz_prefs
+                viz_prefs,
+                render
             )
 
         if 'allocation_pie_chart' in chart_types or 'allocation_pie' in chart_types:
             figures['allocation_pie_chart'] = self._create_allocation_pie(
                 config['optimization_results'],
                 colors,
-                viz_prefs
+                viz_prefs,
+                render
             )
 
         if 'monte_carlo_histogram' in chart_types:
             figures['monte_carlo_histogram'] = self._create_monte_carlo_histogram(
                 config['optimization_results'],
                 colors,
-                viz_prefs
+                viz_prefs,
+                render
             )
 
         if 'tax_impact_waterfall' in chart_types:
             figures['tax_impact_waterfall'] = self._create_tax_impact_waterfall(
                 config['tax_results'],
                 colors,
-                viz_prefs
+                viz_prefs,
+                render
             )
 
         return figures
@@ -266,21 +274,27 @@ class ReportGenerator:
         self,
         optimization_results: Dict,
         colors: Dict,
-        viz_prefs: Dict
+        viz_prefs: Dict,
+        render: bool = True
     ) -> Dict:
         """Create wealth trajectory fan chart."""
         if 'simulation_results' not in optimization_results:
-            return self._create_placeholder_figure("Wealth Trajectories")
+            return self._create_placeholder_figure("Wealth Trajectories", render)
 
         wealth_paths_df = optimization_results['simulation_results'].get('wealth_paths')
         if wealth_paths_df is None or wealth_paths_df.empty:
-            return self._create_placeholder_figure("Wealth Trajectories")
-
-        # Create figure
-        fig, ax = plt.subplots(figsize=(12, 6))
+            return self._create_placeholder_figure("Wealth Trajectories", render)
 
         # Extract wealth paths (exclude scenario_id column)
         wealth_data = wealth_paths_df.drop(columns=['scenario_id'], errors='ignore')
+
+        if not render:
+            return {'figure': None, 'path': 'wealth_trajectories.png', 'data': wealth_data}
+
+        import matplotlib.pyplot as plt
+
+        # Create figure
+        fig, ax = plt.subplots(figsize=(12, 6))
         n_years = wealth_data.shape[1]
         years = np.arange(n_years)
 
@@ -317,15 +331,21 @@ class ReportGenerator:
         self,
         optimization_results: Dict,
         colors: Dict,
-        viz_prefs: Dict
+        viz_prefs: Dict,
+        render: bool = True
     ) -> Dict:
         """Create efficient frontier chart."""
         if 'efficient_frontier' not in optimization_results:
-            return self._create_placeholder_figure("Efficient Frontier")
+            return self._create_placeholder_figure("Efficient Frontier", render)
 
         frontier_df = optimization_results['efficient_frontier']
         if frontier_df.empty:
-            return self._create_placeholder_figure("Efficient Frontier")
+            return self._create_placeholder_figure("Efficient Frontier", render)
+
+        if not render:
+            return {'figure': None, 'path': 'efficient_frontier.png', 'data': frontier_df}
+
+        import matplotlib.pyplot as plt
 
         optimal = optimization_results.get('optimal_portfolio', {})
 
@@ -361,23 +381,33 @@ class ReportGenerator:
         self,
         optimization_results: Dict,
         colors: Dict,
-        viz_prefs: Dict
+        viz_prefs: Dict,
+        render: bool = True
     ) -> Dict:
         """Create allocation pie chart."""
         if 'optimal_portfolio' not in optimization_results:
-            return self._create_placeholder_figure("Asset Allocation")
+            return self._create_placeholder_figure("Asset Allocation", render)
 
         weights = optimization_results['optimal_portfolio'].get('weights', {})
         if not weights:
-            return self._create_placeholder_figure("Asset Allocation")
-
-        # Create figure
-        fig, ax = plt.subplots(figsize=(8, 8))
+            return self._create_placeholder_figure("Asset Allocation", render)
 
         # Get asset names and weights
         assets = list(weights.keys())
         values = list(weights.values())
 
+        if not render:
+            return {
+                'figure': None,
+                'path': 'allocation_pie.png',
+                'data': pd.DataFrame({'asset': assets, 'weight': values})
+            }
+
+        import matplotlib.pyplot as plt
+
+        # Create figure
+        fig, ax = plt.subplots(figsize=(8, 8))
+
         # Assign colors
         asset_colors = []
         for asset in assets:
@@ -421,15 +451,21 @@ class ReportGenerator:
         self,
         optimization_results: Dict,
         colors: Dict,
-        viz_prefs: Dict
+        viz_prefs: Dict,
+        render: bool = True
     ) -> Dict:
         """Create Monte Carlo outcome histogram."""
         if 'simulation_results' not in optimization_results:
-            return self._create_placeholder_figure("Monte Carlo Outcomes")
+            return self._create_placeholder_figure("Monte Carlo Outcomes", render)
 
         terminal_wealth_df = optimization_results['simulation_results'].get('terminal_wealth')
         if terminal_wealth_df is None or terminal_wealth_df.empty:
-            return self._create_placeholder_figure("Monte Carlo Outcomes")
+            return self._create_placeholder_figure("Monte Carlo Outcomes", render)
+
+        if not render:
+            return {'figure': None, 'path': 'monte_carlo_histogram.png', 'data': terminal_wealth_df}
+
+        import matplotlib.pyplot as plt
 
         wealth_values = terminal_wealth_df['wealth'].values
 
@@ -470,17 +506,27 @@ class ReportGenerator:
         self,
         tax_results: Dict,
         colors: Dict,
-        viz_prefs: Dict
+        viz_prefs: Dict,
+        render: bool = True
     ) -> Dict:
         """Create tax impact waterfall chart."""
-        # Placeholder for tax waterfall
-        fig, ax = plt.subplots(figsize=(10, 6))
-
         # Example waterfall data
         categories = ['Gross\nReturn', 'Dividend\nTax', 'Interest\nTax', 'Cap Gains\nTax',
                      'Social\nCharges', 'Net\nReturn']
         values = [100, -5, -8, -3, -4, 80]  # Placeholder values
 
+        if not render:
+            return {
+                'figure': None,
+                'path': 'tax_impact_waterfall.png',
+                'data': pd.DataFrame({'category': categories, 'value': values})
+            }
+
+        import matplotlib.pyplot as plt
+
+        # Placeholder for tax waterfall
+        fig, ax = plt.subplots(figsize=(10, 6))
+
         # Create waterfall effect
         cumulative = 0
         colors_list = []
@@ -509,8 +555,15 @@ class ReportGenerator:
             'data': pd.DataFrame({'category': categories, 'value': values})
         }
 
-    def _create_placeholder_figure(self, title: str) -> Dict:
+    def _create_placeholder_figure(self, title: str, render: bool = True) -> Dict:
         """Create placeholder figure when data is missing."""
+        path = f'{title.lower().replace(" ", "_")}.png'
+
+        if not render:
+            return {'figure': None, 'path': path, 'data': pd.DataFrame()}
+
+        import matplotlib.pyplot as plt
+
         fig, ax = plt.subplots(figsize=(10, 6))
         ax.text(0.5, 0.5, f'{title}\n(Data not available)',
                ha='center', va='center', fontsize=14, color='gray')
@@ -520,7 +573,7 @@ class ReportGenerator:
 
         return {
             'figure': fig,
-            'path': f'{title.lower().replace(" ", "_")}.png',
+            'path': path,
             'data': pd.DataFrame()
         }
 
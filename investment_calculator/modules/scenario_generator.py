@@ -34,6 +34,13 @@ OUTPUT STRUCTURE:
                                    #          'bond_return', 'real_estate_return',
                                    #          'inflation', 'gdp_growth']
 
+    'arrays': dict,                # Same scenario columns as 2-D arrays
+                                   # {'stock_return': (num_scenarios, time_steps), ...}
+
+    'num_scenarios': int,          # Number of scenarios generated
+    'num_periods': int,            # Number of time steps per scenario
+    'timestep': float,             # Time step in years
+
     'deflators': pd.DataFrame,     # Risk-neutral deflators for pricing
                                    # Shape: (num_scenarios, time_steps)
 
@@ -90,17 +97,30 @@ class ScenarioGenerator:
         >>> scenarios_df = results['scenarios']
     """
 
-    def __init__(self, random_seed: Optional[int] = None):
+    def __init__(self, random_seed: Optional[int] = None, device: str = 'cpu'):
         """
         Initialize the Scenario Generator.
 
         Args:
             random_seed: Random seed for reproducibility
+            device: 'cpu' (default) or 'cuda'. With 'cuda', simple-method runs of
+                at least CUDA_MIN_SCENARIOS scenarios simulate their paths on the
+                GPU with Numba (requires numba and a CUDA device); smaller runs
+                and the stochastic method stay on the CPU
         """
+        if device not in ('cpu', 'cuda'):
+            raise ValueError(f"Unknown device '{device}'. Use 'cpu' or 'cuda'")
+        if device == 'cuda':
+            _cuda_backend()
+
         self.random_seed = random_seed
+        self.device = device
         if random_seed is not None:
             np.random.seed(random_seed)
 
+        # Root of the independent per-block streams used by the simple method
+        self._seed_sequence = np.random.SeedSequence(random_seed)
+
         # Default economic parameters (US historical averages)
         self.default_params = {
             'inflation_mean': 0.025,
@@ -143,6 +163,27 @@ class ScenarioGenerator:
         Returns:
             Dictionary with scenarios, deflators, metadata, and diagnostics
         """
+        results = self.generate_arrays(config)
+
+        return {
+            'scenarios': self.to_dataframe(results['arrays'], results['timestep']),
+            **results
+        }
+
+    def generate_arrays(self, config: Dict) -> Dict:
+        """
+        Generate economic scenarios without building the long DataFrame.
+
+        Use this when every consumer works on the (scenarios × periods)
+        arrays; :meth:`to_dataframe` builds the 'scenarios' frame later if
+        it is needed.
+
+        Args:
+            config: Configuration dictionary (see module docstring for structure)
+
+        Returns:
+            Same dictionary as :meth:`generate`, without the 'scenarios' key
+        """
         # Validate and merge config with defaults
         validated_config = self._validate_config(config)
 
@@ -152,6 +193,19 @@ class ScenarioGenerator:
         else:
             return self._generate_simple(validated_config)
 
+    def to_dataframe(self, arrays: Dict[str, np.ndarray], timestep: float = 1.0) -> pd.DataFrame:
+        """
+        Flatten scenario arrays into the long 'scenarios' DataFrame.
+
+        Args:
+            arrays: 'arrays' from :meth:`generate_arrays`
+            timestep: Time step in years, used for the 'time_period' column
+
+        Returns:
+            DataFrame with one row per scenario and period
+        """
+        return _paths_to_dataframe(arrays, timestep)
+
     def _validate_config(self, config: Dict) -> Dict:
         """
         Validate and complete configuration with defaults.
@@ -208,96 +262,36 @@ class ScenarioGenerator:
 
         n_steps = int(time_horizon / timestep)
 
-        # Total number of data points
-        total_points = n_scenarios * n_steps
-
-        # Initialize arrays for all scenarios and time periods
-        scenario_ids = []
-        time_periods = []
-        interest_rates = []
-        stock_returns = []
-        bond_returns = []
-        real_estate_returns = []
-        inflation_rates = []
-        gdp_growth = []
-
-        for scenario_idx in range(n_scenarios):
-            scenario_id = f"scenario_{scenario_idx + 1:04d}"
-
-            # Generate correlated shocks
-            base_shock = np.random.randn(n_steps)
-            inflation_shock = np.random.randn(n_steps)
-            market_shock = np.random.randn(n_steps)
-
-            # Generate time series for this scenario
-            inflation = (
-                params['inflation_mean'] +
-                params['inflation_volatility'] * (0.7 * base_shock + 0.3 * inflation_shock)
-            )
-
-            interest = (
-                params['interest_mean'] +
-                params['interest_volatility'] * (0.5 * base_shock + 0.5 * inflation_shock)
-            )
-
-            stocks = (
-                params['equity_drift'] +
-                params['equity_volatility'] * (0.8 * market_shock + 0.2 * base_shock)
-            )
-
-            bonds = (
-                params['bond_return_mean'] +
-                params['bond_return_std'] * (-0.3 * market_shock + 0.7 * base_shock)
-            )
-
-            real_estate = (
-                params['real_estate_drift'] +
-                params['real_estate_volatility'] * (0.5 * market_shock + 0.5 * base_shock)
-            )
-
-            gdp = (
-                params['gdp_growth_mean'] +
-                params['gdp_growth_std'] * (0.6 * market_shock + 0.4 * base_shock)
-            )
-
-            # Append to lists
-            for step in range(n_steps):
-                scenario_ids.append(scenario_id)
-                time_periods.append((step + 1) * timestep)
-                interest_rates.append(interest[step])
-                stock_returns.append(stocks[step])
-                bond_returns.append(bonds[step])
-                real_estate_returns.append(real_estate[step])
-                inflation_rates.append(inflation[step])
-                gdp_growth.append(gdp[step])
-
-        # Create scenarios DataFrame
-        scenarios_df = pd.DataFrame({
-            'scenario_id': scenario_ids,
-            'time_period': time_periods,
-            'interest_rate': interest_rates,
-            'stock_return': stock_returns,
-            'bond_return': bond_returns,
-            'real_estate_return': real_estate_returns,
-            'inflation': inflation_rates,
-            'gdp_growth': gdp_growth
-        })
+        if self.device == 'cuda' and n_scenarios >= CUDA_MIN_SCENARIOS:
+            paths = self._simulate_simple_paths_cuda(n_scenarios, n_steps, params)
+        else:
+            # Draw each block's (base, inflation, market) shocks in one call from
+            # its own child stream, so a block's scenarios do not depend on the
+            # order or process the blocks are generated in; blocking also bounds
+            # the shock buffer however many scenarios are requested
+            paths = {col: np.empty((n_scenarios, n_steps)) for col in SCENARIO_COLUMNS}
+            block_starts = range(0, n_scenarios, GENERATION_BLOCK_SIZE)
+            block_seeds = self._seed_sequence.spawn(len(block_starts))
+
+            for start, seed in zip(block_starts, block_seeds):
+                stop = min(start + GENERATION_BLOCK_SIZE, n_scenarios)
+                rng = np.random.default_rng(seed)
+                shocks = rng.standard_normal((stop - start, 3, n_steps))
+
+                for col, values in _simulate_simple_paths(shocks, params).items():
+                    paths[col][start:stop] = values
 
         # Create deflators (simple discount factors)
-        deflators_array = np.zeros((n_scenarios, n_steps))
-        for i in range(n_scenarios):
-            scenario_data = scenarios_df[scenarios_df['scenario_id'] == f"scenario_{i+1:04d}"]
-            rates = scenario_data['interest_rate'].values
-            deflators_array[i, :] = np.exp(-np.cumsum(rates * timestep))
+        deflators_array = np.exp(-np.cumsum(paths['interest_rate'] * timestep, axis=1))
 
         deflators_df = pd.DataFrame(
             deflators_array,
             columns=[f"t_{i+1}" for i in range(n_steps)]
         )
-        deflators_df.insert(0, 'scenario_id', [f"scenario_{i+1:04d}" for i in range(n_scenarios)])
+        deflators_df.insert(0, 'scenario_id', _scenario_ids(n_scenarios))
 
         # Calculate diagnostics
-        diagnostics = self._calculate_diagnostics(scenarios_df, method='simple')
+        diagnostics = self._calculate_diagnostics(paths, 'simple', n_scenarios, n_steps)
 
         # Metadata
         metadata = {
@@ -315,12 +309,46 @@ class ScenarioGenerator:
         }
 
         return {
-            'scenarios': scenarios_df,
+            'arrays': paths,
+            'num_scenarios': n_scenarios,
+            'num_periods': n_steps,
+            'timestep': timestep,
             'deflators': deflators_df,
             'metadata': metadata,
             'diagnostics': diagnostics
         }
 
+    def _simulate_simple_paths_cuda(self, n_scenarios: int, n_steps: int,
+                                    params: Dict) -> Dict[str, np.ndarray]:
+        """
+        Simulate simple-method paths on the GPU, one CUDA thread per scenario.
+
+        The GPU draws come from Numba's xoroshiro128p generator seeded from the
+        generator's own seed sequence, so seeded runs are reproducible on the
+        GPU but do not match the CPU paths.
+
+        Args:
+            n_scenarios: Number of scenarios
+            n_steps: Time steps per scenario
+            params: Economic parameters
+
+        Returns:
+            Dictionary mapping each scenario column to an (n_scenarios, n_steps) array
+        """
+        cuda, create_states = _cuda_backend()
+        kernel = _simple_paths_kernel()
+
+        seed = int(self._seed_sequence.spawn(1)[0].generate_state(1, np.uint64)[0])
+        rng_states = create_states(n_scenarios, seed=seed)
+        d_coefficients = cuda.to_device(_simple_path_coefficients(params))
+        d_out = cuda.device_array((len(SCENARIO_COLUMNS), n_scenarios, n_steps))
+
+        blocks = (n_scenarios + CUDA_THREADS_PER_BLOCK - 1) // CUDA_THREADS_PER_BLOCK
+        kernel[blocks, CUDA_THREADS_PER_BLOCK](rng_states, d_coefficients, d_out)
+
+        out = d_out.copy_to_host()
+        return {col: out[k] for k, col in enumerate(SCENARIO_COLUMNS)}
+
     def _generate_stochastic(self, config: Dict) -> Dict:
         """
         Generate scenarios using advanced stochastic models.
@@ -421,49 +449,25 @@ class ScenarioGenerator:
             0.6 * equity_shocks + 0.4 * (hw_results['residuals'] / params['hw_volatility'])
         )
 
-        # Step 9: Assemble into DataFrame
-        scenario_ids = []
-        time_periods = []
-        interest_rates_list = []
-        stock_returns_list = []
-        bond_returns_list = []
-        real_estate_returns_list = []
-        inflation_rates_list = []
-        gdp_growth_list = []
-
-        for scenario_idx in range(n_scenarios):
-            scenario_id = f"scenario_{scenario_idx + 1:04d}"
-
-            for step in range(n_steps):
-                scenario_ids.append(scenario_id)
-                time_periods.append((step + 1) * dt)
-                interest_rates_list.append(hw_results['Rt'][scenario_idx, step])
-                stock_returns_list.append(equity_results['total_returns'][scenario_idx, step])
-                bond_returns_list.append(bond_returns[scenario_idx, step])
-                real_estate_returns_list.append(re_results['total_returns'][scenario_idx, step])
-                inflation_rates_list.append(inflation_rates[scenario_idx, step])
-                gdp_growth_list.append(gdp_growth[scenario_idx, step])
-
-        scenarios_df = pd.DataFrame({
-            'scenario_id': scenario_ids,
-            'time_period': time_periods,
-            'interest_rate': interest_rates_list,
-            'stock_return': stock_returns_list,
-            'bond_return': bond_returns_list,
-            'real_estate_return': real_estate_returns_list,
-            'inflation': inflation_rates_list,
-            'gdp_growth': gdp_growth_list
-        })
+        # Step 9: Collect the (n_scenarios, n_steps) paths
+        paths = {
+            'interest_rate': hw_results['Rt'],
+            'stock_return': equity_results['total_returns'],
+            'bond_return': bond_returns,
+            'real_estate_return': re_results['total_returns'],
+            'inflation': inflation_rates,
+            'gdp_growth': gdp_growth
+        }
 
         # Create deflators DataFrame
         deflators_df = pd.DataFrame(
             hw_results['deflators'],
             columns=[f"t_{i+1}" for i in range(n_steps)]
         )
-        deflators_df.insert(0, 'scenario_id', [f"scenario_{i+1:04d}" for i in range(n_scenarios)])
+        deflators_df.insert(0, 'scenario_id', _scenario_ids(n_scenarios))
 
         # Calculate diagnostics
-        diagnostics = self._calculate_diagnostics(scenarios_df, method='stochastic')
+        diagnostics = self._calculate_diagnostics(paths, 'stochastic', n_scenarios, n_steps)
         diagnostics['martingale_test'] = self._test_martingale(hw_results['deflators'], hw_results['Rt'], dt)
 
         # Metadata
@@ -485,7 +489,10 @@ class ScenarioGenerator:
         }
 
         return {
-            'scenarios': scenarios_df,
+            'arrays': paths,
+            'num_scenarios': n_scenarios,
+            'num_periods': n_steps,
+            'timestep': dt,
             'deflators': deflators_df,
             'metadata': metadata,
             'diagnostics': diagnostics
@@ -519,13 +526,21 @@ class ScenarioGenerator:
 
         return spot_rates
 
-    def _calculate_diagnostics(self, scenarios_df: pd.DataFrame, method: str) -> Dict:
+    def _calculate_diagnostics(
+        self,
+        paths: Dict[str, np.ndarray],
+        method: str,
+        num_scenarios: int,
+        num_time_periods: int
+    ) -> Dict:
         """
         Calculate diagnostic statistics for generated scenarios.
 
         Args:
-            scenarios_df: Scenarios DataFrame
+            paths: Scenario arrays, one (n_scenarios, n_steps) array per column
             method: Generation method ('simple' or 'stochastic')
+            num_scenarios: Number of scenarios generated
+            num_time_periods: Number of time steps per scenario
 
         Returns:
             Dictionary of diagnostic metrics
@@ -534,22 +549,26 @@ class ScenarioGenerator:
         asset_columns = ['interest_rate', 'stock_return', 'bond_return',
                         'real_estate_return', 'inflation', 'gdp_growth']
 
+        # Pooled values of every scenario and period, one column per asset class
+        values = pd.DataFrame({col: np.asarray(paths[col], dtype=float).ravel()
+                               for col in asset_columns})
+
         mean_returns = {}
         volatilities = {}
 
         for col in asset_columns:
-            mean_returns[col] = float(scenarios_df[col].mean())
-            volatilities[col] = float(scenarios_df[col].std())
+            mean_returns[col] = float(values[col].mean())
+            volatilities[col] = float(values[col].std())
 
         # Calculate realized correlations
-        corr_matrix = scenarios_df[asset_columns].corr()
+        corr_matrix = values.corr()
 
         return {
             'mean_returns': mean_returns,
             'volatilities': volatilities,
             'correlations': corr_matrix,
-            'num_scenarios': scenarios_df['scenario_id'].nunique(),
-            'num_time_periods': len(scenarios_df['time_period'].unique()),
+            'num_scenarios': num_scenarios,
+            'num_time_periods': num_time_periods,
             'method': method
         }
 
@@ -593,6 +612,195 @@ class ScenarioGenerator:
         }
 
 
+# Scenarios simulated together by the simple method; 4096 annual paths of
+# 30 years need ~3 MB of shocks
+GENERATION_BLOCK_SIZE = 4096
+
+# Smallest simple-method run sent to the GPU with device='cuda'; below this the
+# transfer and kernel launch cost more than the CPU path
+CUDA_MIN_SCENARIOS = 10_000
+CUDA_THREADS_PER_BLOCK = 256
+
+SCENARIO_COLUMNS = ['interest_rate', 'stock_return', 'bond_return',
+                    'real_estate_return', 'inflation', 'gdp_growth']
+
+# (mean key, volatility key, base weight, inflation weight, market weight) of
+# each column, in SCENARIO_COLUMNS order; the same mix as _simulate_simple_paths
+_SIMPLE_PATH_WEIGHTS = [
+    ('interest_mean', 'interest_volatility', 0.5, 0.5, 0.0),
+    ('equity_drift', 'equity_volatility', 0.2, 0.0, 0.8),
+    ('bond_return_mean', 'bond_return_std', 0.7, 0.0, -0.3),
+    ('real_estate_drift', 'real_estate_volatility', 0.5, 0.0, 0.5),
+    ('inflation_mean', 'inflation_volatility', 0.7, 0.3, 0.0),
+    ('gdp_growth_mean', 'gdp_growth_std', 0.4, 0.0, 0.6),
+]
+
+_SIMPLE_PATHS_KERNEL = None
+
+
+def _cuda_backend():
+    """Numba's CUDA module and RNG state factory, imported on first use."""
+    try:
+        from numba import cuda
+        from numba.cuda.random import create_xoroshiro128p_states
+    except ImportError as exc:
+        raise ImportError("device='cuda' requires numba to be installed") from exc
+
+    if not cuda.is_available():
+        raise RuntimeError("device='cuda' requires a CUDA-capable GPU")
+    return cuda, create_xoroshiro128p_states
+
+
+def _simple_path_coefficients(params: Dict) -> np.ndarray:
+    """(len(SCENARIO_COLUMNS), 5) array of mean, volatility and shock weights."""
+    return np.array([
+        [params[mean_key], params[vol_key], w_base, w_inflation, w_market]
+        for mean_key, vol_key, w_base, w_inflation, w_market in _SIMPLE_PATH_WEIGHTS
+    ])
+
+
+def _simple_paths_kernel():
+    """Compile the simple-method CUDA kernel on first use."""
+    global _SIMPLE_PATHS_KERNEL
+    if _SIMPLE_PATHS_KERNEL is None:
+        cuda, _ = _cuda_backend()
+        from numba.cuda.random import xoroshiro128p_normal_float64
+
+        @cuda.jit
+        def simulate_paths_gpu(rng_states, coefficients, out):
+            scenario = cuda.grid(1)
+            if scenario >= out.shape[1]:
+                return
+            for t in range(out.shape[2]):
+                base = xoroshiro128p_normal_float64(rng_states, scenario)
+                inflation = xoroshiro128p_normal_float64(rng_states, scenario)
+                market = xoroshiro128p_normal_float64(rng_states, scenario)
+                for k in range(out.shape[0]):
+                    out[k, scenario, t] = coefficients[k, 0] + coefficients[k, 1] * (
+                        coefficients[k, 2] * base
+                        + coefficients[k, 3] * inflation
+                        + coefficients[k, 4] * market
+                    )
+
+        _SIMPLE_PATHS_KERNEL = simulate_paths_gpu
+    return _SIMPLE_PATHS_KERNEL
+
+
+def _scenario_ids(n_scenarios: int) -> np.ndarray:
+    """Scenario labels 'scenario_0001', 'scenario_0002', ..."""
+    return np.array([f"scenario_{i + 1:04d}" for i in range(n_scenarios)], dtype=object)
+
+
+def _simulate_simple_paths(shocks: np.ndarray, params: Dict) -> Dict[str, np.ndarray]:
+    """
+    Build correlated-normal paths for all scenarios at once.
+
+    Args:
+        shocks: Standard normal draws of shape (n_scenarios, 3, n_steps),
+            holding the base, inflation and market shocks of each scenario
+        params: Economic parameters
+
+    Returns:
+        Dictionary mapping each scenario column to an (n_scenarios, n_steps) array
+    """
+    base_shock = shocks[:, 0, :]
+    inflation_shock = shocks[:, 1, :]
+    market_shock = shocks[:, 2, :]
+
+    def combine(mean, vol, x, wx, y, wy):
+        return mean + vol * (wx * x + wy * y)
+
+    return {
+        'interest_rate': combine(params['interest_mean'], params['interest_volatility'],
+                                 base_shock, 0.5, inflation_shock, 0.5),
+        'stock_return': combine(params['equity_drift'], params['equity_volatility'],
+                                market_shock, 0.8, base_shock, 0.2),
+        'bond_return': combine(params['bond_return_mean'], params['bond_return_std'],
+                               market_shock, -0.3, base_shock, 0.7),
+        'real_estate_return': combine(params['real_estate_drift'], params['real_estate_volatility'],
+                                      market_shock, 0.5, base_shock, 0.5),
+        'inflation': combine(params['inflation_mean'], params['inflation_volatility'],
+                             base_shock, 0.7, inflation_shock, 0.3),
+        'gdp_growth': combine(params['gdp_growth_mean'], params['gdp_growth_std'],
+                              market_shock, 0.6, base_shock, 0.4)
+    }
+
+
+def _paths_to_dataframe(paths: Dict[str, np.ndarray], timestep: float) -> pd.DataFrame:
+    """
+    Flatten (n_scenarios, n_steps) paths into the long scenarios DataFrame.
+
+    Rows are ordered by scenario, then by time period.
+    """
+    n_scenarios, n_steps = paths[SCENARIO_COLUMNS[0]].shape
+
+    columns = {
+        'scenario_id': np.repeat(_scenario_ids(n_scenarios), n_steps),
+        'time_period': np.tile((np.arange(n_steps) + 1) * timestep, n_scenarios)
+    }
+    for col in SCENARIO_COLUMNS:
+        columns[col] = np.asarray(paths[col], dtype=float).ravel()
+
+    return pd.DataFrame(columns)
+
+
+def group_by_scenario(scenarios_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Order a long scenarios DataFrame so each scenario's rows are contiguous.
+
+    Scenarios keep the order of first appearance of their scenario_id and
+    each scenario keeps its own row order. Frames that are already grouped
+    (such as ScenarioGenerator output) are returned unchanged.
+
+    Args:
+        scenarios_df: Long-format scenarios (one row per scenario and period)
+
+    Returns:
+        DataFrame grouped by scenario, with the original index labels
+    """
+    codes = pd.factorize(scenarios_df['scenario_id'])[0]
+
+    # Codes count up in order of first appearance, so grouped rows never decrease
+    if not (np.diff(codes) < 0).any():
+        return scenarios_df
+
+    return scenarios_df.iloc[np.argsort(codes, kind='stable')]
+
+
+def scenarios_to_arrays(scenarios_df: pd.DataFrame,
+                        columns: Optional[list] = None) -> Dict[str, np.ndarray]:
+    """
+    Reshape a long scenarios DataFrame into (n_scenarios, n_steps) arrays.
+
+    Rows are taken in group_by_scenario() order, so a DataFrame produced by
+    ScenarioGenerator maps back onto its 'arrays' exactly.
+
+    Args:
+        scenarios_df: Long-format scenarios (one row per scenario and period)
+        columns: Columns to reshape (default: all numeric columns)
+
+    Returns:
+        Dictionary mapping each column to an (n_scenarios, n_steps) array
+    """
+    if columns is None:
+        columns = [col for col in scenarios_df.select_dtypes('number').columns
+                   if col != 'time_period']
+
+    scenarios_df = group_by_scenario(scenarios_df)
+
+    counts = scenarios_df['scenario_id'].value_counts(sort=False).to_numpy()
+    n_scenarios = len(counts)
+
+    if n_scenarios and (counts != counts[0]).any():
+        raise ValueError("All scenarios must have the same number of time periods")
+    n_steps = counts[0] if n_scenarios else 0
+
+    return {
+        col: scenarios_df[col].to_numpy(dtype=float).reshape(n_scenarios, n_steps)
+        for col in columns
+    }
+
+
 # Convenience functions for backward compatibility
 def generate_scenarios(config: Dict, random_seed: Optional[int] = None) -> Dict:
     """
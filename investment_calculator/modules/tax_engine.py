@@ -6,6 +6,8 @@ This module applies tax treatment to economic scenarios based on account types a
 INPUT STRUCTURE:
 {
     'scenarios': pd.DataFrame,      # From Module 1
+    'scenario_arrays': dict,        # Optional: 'arrays' from Module 1, matching
+                                   # 'scenarios' (derived from it if omitted)
 
     'tax_config': {
         'jurisdiction': str,        # Country code (e.g., 'FR', 'US', 'UK')
@@ -45,6 +47,9 @@ OUTPUT STRUCTURE:
     'after_tax_scenarios': pd.DataFrame,  # Same structure as scenarios but after-tax
                                          # Columns include original + '_after_tax' versions
 
+    'after_tax_arrays': dict,             # '_after_tax' columns and 'annual_tax_drag'
+                                         # as (num_scenarios, time_steps) arrays
+
     'tax_tables': {
         'annual_tax_by_account': pd.DataFrame,  # Annual taxes paid per account type
         'cumulative_tax': pd.DataFrame,         # Cumulative tax burden over time
@@ -69,10 +74,17 @@ OUTPUT STRUCTURE:
 
 import numpy as np
 import pandas as pd
-from typing import Dict, Optional, List, Tuple
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, List, Tuple
 from enum import Enum
 from dataclasses import dataclass
 
+from investment_calculator.modules.scenario_generator import (
+    SCENARIO_COLUMNS,
+    group_by_scenario,
+    scenarios_to_arrays
+)
+
 
 class AccountType(Enum):
     """Types of investment accounts"""
@@ -90,111 +102,194 @@ class TaxJurisdiction(Enum):
     CA = "CA"
 
 
+def _freeze(value):
+    """Recursively wrap dictionaries in read-only mapping proxies."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    return value
+
+
+def _thaw(value):
+    """Recursively copy read-only mapping proxies back into plain dictionaries."""
+    if isinstance(value, Mapping):
+        return {key: _thaw(item) for key, item in value.items()}
+    return value
+
+
+# Preset registry, built once at import and shared read-only by every caller
+_PRESETS = _freeze({
+    'US': {
+        'jurisdiction': 'US',
+        'account_types': {
+            'taxable': {
+                'income_tax_rate': 0.25,
+                'capital_gains_rate': 0.15,
+                'dividend_tax_rate': 0.15,
+                'interest_tax_rate': 0.25,
+                'state_tax': 0.05
+            },
+            'tax_deferred': {
+                'contribution_deduction': True,
+                'withdrawal_tax_rate': 0.25,
+                'early_withdrawal_penalty': 0.10,
+                'age_limit': 59.5
+            },
+            'tax_free': {
+                'contribution_limit': 6500,
+                'age_restrictions': {'min_age_5_years': True},
+                'early_withdrawal_penalty': 0.10
+            }
+        },
+        'social_charges': 0.0765,  # Social Security + Medicare
+        'wealth_tax': {
+            'enabled': False,
+            'threshold': 0,
+            'rate': 0.0
+        }
+    },
+    'FR': {
+        'jurisdiction': 'FR',
+        'account_types': {
+            'taxable': {
+                'income_tax_rate': 0.30,
+                'capital_gains_rate': 0.30,  # PFU (flat tax)
+                'dividend_tax_rate': 0.30,
+                'interest_tax_rate': 0.30
+            },
+            'tax_deferred': {
+                'contribution_deduction': False,
+                'withdrawal_tax_rate': 0.30,
+                'early_withdrawal_penalty': 0.0
+            },
+            'tax_free': {
+                'contribution_limit': float('inf'),  # PEA has no annual limit
+                'age_restrictions': {'min_holding_5_years': True},
+                'early_withdrawal_penalty': 0.225
+            }
+        },
+        'social_charges': 0.172,  # Prélèvements sociaux
+        'wealth_tax': {
+            'enabled': True,
+            'threshold': 1_300_000,
+            'rate': 0.005  # Simplified average IFI rate
+        }
+    },
+    'UK': {
+        'jurisdiction': 'UK',
+        'account_types': {
+            'taxable': {
+                'income_tax_rate': 0.40,
+                'capital_gains_rate': 0.20,
+                'dividend_tax_rate': 0.3375,
+                'interest_tax_rate': 0.40
+            },
+            'tax_deferred': {
+                'contribution_deduction': True,
+                'withdrawal_tax_rate': 0.40,
+                'early_withdrawal_penalty': 0.0
+            },
+            'tax_free': {
+                'contribution_limit': 20000,  # ISA limit
+                'age_restrictions': {},
+                'early_withdrawal_penalty': 0.0
+            }
+        },
+        'social_charges': 0.12,  # National Insurance
+        'wealth_tax': {
+            'enabled': False,
+            'threshold': 0,
+            'rate': 0.0
+        }
+    }
+})
+
+
 @dataclass
 class TaxConfigPreset:
     """Pre-configured tax settings for major jurisdictions"""
 
     @staticmethod
-    def get_preset(jurisdiction: str) -> Dict:
+    def get_preset(jurisdiction: str) -> Mapping:
         """
         Get preset tax configuration for a jurisdiction.
 
+        Presets are shared and read-only at every level, so they cannot be
+        copied or pickled directly; use copy_preset() to customise one.
+
         Args:
             jurisdiction: Country code
 
         Returns:
-            Tax configuration dictionary
+            Tax configuration mapping
         """
-        presets = {
-            'US': {
-                'jurisdiction': 'US',
-                'account_types': {
-                    'taxable': {
-                        'income_tax_rate': 0.25,
-                        'capital_gains_rate': 0.15,
-                        'dividend_tax_rate': 0.15,
-                        'interest_tax_rate': 0.25,
-                        'state_tax': 0.05
-                    },
-                    'tax_deferred': {
-                        'contribution_deduction': True,
-                        'withdrawal_tax_rate': 0.25,
-                        'early_withdrawal_penalty': 0.10,
-                        'age_limit': 59.5
-                    },
-                    'tax_free': {
-                        'contribution_limit': 6500,
-                        'age_restrictions': {'min_age_5_years': True},
-                        'early_withdrawal_penalty': 0.10
-                    }
-                },
-                'social_charges': 0.0765,  # Social Security + Medicare
-                'wealth_tax': {
-                    'enabled': False,
-                    'threshold': 0,
-                    'rate': 0.0
-                }
-            },
-            'FR': {
-                'jurisdiction': 'FR',
-                'account_types': {
-                    'taxable': {
-                        'income_tax_rate': 0.30,
-                        'capital_gains_rate': 0.30,  # PFU (flat tax)
-                        'dividend_tax_rate': 0.30,
-                        'interest_tax_rate': 0.30
-                    },
-                    'tax_deferred': {
-                        'contribution_deduction': False,
-                        'withdrawal_tax_rate': 0.30,
-                        'early_withdrawal_penalty': 0.0
-                    },
-                    'tax_free': {
-                        'contribution_limit': float('inf'),  # PEA has no annual limit
-                        'age_restrictions': {'min_holding_5_years': True},
-                        'early_withdrawal_penalty': 0.225
-                    }
-                },
-                'social_charges': 0.172,  # Prélèvements sociaux
-                'wealth_tax': {
-                    'enabled': True,
-                    'threshold': 1_300_000,
-                    'rate': 0.005  # Simplified average IFI rate
-                }
-            },
-            'UK': {
-                'jurisdiction': 'UK',
-                'account_types': {
-                    'taxable': {
-                        'income_tax_rate': 0.40,
-                        'capital_gains_rate': 0.20,
-                        'dividend_tax_rate': 0.3375,
-                        'interest_tax_rate': 0.40
-                    },
-                    'tax_deferred': {
-                        'contribution_deduction': True,
-                        'withdrawal_tax_rate': 0.40,
-                        'early_withdrawal_penalty': 0.0
-                    },
-                    'tax_free': {
-                        'contribution_limit': 20000,  # ISA limit
-                        'age_restrictions': {},
-                        'early_withdrawal_penalty': 0.0
-                    }
-                },
-                'social_charges': 0.12,  # National Insurance
-                'wealth_tax': {
-                    'enabled': False,
-                    'threshold': 0,
-                    'rate': 0.0
-                }
-            }
-        }
+        if jurisdiction not in _PRESETS:
+            raise ValueError(f"Unknown jurisdiction: {jurisdiction}. Supported: {list(_PRESETS.keys())}")
+
+        return _PRESETS[jurisdiction]
+
+    @staticmethod
+    def copy_preset(jurisdiction: str) -> Dict:
+        """
+        Get a mutable deep copy of a jurisdiction's preset.
+
+        Args:
+            jurisdiction: Country code
+
+        Returns:
+            Tax configuration as nested plain dictionaries
+        """
+        return _thaw(TaxConfigPreset.get_preset(jurisdiction))
+
+
+def _blend_account_returns(
+    returns: np.ndarray,
+    account_allocation: Dict,
+    taxable_factor,
+    out: np.ndarray,
+    scratch: np.ndarray
+) -> np.ndarray:
+    """
+    Weight returns across account types, writing into preallocated arrays.
+
+    Computes returns * taxable * taxable_factor + returns * tax_deferred
+    + returns * tax_free, where only the taxable share is reduced by tax.
+
+    Args:
+        returns: Pre-tax returns
+        account_allocation: Share held in each account type
+        taxable_factor: Fraction of the taxable return kept after tax
+            (scalar, or an array which may be the scratch buffer itself)
+        out: Output array
+        scratch: Work buffer, overwritten
 
-        if jurisdiction not in presets:
-            raise ValueError(f"Unknown jurisdiction: {jurisdiction}. Supported: {list(presets.keys())}")
+    Returns:
+        out
+    """
+    np.multiply(returns, account_allocation['taxable'], out=out)
+    out *= taxable_factor
+    np.multiply(returns, account_allocation['tax_deferred'], out=scratch)  # No annual tax
+    out += scratch
+    np.multiply(returns, account_allocation['tax_free'], out=scratch)  # No tax
+    out += scratch
+    return out
 
-        return presets[jurisdiction]
+
+def _after_tax_multiplier(account_allocation: Dict, taxable_factor: float) -> float:
+    """
+    Fraction of a return kept after tax when only the taxable share is taxed.
+
+    Args:
+        account_allocation: Share held in each account type
+        taxable_factor: Fraction of the taxable return kept after tax
+
+    Returns:
+        Scalar multiplier for the pre-tax return
+    """
+    return (
+        account_allocation['taxable'] * taxable_factor +
+        account_allocation['tax_deferred'] +  # No annual tax
+        account_allocation['tax_free']  # No tax
+    )
 
 
 class TaxEngine:
@@ -236,23 +331,38 @@ class TaxEngine:
         # Validate configuration
         validated_config = self._validate_config(config)
 
-        scenarios_df = validated_config['scenarios']
+        scenarios_df = group_by_scenario(validated_config['scenarios'])
         tax_config = validated_config['tax_config']
         allocation = validated_config['investment_allocation']
 
+        # Work on (scenarios × periods) arrays rather than the long DataFrame
+        scenario_arrays = validated_config.get('scenario_arrays')
+        if scenario_arrays is None:
+            scenario_arrays = scenarios_to_arrays(scenarios_df, SCENARIO_COLUMNS)
+
+        # Rows are grouped into equal-length scenarios, so the labels can be
+        # read off by stride instead of hashing the whole column
+        n_steps = scenario_arrays['stock_return'].shape[1]
+        scenario_ids = scenarios_df['scenario_id'].to_numpy()[::n_steps] if n_steps else np.array([], dtype=object)
+        time_periods = scenarios_df['time_period'].to_numpy()[:n_steps]
+
         # Calculate after-tax returns for each account type
+        after_tax_arrays = self._calculate_after_tax_arrays(
+            scenario_arrays, tax_config, allocation
+        )
+
         after_tax_scenarios = self._calculate_after_tax_scenarios(
-            scenarios_df, tax_config, allocation
+            scenarios_df, after_tax_arrays
         )
 
         # Calculate tax tables
         tax_tables = self._calculate_tax_tables(
-            scenarios_df, after_tax_scenarios, tax_config, allocation
+            scenarios_df, scenario_ids, scenario_arrays, after_tax_arrays
         )
 
         # Simulate account balances
         account_balances = self._simulate_account_balances(
-            after_tax_scenarios, allocation, tax_config
+            scenario_ids, time_periods, allocation, tax_config
         )
 
         # Generate optimization insights
@@ -262,6 +372,7 @@ class TaxEngine:
 
         return {
             'after_tax_scenarios': after_tax_scenarios,
+            'after_tax_arrays': after_tax_arrays,
             'tax_tables': tax_tables,
             'account_balances': account_balances,
             'optimization_insights': insights
@@ -294,25 +405,32 @@ class TaxEngine:
 
         return config
 
-    def _calculate_after_tax_scenarios(
+    def _calculate_after_tax_arrays(
         self,
-        scenarios_df: pd.DataFrame,
+        scenario_arrays: Dict[str, np.ndarray],
         tax_config: Dict,
         allocation: Dict
-    ) -> pd.DataFrame:
+    ) -> Dict[str, np.ndarray]:
         """
         Calculate after-tax returns for all scenarios.
 
         Args:
-            scenarios_df: Economic scenarios from Module 1
+            scenario_arrays: Economic scenarios from Module 1 as
+                (n_scenarios, n_steps) arrays
             tax_config: Tax configuration
             allocation: Asset allocation across account types
 
         Returns:
-            DataFrame with after-tax return columns added
+            Dictionary of after-tax return arrays and the annual tax drag
         """
-        # Create a copy
-        result_df = scenarios_df.copy()
+        stock_return = scenario_arrays['stock_return']
+        bond_return = scenario_arrays['bond_return']
+        re_return = scenario_arrays['real_estate_return']
+
+        # Outputs are preallocated and every intermediate goes through one
+        # scratch buffer, shared across asset classes
+        shape = stock_return.shape
+        scratch = np.empty(shape)
 
         # Get tax rates for different account types
         taxable_config = tax_config['account_types']['taxable']
@@ -329,29 +447,27 @@ class TaxEngine:
         dividend_tax = taxable_config['dividend_tax_rate'] + social_charges
         stock_taxable_drag = dividend_yield * dividend_tax
 
-        # Weighted after-tax stock return
-        stock_after_tax = (
-            scenarios_df['stock_return'] * stock_allocation['taxable'] * (1 - stock_taxable_drag / scenarios_df['stock_return'].clip(lower=0.01)) +
-            scenarios_df['stock_return'] * stock_allocation['tax_deferred'] +  # No annual tax
-            scenarios_df['stock_return'] * stock_allocation['tax_free']  # No tax
+        # Weighted after-tax stock return; the taxable factor
+        # 1 - drag / max(return, 1%) is built in the scratch buffer
+        np.maximum(stock_return, 0.01, out=scratch)
+        np.divide(stock_taxable_drag, scratch, out=scratch)
+        np.subtract(1, scratch, out=scratch)
+        stock_after_tax = _blend_account_returns(
+            stock_return, stock_allocation, scratch, np.empty(shape), scratch
         )
 
-        result_df['stock_return_after_tax'] = stock_after_tax
-
         # 2. BONDS
         bond_allocation = allocation.get('bonds', {'taxable': 1.0, 'tax_deferred': 0.0, 'tax_free': 0.0})
 
         # Taxable: interest taxed as ordinary income
         interest_tax = taxable_config['interest_tax_rate'] + social_charges
 
-        bond_after_tax = (
-            scenarios_df['bond_return'] * bond_allocation['taxable'] * (1 - interest_tax) +
-            scenarios_df['bond_return'] * bond_allocation['tax_deferred'] +
-            scenarios_df['bond_return'] * bond_allocation['tax_free']
+        # The tax is proportional to the return, so the rates and account
+        # shares fold into one multiplier applied in a single pass
+        bond_after_tax = np.multiply(
+            bond_return, _after_tax_multiplier(bond_allocation, 1 - interest_tax)
         )
 
-        result_df['bond_return_after_tax'] = bond_after_tax
-
         # 3. REAL ESTATE
         re_allocation = allocation.get('real_estate', {'taxable': 1.0, 'tax_deferred': 0.0, 'tax_free': 0.0})
 
@@ -366,123 +482,121 @@ class TaxEngine:
             appreciation_portion * appreciation_tax
         )
 
-        re_after_tax = (
-            scenarios_df['real_estate_return'] * re_allocation['taxable'] * (1 - re_taxable_drag) +
-            scenarios_df['real_estate_return'] * re_allocation['tax_deferred'] +
-            scenarios_df['real_estate_return'] * re_allocation['tax_free']
+        re_after_tax = np.multiply(
+            re_return, _after_tax_multiplier(re_allocation, 1 - re_taxable_drag)
         )
 
-        result_df['real_estate_return_after_tax'] = re_after_tax
+        # Tax drag per scenario and period
+        annual_tax_drag = np.subtract(stock_return, stock_after_tax, out=np.empty(shape))
+        np.subtract(bond_return, bond_after_tax, out=scratch)
+        annual_tax_drag += scratch
+        np.subtract(re_return, re_after_tax, out=scratch)
+        annual_tax_drag += scratch
 
-        # 4. INTEREST RATE AND INFLATION (not taxed directly)
-        result_df['interest_rate_after_tax'] = scenarios_df['interest_rate']
-        result_df['inflation_after_tax'] = scenarios_df['inflation']
-        result_df['gdp_growth_after_tax'] = scenarios_df['gdp_growth']
+        return {
+            'stock_return_after_tax': stock_after_tax,
+            'bond_return_after_tax': bond_after_tax,
+            'real_estate_return_after_tax': re_after_tax,
+            # 4. INTEREST RATE AND INFLATION (not taxed directly)
+            'interest_rate_after_tax': scenario_arrays['interest_rate'],
+            'inflation_after_tax': scenario_arrays['inflation'],
+            'gdp_growth_after_tax': scenario_arrays['gdp_growth'],
+            'annual_tax_drag': annual_tax_drag
+        }
 
-        # Calculate tax drag per row
-        stock_drag = scenarios_df['stock_return'] - result_df['stock_return_after_tax']
-        bond_drag = scenarios_df['bond_return'] - result_df['bond_return_after_tax']
-        re_drag = scenarios_df['real_estate_return'] - result_df['real_estate_return_after_tax']
+    def _calculate_after_tax_scenarios(
+        self,
+        scenarios_df: pd.DataFrame,
+        after_tax_arrays: Dict[str, np.ndarray]
+    ) -> pd.DataFrame:
+        """
+        Add after-tax columns to the long scenarios DataFrame.
 
-        result_df['annual_tax_drag'] = stock_drag + bond_drag + re_drag
+        Args:
+            scenarios_df: Economic scenarios from Module 1, grouped by scenario
+            after_tax_arrays: After-tax arrays from _calculate_after_tax_arrays
+
+        Returns:
+            DataFrame with after-tax return columns added
+        """
+        result_df = scenarios_df.copy()
+
+        for col, values in after_tax_arrays.items():
+            result_df[col] = values.ravel()
 
         return result_df
 
     def _calculate_tax_tables(
         self,
         pre_tax_df: pd.DataFrame,
-        after_tax_df: pd.DataFrame,
-        tax_config: Dict,
-        allocation: Dict
+        scenario_ids: np.ndarray,
+        pre_tax_arrays: Dict[str, np.ndarray],
+        after_tax_arrays: Dict[str, np.ndarray]
     ) -> Dict[str, pd.DataFrame]:
         """
         Calculate detailed tax tables.
 
         Args:
-            pre_tax_df: Pre-tax scenarios
-            after_tax_df: After-tax scenarios
-            tax_config: Tax configuration
-            allocation: Asset allocation
+            pre_tax_df: Pre-tax scenarios, grouped by scenario
+            scenario_ids: Scenario labels, one per row of the arrays
+            pre_tax_arrays: Pre-tax scenario arrays
+            after_tax_arrays: After-tax scenario arrays
 
         Returns:
             Dictionary of tax-related DataFrames
         """
-        # Annual tax by account type
-        annual_tax_list = []
+        stock_pre = pre_tax_arrays['stock_return']
+        bond_pre = pre_tax_arrays['bond_return']
+        re_pre = pre_tax_arrays['real_estate_return']
 
-        for scenario_id in pre_tax_df['scenario_id'].unique():
-            scenario_pre = pre_tax_df[pre_tax_df['scenario_id'] == scenario_id]
-            scenario_post = after_tax_df[after_tax_df['scenario_id'] == scenario_id]
+        stock_post = after_tax_arrays['stock_return_after_tax']
+        bond_post = after_tax_arrays['bond_return_after_tax']
+        re_post = after_tax_arrays['real_estate_return_after_tax']
 
-            for idx, row_pre in scenario_pre.iterrows():
-                row_post = scenario_post.iloc[idx - scenario_pre.index[0]]
+        n_steps = stock_pre.shape[1]
 
-                # Calculate tax per asset class
-                stock_tax = (row_pre['stock_return'] - row_post['stock_return_after_tax'])
-                bond_tax = (row_pre['bond_return'] - row_post['bond_return_after_tax'])
-                re_tax = (row_pre['real_estate_return'] - row_post['real_estate_return_after_tax'])
-
-                annual_tax_list.append({
-                    'scenario_id': scenario_id,
-                    'time_period': row_pre['time_period'],
-                    'stock_tax': stock_tax,
-                    'bond_tax': bond_tax,
-                    'real_estate_tax': re_tax,
-                    'total_tax': stock_tax + bond_tax + re_tax
-                })
-
-        annual_tax_df = pd.DataFrame(annual_tax_list)
+        # Annual tax by account type
+        stock_tax = stock_pre - stock_post
+        bond_tax = bond_pre - bond_post
+        re_tax = re_pre - re_post
+        total_tax = stock_tax + bond_tax + re_tax
+
+        annual_tax_df = pd.DataFrame({
+            'scenario_id': np.repeat(scenario_ids, n_steps),
+            'time_period': pre_tax_df['time_period'].to_numpy(),
+            'stock_tax': stock_tax.ravel(),
+            'bond_tax': bond_tax.ravel(),
+            'real_estate_tax': re_tax.ravel(),
+            'total_tax': total_tax.ravel()
+        })
 
         # Cumulative tax
         cumulative_tax_df = annual_tax_df.copy()
-        cumulative_tax_df['cumulative_total_tax'] = (
-            cumulative_tax_df.groupby('scenario_id')['total_tax'].cumsum()
-        )
+        cumulative_tax_df['cumulative_total_tax'] = np.cumsum(total_tax, axis=1).ravel()
 
         # Tax drag (percentage)
         tax_drag_df = annual_tax_df.copy()
-        total_return = (
-            pre_tax_df['stock_return'] +
-            pre_tax_df['bond_return'] +
-            pre_tax_df['real_estate_return']
-        ).reset_index(drop=True)
+        total_return = stock_pre + bond_pre + re_pre
 
         tax_drag_df['tax_drag_pct'] = (
-            tax_drag_df['total_tax'] / total_return.clip(lower=0.001)
-        ) * 100
+            total_tax / np.maximum(total_return, 0.001)
+        ).ravel() * 100
 
         # Effective tax rate per scenario
-        effective_rates = []
-        for scenario_id in pre_tax_df['scenario_id'].unique():
-            scenario_pre = pre_tax_df[pre_tax_df['scenario_id'] == scenario_id]
-            scenario_post = after_tax_df[after_tax_df['scenario_id'] == scenario_id]
-
-            total_pre_tax = (
-                scenario_pre['stock_return'].sum() +
-                scenario_pre['bond_return'].sum() +
-                scenario_pre['real_estate_return'].sum()
-            )
-
-            total_after_tax = (
-                scenario_post['stock_return_after_tax'].sum() +
-                scenario_post['bond_return_after_tax'].sum() +
-                scenario_post['real_estate_return_after_tax'].sum()
-            )
-
-            if total_pre_tax > 0:
-                effective_rate = (total_pre_tax - total_after_tax) / total_pre_tax
-            else:
-                effective_rate = 0.0
-
-            effective_rates.append({
-                'scenario_id': scenario_id,
-                'effective_tax_rate': effective_rate,
-                'total_pre_tax_return': total_pre_tax,
-                'total_after_tax_return': total_after_tax,
-                'total_taxes_paid': total_pre_tax - total_after_tax
-            })
-
-        effective_rate_df = pd.DataFrame(effective_rates)
+        total_pre_tax = stock_pre.sum(axis=1) + bond_pre.sum(axis=1) + re_pre.sum(axis=1)
+        total_after_tax = stock_post.sum(axis=1) + bond_post.sum(axis=1) + re_post.sum(axis=1)
+        total_taxes_paid = total_pre_tax - total_after_tax
+
+        effective_rate = np.zeros(len(scenario_ids))
+        np.divide(total_taxes_paid, total_pre_tax, out=effective_rate, where=total_pre_tax > 0)
+
+        effective_rate_df = pd.DataFrame({
+            'scenario_id': scenario_ids,
+            'effective_tax_rate': effective_rate,
+            'total_pre_tax_return': total_pre_tax,
+            'total_after_tax_return': total_after_tax,
+            'total_taxes_paid': total_taxes_paid
+        })
 
         return {
             'annual_tax_by_account': annual_tax_df,
@@ -493,7 +607,8 @@ class TaxEngine:
 
     def _simulate_account_balances(
         self,
-        after_tax_df: pd.DataFrame,
+        scenarios: np.ndarray,
+        time_periods: np.ndarray,
         allocation: Dict,
         tax_config: Dict
     ) -> Dict[str, pd.DataFrame]:
@@ -501,7 +616,8 @@ class TaxEngine:
         Simulate account balances over time.
 
         Args:
-            after_tax_df: After-tax scenarios
+            scenarios: Scenario labels
+            time_periods: Time periods shared by all scenarios
             allocation: Asset allocation
             tax_config: Tax configuration
 
@@ -511,8 +627,7 @@ class TaxEngine:
         # For now, return placeholder
         # In full implementation, this would simulate actual account growth
 
-        scenarios = after_tax_df['scenario_id'].unique()
-        time_periods = sorted(after_tax_df['time_period'].unique())
+        time_periods = np.unique(time_periods)
 
         # Placeholder balances (would be calculated based on contributions, returns, etc.)
         taxable_balances = pd.DataFrame({
@@ -61,6 +61,7 @@ OUTPUT STRUCTURE:
 {
     'validated_profile': dict,
     'investment_time_series': pd.DataFrame,
+    'investment_time_series_records': np.recarray,  # Same rows as a record array
     'life_stages': dict,
     'risk_profile': dict,
     'sliced_plans': dict,              # Domain-specific slicing
@@ -122,6 +123,42 @@ class RebalancingFrequency(Enum):
     THRESHOLD_BASED = "threshold_based"
 
 
+def _expand_schedule(
+    start_year: int,
+    end_year: int,
+    monthly_amount: float,
+    annual_increase: float,
+    n_years: int
+) -> np.ndarray:
+    """
+    Expand one contribution schedule entry into annual amounts.
+
+    Args:
+        start_year: First year of the schedule (relative to today)
+        end_year: Last year of the schedule (inclusive)
+        monthly_amount: Monthly contribution in the first year
+        annual_increase: Yearly growth rate of the contribution
+        n_years: Length of the time series
+
+    Returns:
+        Array of length n_years, zero outside the schedule
+    """
+    annual_amounts = np.zeros(n_years)
+
+    first_year = max(0, start_year)
+    last_year = min(n_years, end_year + 1)
+    if first_year >= last_year:
+        return annual_amounts
+
+    # Compounding factor of every active year in one vectorized call
+    years_since_start = np.arange(first_year, last_year) - start_year
+    annual_amounts[first_year:last_year] = (
+        monthly_amount * 12 * np.power(1 + annual_increase, years_since_start, dtype=float)
+    )
+
+    return annual_amounts
+
+
 class UserProfileManager:
     """
     User Input & Investment Time Series Manager - Module 3
@@ -164,11 +201,12 @@ class UserProfileManager:
         contribution_schedule = config.get('contribution_schedule', [])
         withdrawal_schedule = config.get('withdrawal_schedule', [])
 
-        investment_time_series = self._create_time_series(
+        time_series_records = self._create_time_series(
             validated_profile,
             contribution_schedule,
             withdrawal_schedule
         )
+        investment_time_series = pd.DataFrame(time_series_records)
 
         # Step 3: Identify life stages
         life_stages = self._identify_life_stages(validated_profile)
@@ -179,13 +217,14 @@ class UserProfileManager:
         # Step 5: Create sliced plans
         sliced_plans = self._create_sliced_plans(
             investment_time_series,
+            time_series_records,
             life_stages,
             validated_profile
         )
 
         # Step 6: Calculate summary statistics
         summary_stats = self._calculate_summary_statistics(
-            investment_time_series,
+            time_series_records,
             validated_profile
         )
 
@@ -199,6 +238,7 @@ class UserProfileManager:
         return {
             'validated_profile': validated_profile,
             'investment_time_series': investment_time_series,
+            'investment_time_series_records': time_series_records,
             'life_stages': life_stages,
             'risk_profile': risk_profile,
             'sliced_plans': sliced_plans,
@@ -318,7 +358,7 @@ class UserProfileManager:
         profile: Dict,
         contribution_schedule: List[Dict],
         withdrawal_schedule: List[Dict]
-    ) -> pd.DataFrame:
+    ) -> np.recarray:
         """
         Create investment time series from schedules.
 
@@ -328,21 +368,22 @@ class UserProfileManager:
             withdrawal_schedule: List of withdrawals
 
         Returns:
-            DataFrame with investment time series
+            Record array with investment time series, one record per year
         """
         age = profile['personal_info']['age']
         life_expectancy = profile['personal_info']['life_expectancy']
         time_horizon = life_expectancy - age
 
         # Create year-by-year time series
-        years = list(range(time_horizon + 1))
-        investor_ages = [age + y for y in years]
+        n_years = time_horizon + 1
+        years = np.arange(n_years)
+        investor_ages = age + years
 
         # Initialize arrays
-        contributions = np.zeros(time_horizon + 1)
-        withdrawals = np.zeros(time_horizon + 1)
-        account_types = [''] * (time_horizon + 1)
-        purposes = [''] * (time_horizon + 1)
+        contributions = np.zeros(n_years)
+        withdrawals = np.zeros(n_years)
+        account_types = np.full(n_years, '', dtype=object)
+        purposes = np.full(n_years, '', dtype=object)
 
         # Fill in contributions from schedule
         if not contribution_schedule:
@@ -352,12 +393,10 @@ class UserProfileManager:
             annual_expenses = profile['financial_situation']['annual_expenses']
             annual_contribution = max(0, annual_income - annual_expenses) * 0.1  # Save 10% of surplus
 
-            for year_idx in range(time_horizon + 1):
-                current_age = age + year_idx
-                if current_age < retirement_age:
-                    contributions[year_idx] = annual_contribution
-                    account_types[year_idx] = 'tax_deferred'
-                    purposes[year_idx] = 'retirement'
+            working_years = investor_ages < retirement_age
+            contributions[working_years] = annual_contribution
+            account_types[working_years] = 'tax_deferred'
+            purposes[working_years] = 'retirement'
         else:
             # Use provided schedule
             for schedule in contribution_schedule:
@@ -367,12 +406,13 @@ class UserProfileManager:
                 annual_increase = schedule.get('annual_increase', 0.02)  # 2% default
                 account_type = schedule.get('account_type', 'tax_deferred')
 
-                for year_idx in range(max(0, start_year), min(time_horizon + 1, end_year + 1)):
-                    years_since_start = year_idx - start_year
-                    annual_amount = monthly_amount * 12 * ((1 + annual_increase) ** years_since_start)
-                    contributions[year_idx] += annual_amount
-                    account_types[year_idx] = account_type
-                    purposes[year_idx] = 'retirement'
+                contributions += _expand_schedule(
+                    start_year, end_year, monthly_amount, annual_increase, n_years
+                )
+
+                active_years = slice(max(0, start_year), min(n_years, end_year + 1))
+                account_types[active_years] = account_type
+                purposes[active_years] = 'retirement'
 
         # Fill in withdrawals from schedule
         if not withdrawal_schedule:
@@ -380,11 +420,9 @@ class UserProfileManager:
             retirement_age = profile['personal_info']['retirement_age']
             annual_expenses = profile['financial_situation']['annual_expenses']
 
-            for year_idx in range(time_horizon + 1):
-                current_age = age + year_idx
-                if current_age >= retirement_age:
-                    withdrawals[year_idx] = annual_expenses
-                    purposes[year_idx] = 'retirement_income'
+            retirement_years = investor_ages >= retirement_age
+            withdrawals[retirement_years] = annual_expenses
+            purposes[retirement_years] = 'retirement_income'
         else:
             # Use provided schedule
             for withdrawal in withdrawal_schedule:
@@ -399,18 +437,11 @@ class UserProfileManager:
         # Calculate net flow
         net_flow = contributions - withdrawals
 
-        # Create DataFrame
-        time_series_df = pd.DataFrame({
-            'period': years,
-            'age': investor_ages,
-            'contribution': contributions,
-            'withdrawal': withdrawals,
-            'net_flow': net_flow,
-            'account_type': account_types,
-            'purpose': purposes
-        })
-
-        return time_series_df
+        # Keep the columns as NumPy fields; DataFrames are built only for output
+        return np.rec.fromarrays(
+            [years, investor_ages, contributions, withdrawals, net_flow, account_types, purposes],
+            names='period,age,contribution,withdrawal,net_flow,account_type,purpose'
+        )
 
     def _identify_life_stages(self, profile: Dict) -> Dict:
         """
@@ -520,6 +551,7 @@ class UserProfileManager:
     def _create_sliced_plans(
         self,
         time_series: pd.DataFrame,
+        records: np.recarray,
         life_stages: Dict,
         profile: Dict
     ) -> Dict:
@@ -528,6 +560,7 @@ class UserProfileManager:
 
         Args:
             time_series: Investment time series
+            records: Same time series as a record array, used to build the masks
             life_stages: Life stage boundaries
             profile: Validated profile
 
@@ -544,27 +577,26 @@ class UserProfileManager:
             end_age = stage_info['end']
 
             sliced_df = time_series[
-                (time_series['age'] >= start_age) &
-                (time_series['age'] <= end_age)
+                (records.age >= start_age) & (records.age <= end_age)
             ].copy()
 
             by_life_stage[stage_name] = sliced_df
 
         # Slice by goal (from purpose column)
         by_goal = {}
-        unique_purposes = time_series['purpose'].unique()
+        unique_purposes = pd.unique(records.purpose)
 
         for purpose in unique_purposes:
             if purpose:  # Skip empty strings
-                by_goal[purpose] = time_series[time_series['purpose'] == purpose].copy()
+                by_goal[purpose] = time_series[records.purpose == purpose].copy()
 
         # Slice by account type
         by_account_type = {}
-        unique_accounts = time_series['account_type'].unique()
+        unique_accounts = pd.unique(records.account_type)
 
         for account in unique_accounts:
             if account:  # Skip empty strings
-                by_account_type[account] = time_series[time_series['account_type'] == account].copy()
+                by_account_type[account] = time_series[records.account_type == account].copy()
 
         return {
             'by_life_stage': by_life_stage,
@@ -574,24 +606,24 @@ class UserProfileManager:
 
     def _calculate_summary_statistics(
         self,
-        time_series: pd.DataFrame,
+        records: np.recarray,
         profile: Dict
     ) -> Dict:
         """
         Calculate summary statistics for the investment plan.
 
         Args:
-            time_series: Investment time series
+            records: Investment time series as a record array
             profile: Validated profile
 
         Returns:
             Dictionary of summary statistics
         """
-        total_contributions = time_series['contribution'].sum()
-        total_withdrawals = time_series['withdrawal'].sum()
+        total_contributions = records.contribution.sum()
+        total_withdrawals = records.withdrawal.sum()
 
-        contribution_years = len(time_series[time_series['contribution'] > 0])
-        withdrawal_years = len(time_series[time_series['withdrawal'] > 0])
+        contribution_years = int(np.count_nonzero(records.contribution > 0))
+        withdrawal_years = int(np.count_nonzero(records.withdrawal > 0))
 
         retirement_age = profile['personal_info']['retirement_age']
         life_expectancy = profile['personal_info']['life_expectancy']
@@ -20,6 +20,7 @@ from investment_calculator import (
     InvestmentGoal,
     GlobalScenarioEngine,
     EconomicScenario,
+    ScenarioBatch,
     ScenarioType,
     TaxIntegratedScenarioEngine,
     TaxConfig,
@@ -174,6 +175,190 @@ class TestGlobalScenarioEngine(unittest.TestCase):
         self.assertEqual(len(scenarios), 10)
         self.assertTrue(all(s.scenario_type == ScenarioType.MONTE_CARLO for s in scenarios))
 
+    def test_monte_carlo_batch(self):
+        """Test batched Monte Carlo scenarios and their analysis"""
+        batch = self.gse.generate_monte_carlo_batch(years=12, n_scenarios=8)
+
+        self.assertIsInstance(batch, ScenarioBatch)
+        self.assertEqual(len(batch), 8)
+        self.assertEqual(batch.stock_returns.shape, (8, 12))
+
+        scenario = batch[3]
+        self.assertEqual(scenario.scenario_id, "mc_0004")
+        self.assertEqual(scenario.metadata, {"simulation_index": 4})
+        self.assertTrue(np.shares_memory(scenario.stock_returns, batch.stock_returns))
+        self.assertIsNone(batch.probabilities)
+        self.assertEqual(scenario.probability, 1.0 / 8)
+
+        last = batch[-1]
+        self.assertEqual(last.scenario_id, "mc_0008")
+        self.assertEqual(last.metadata, {"simulation_index": 8})
+        with self.assertRaises(IndexError):
+            batch[8]
+        with self.assertRaises(TypeError):
+            batch[1:3]
+
+        pd.testing.assert_frame_equal(
+            self.gse.analyze_scenarios(batch),
+            self.gse.analyze_scenarios(list(batch)),
+        )
+
+        df = batch.to_dataframe()
+        self.assertEqual(df.shape, (8 * 12, 6))
+        self.assertEqual(df.index.names, ["scenario_id", "year"])
+        pd.testing.assert_frame_equal(
+            df.loc["mc_0004"],
+            scenario.to_dataframe(),
+            check_index_type=False,
+        )
+
+    def test_analyze_scenarios(self):
+        """Test stacked scenario analysis matches per-scenario statistics"""
+        scenarios = self.gse.generate_standard_scenarios(years=20)
+        mixed = scenarios + [self.gse.generate_baseline_scenario(years=5)]
+
+        for batch in (scenarios, mixed):
+            analysis = self.gse.analyze_scenarios(batch)
+
+            self.assertEqual(len(analysis), len(batch))
+            for scenario, (_, row) in zip(batch, analysis.iterrows()):
+                stats = scenario.get_summary_statistics()
+                self.assertEqual(row["type"], scenario.scenario_type.value)
+                self.assertAlmostEqual(row["stock_returns_median"], stats["stock_returns"]["median"])
+                self.assertAlmostEqual(row["gdp_growth_std"], stats["gdp_growth"]["std"])
+
+    def test_custom_scenario(self):
+        """Test custom scenarios only draw the indicators not provided"""
+        years = 10
+        values = {name: np.full(years, 0.01) for name in ("inflation", "interest", "stocks", "bonds", "real_estate", "gdp")}
+
+        scenario = self.gse.create_custom_scenario("full", years, **values)
+        self.assertEqual(scenario.scenario_type, ScenarioType.CUSTOM)
+        np.testing.assert_array_equal(scenario.stock_returns, values["stocks"])
+
+        # Nothing was drawn, so the stream matches a fresh engine
+        fresh = GlobalScenarioEngine(random_seed=42)
+        np.testing.assert_array_equal(
+            self.gse.generate_baseline_scenario(years).stock_returns,
+            fresh.generate_baseline_scenario(years).stock_returns,
+        )
+
+        del values["stocks"]
+        partial = self.gse.create_custom_scenario("partial", years, **values)
+        self.assertEqual(len(partial.stock_returns), years)
+        np.testing.assert_array_equal(partial.bond_returns, values["bonds"])
+
+    def test_scenario_metadata_optional(self):
+        """Test scenarios without metadata read as empty"""
+        years = 5
+        scenario = EconomicScenario(
+            "bare", ScenarioType.CUSTOM, years,
+            *(np.zeros(years) for _ in range(6)),
+        )
+        self.assertIsNone(scenario.metadata)
+        self.assertEqual(scenario.get_metadata("description", "none"), "none")
+
+        baseline = self.gse.generate_baseline_scenario(years)
+        self.assertIn("Baseline", baseline.get_metadata("description"))
+
+    def test_median_matches_numpy(self):
+        """Test partition-based median against np.median"""
+        from investment_calculator.gse import _median
+
+        rng = np.random.default_rng(0)
+        samples = [
+            rng.standard_normal((4, 30)),
+            rng.standard_normal((4, 31)),
+            rng.integers(0, 10, (3, 7)),
+            np.array([[1.0, np.nan, 3.0], [3.0, 1.0, 2.0]]),
+        ]
+        for values in samples:
+            np.testing.assert_array_equal(_median(values), np.median(values, axis=-1))
+
+    def test_monte_carlo_statistics(self):
+        """Test Monte Carlo statistics fast path"""
+        batch, analysis = self.gse.generate_monte_carlo_statistics(years=8, n_scenarios=6)
+
+        self.assertIsInstance(batch, ScenarioBatch)
+        self.assertIsNone(batch.metadata)
+        self.assertEqual(len(analysis), 6)
+        pd.testing.assert_frame_equal(analysis, self.gse.analyze_scenarios(list(batch)))
+
+    def test_monte_carlo_float32(self):
+        """Test Monte Carlo scenarios can be generated in single precision"""
+        batch = self.gse.generate_monte_carlo_batch(
+            years=10,
+            n_scenarios=5,
+            custom_params={"stock_return_mean": np.float64(0.07)},
+            dtype=np.float32,
+        )
+
+        self.assertEqual(batch.stock_returns.dtype, np.float32)
+        self.assertEqual(batch.gdp_growth.dtype, np.float32)
+        self.assertEqual(batch[0].inflation_rates.dtype, np.float32)
+
+    def test_monte_carlo_device(self):
+        """Test device selection for batched Monte Carlo generation"""
+        with self.assertRaises(ValueError):
+            self.gse.generate_monte_carlo_batch(years=5, n_scenarios=2, device="tpu")
+
+        try:
+            import cupy  # noqa: F401
+        except ImportError:
+            with self.assertRaises(ImportError):
+                self.gse.generate_monte_carlo_batch(years=5, n_scenarios=2, device="cuda")
+        else:
+            batch = self.gse.generate_monte_carlo_batch(years=5, n_scenarios=2, device="cuda")
+            self.assertIsInstance(batch.stock_returns, np.ndarray)
+            self.assertEqual(batch.stock_returns.shape, (2, 5))
+
+    def test_monte_carlo_parallel_workers(self):
+        """Test threaded Monte Carlo draws are reproducible and independent"""
+        for bit_generator in ("pcg64", "sfc64"):
+            first = GlobalScenarioEngine(random_seed=5, bit_generator=bit_generator).generate_monte_carlo_batch(
+                years=6, n_scenarios=10, n_workers=3
+            )
+            engine = GlobalScenarioEngine(random_seed=5, bit_generator=bit_generator)
+            second = engine.generate_monte_carlo_batch(years=6, n_scenarios=10, n_workers=3)
+            third = engine.generate_monte_carlo_batch(years=6, n_scenarios=10, n_workers=3)
+            serial = engine.generate_monte_carlo_batch(years=6, n_scenarios=10)
+
+            np.testing.assert_array_equal(first.stock_returns, second.stock_returns)
+            self.assertFalse(np.array_equal(second.stock_returns, third.stock_returns))
+            rows = np.concatenate([second.stock_returns, third.stock_returns, serial.stock_returns])
+            self.assertEqual(len({row.tobytes() for row in rows}), 30)
+
+        with self.assertRaises(ValueError):
+            engine.generate_monte_carlo_batch(years=6, n_scenarios=10, n_workers=0)
+
+    def test_seeded_engines_reproducible(self):
+        """Test engines with the same seed produce the same scenarios"""
+        for bit_generator in ("pcg64", "sfc64"):
+            first = GlobalScenarioEngine(random_seed=7, bit_generator=bit_generator)
+            second = GlobalScenarioEngine(random_seed=7, bit_generator=bit_generator)
+
+            a = first.generate_monte_carlo_scenarios(years=5, n_scenarios=3)
+            b = second.generate_monte_carlo_scenarios(years=5, n_scenarios=3)
+
+            for x, y in zip(a, b):
+                np.testing.assert_array_equal(x.stock_returns, y.stock_returns)
+
+    def test_engine_leaves_global_random_state(self):
+        """Test seeding an engine does not touch NumPy's global random state"""
+        np.random.seed(0)
+        expected = np.random.random()
+
+        np.random.seed(0)
+        gse = GlobalScenarioEngine(random_seed=42)
+        gse.generate_baseline_scenario(years=10)
+
+        self.assertEqual(np.random.random(), expected)
+
+    def test_unknown_bit_generator(self):
+        """Test invalid bit generator names are rejected"""
+        with self.assertRaises(ValueError):
+            GlobalScenarioEngine(bit_generator="mt19937")
+
     def test_standard_scenarios(self):
         """Test standard scenarios generation"""
         scenarios = self.gse.generate_standard_scenarios(years=30)
@@ -198,6 +383,24 @@ class TestGlobalScenarioEngine(unittest.TestCase):
         self.assertEqual(len(df), 30)
         self.assertIn("stock_return", df.columns)
 
+    def test_summary_dataframe(self):
+        """Test per-scenario return summary table"""
+        scenarios = self.gse.generate_standard_scenarios(years=30)
+        scenarios.append(self.gse.generate_baseline_scenario(years=10))
+
+        summary = self.gse.summary_dataframe(scenarios)
+
+        self.assertEqual(
+            list(summary.columns),
+            ["scenario_id", "type", "stock_mean", "stock_std", "bond_mean", "bond_std"],
+        )
+        self.assertEqual(len(summary), 4)
+        for scenario, (_, row) in zip(scenarios, summary.iterrows()):
+            stats = scenario.get_summary_statistics()
+            self.assertEqual(row["scenario_id"], scenario.scenario_id)
+            self.assertAlmostEqual(row["stock_mean"], stats["stock_returns"]["mean"])
+            self.assertAlmostEqual(row["bond_std"], stats["bond_returns"]["std"])
+
 
 class TestTaxIntegratedScenarioEngine(unittest.TestCase):
     """Test TaxIntegratedScenarioEngine class"""
@@ -233,6 +436,22 @@ class TestTaxIntegratedScenarioEngine(unittest.TestCase):
             np.mean(base_scenario.bond_returns),
         )
 
+        pre_tax = base_scenario.stock_returns + base_scenario.bond_returns + base_scenario.real_estate_returns
+        after_tax = (
+            tax_scenario.after_tax_stock_returns
+            + tax_scenario.after_tax_bond_returns
+            + tax_scenario.after_tax_real_estate_returns
+        )
+        self.assertAlmostEqual(
+            tax_scenario.get_effective_tax_rate(),
+            (pre_tax.sum() - after_tax.sum()) / pre_tax.sum(),
+        )
+
+        columns = tax_scenario.to_dict()
+        df = tax_scenario.to_dataframe()
+        self.assertEqual(list(columns), list(df.columns))
+        np.testing.assert_array_equal(columns["tax_drag"], df["tax_drag"].to_numpy())
+
     def test_tax_integrated_scenario_tax_free(self):
         """Test tax-integrated scenario for tax-free account"""
         base_scenario = self.gse.generate_baseline_scenario(years=30)
@@ -245,6 +464,13 @@ class TestTaxIntegratedScenarioEngine(unittest.TestCase):
         # Tax-free account should have no tax drag
         self.assertTrue(np.allclose(tax_scenario.tax_drag, 0))
 
+        # Returns are shared read-only with the base scenario, not copied
+        self.assertTrue(np.shares_memory(tax_scenario.after_tax_stock_returns, base_scenario.stock_returns))
+        self.assertFalse(tax_scenario.after_tax_stock_returns.flags.writeable)
+        self.assertTrue(base_scenario.stock_returns.flags.writeable)
+        self.assertEqual(tax_scenario.cumulative_taxes_paid.shape, (30,))
+        self.assertEqual(tax_scenario.cumulative_taxes_paid[-1], 0.0)
+
     def test_withdrawal_tax_calculation(self):
         """Test withdrawal tax calculation"""
         base_scenario = self.gse.generate_baseline_scenario(years=30)
@@ -261,6 +487,14 @@ class TestTaxIntegratedScenarioEngine(unittest.TestCase):
 
         self.assertGreater(withdrawal_tax, 0)
 
+        # Arrays of withdrawals are taxed element-wise
+        amounts = np.array([0.0, 50000.0, 100000.0])
+        for qualified in (True, False):
+            np.testing.assert_allclose(
+                tax_scenario.calculate_withdrawal_tax(amounts, is_qualified_withdrawal=qualified),
+                [tax_scenario.calculate_withdrawal_tax(a, is_qualified_withdrawal=qualified) for a in amounts],
+            )
+
     def test_account_type_comparison(self):
         """Test comparison of account types"""
         comparison = self.gse_plus.compare_account_types(
@@ -272,6 +506,95 @@ class TestTaxIntegratedScenarioEngine(unittest.TestCase):
         self.assertIsInstance(comparison, pd.DataFrame)
         self.assertEqual(len(comparison), 3)  # 3 account types
 
+    def test_account_type_comparison_subset(self):
+        """Test comparison restricted to selected account types"""
+        full = self.gse_plus.compare_account_types(years=20, initial_investment=10000)
+        # Fresh engine with the same seed so both comparisons share the scenario
+        gse_plus = TaxIntegratedScenarioEngine(
+            tax_config=self.tax_config,
+            gse=GlobalScenarioEngine(random_seed=42),
+        )
+        subset = gse_plus.compare_account_types(
+            years=20,
+            initial_investment=10000,
+            account_types=[AccountType.TAX_FREE],
+        )
+
+        self.assertEqual(list(subset["account_type"]), ["tax_free"])
+        self.assertAlmostEqual(
+            subset["final_balance"].iloc[0],
+            full.loc[full["account_type"] == "tax_free", "final_balance"].iloc[0],
+        )
+
+    def test_final_balances_match_yearly_growth(self):
+        """Test closed-form final balances against year-by-year growth"""
+        from investment_calculator.gse_plus import _final_balances
+
+        returns = np.random.default_rng(0).normal(0.06, 0.1, size=(3, 25))
+        for years in (0, 1, 25):
+            expected = np.full(3, 50000.0)
+            for year in range(years):
+                expected = expected * (1 + returns[:, year]) + 12000
+            np.testing.assert_allclose(
+                _final_balances(returns[:, :years], 50000, 12000), expected, rtol=1e-12
+            )
+
+    def test_batch_tax_integration_matches_single(self):
+        """Test batched tax integration matches per-scenario results"""
+        scenarios = self.gse.generate_monte_carlo_scenarios(years=15, n_scenarios=10)
+
+        for account_type in AccountType:
+            batch = self.gse_plus.generate_tax_integrated_scenarios(scenarios, account_type)
+            self.assertEqual(len(batch), len(scenarios))
+
+            for scenario, tax_scenario in zip(scenarios, batch):
+                single = self.gse_plus.generate_tax_integrated_scenario(scenario, account_type)
+                self.assertIs(tax_scenario.base_scenario, scenario)
+                self.assertEqual(tax_scenario.account_type, account_type)
+                np.testing.assert_array_equal(tax_scenario.after_tax_stock_returns, single.after_tax_stock_returns)
+                np.testing.assert_array_equal(tax_scenario.after_tax_bond_returns, single.after_tax_bond_returns)
+                np.testing.assert_array_equal(
+                    tax_scenario.after_tax_real_estate_returns, single.after_tax_real_estate_returns
+                )
+                np.testing.assert_array_equal(tax_scenario.tax_drag, single.tax_drag)
+                np.testing.assert_array_equal(tax_scenario.cumulative_taxes_paid, single.cumulative_taxes_paid)
+
+    def test_batch_tax_integration_mixed_horizons(self):
+        """Test batched tax integration with scenarios of different lengths"""
+        scenarios = [
+            self.gse.generate_baseline_scenario(years=10),
+            self.gse.generate_baseline_scenario(years=20),
+        ]
+
+        batch = self.gse_plus.generate_tax_integrated_scenarios(scenarios, AccountType.TAXABLE)
+
+        self.assertEqual([len(s.tax_drag) for s in batch], [10, 20])
+        self.assertEqual(self.gse_plus.generate_tax_integrated_scenarios([], AccountType.TAXABLE), [])
+
+    def test_scenario_batch_tax_integration(self):
+        """Test taxing a ScenarioBatch through stacked arrays"""
+        batch = self.gse.generate_monte_carlo_batch(years=15, n_scenarios=6)
+
+        arrays = self.gse_plus.apply_taxes_batch(
+            batch.stock_returns, batch.bond_returns, batch.real_estate_returns, AccountType.TAXABLE
+        )
+        self.assertEqual(arrays["tax_drag"].shape, (6, 15))
+
+        tax_scenarios = self.gse_plus.generate_tax_integrated_scenarios(batch, AccountType.TAXABLE)
+        self.assertEqual(len(tax_scenarios), 6)
+        for i, tax_scenario in enumerate(tax_scenarios):
+            single = self.gse_plus.generate_tax_integrated_scenario(batch[i], AccountType.TAXABLE)
+            np.testing.assert_array_equal(tax_scenario.cumulative_taxes_paid, single.cumulative_taxes_paid)
+            np.testing.assert_array_equal(arrays["after_tax_bond_returns"][i], single.after_tax_bond_returns)
+
+        for account_type in AccountType:
+            single_precision = self.gse_plus.apply_taxes_batch(
+                batch.stock_returns, batch.bond_returns, batch.real_estate_returns, account_type,
+                dtype=np.float32,
+            )
+            for name, values in single_precision.items():
+                self.assertEqual(values.dtype, np.float32, name)
+
 
 class TestMOCA(unittest.TestCase):
     """Test MOCA class"""
@@ -325,6 +648,19 @@ class TestMOCA(unittest.TestCase):
         self.assertEqual(len(results), 3)
         self.assertTrue(all(r.final_balance > 0 for r in results))
 
+    def test_run_scenarios_matches_simulate_investment(self):
+        """Test batched simulation matches simulating each scenario alone"""
+        allocation = {"domestic_stocks": 0.4, "international_stocks": 0.2, "government_bonds": 0.3, "real_estate": 0.1}
+
+        results = self.moca.run_scenarios(self.tax_scenarios, allocation)
+
+        for scenario, result in zip(self.tax_scenarios, results):
+            single = self.moca.simulate_investment(scenario, allocation)
+            np.testing.assert_array_equal(result.balances, single.balances)
+            np.testing.assert_array_equal(result.contributions, single.contributions)
+            np.testing.assert_array_equal(result.returns, single.returns)
+            self.assertEqual(result.to_dict(), single.to_dict())
+
     def test_calculate_statistics(self):
         """Test statistics calculation"""
         allocation = {"stocks": 0.7, "bonds": 0.25, "real_estate": 0.05}
@@ -337,6 +673,23 @@ class TestMOCA(unittest.TestCase):
         self.assertGreaterEqual(stats.probability_of_loss, 0)
         self.assertLessEqual(stats.probability_of_loss, 1)
 
+    def test_statistics_percentiles(self):
+        """Test reported percentiles match the final balances"""
+        allocation = {"stocks": 0.7, "bonds": 0.25, "real_estate": 0.05}
+        results = self.moca.run_scenarios(self.tax_scenarios, allocation)
+        final_balances = np.array([r.final_balance for r in results])
+
+        stats = self.moca.calculate_statistics(results)
+
+        for value, q in [
+            (stats.percentile_5, 5),
+            (stats.percentile_25, 25),
+            (stats.percentile_75, 75),
+            (stats.percentile_95, 95),
+        ]:
+            self.assertAlmostEqual(value, np.percentile(final_balances, q))
+        self.assertAlmostEqual(stats.median_final_balance, np.median(final_balances))
+
     def test_portfolio_optimization(self):
         """Test portfolio optimization"""
         optimal_allocation, stats = self.moca.optimize_portfolio(
@@ -222,6 +222,30 @@ class TestOptimizationObjectives:
                 assert abs(w - avg_weight) < 0.1  # Allow some variation
 
 
+class TestOptimizeMulti:
+    """Test parallel optimization over several configs."""
+
+    def test_results_match_sequential(self):
+        """Each parallel result matches the corresponding sequential run."""
+        opt = optimizer.PortfolioOptimizer()
+        base_config = create_test_optimizer_config()
+        objectives = ['max_sharpe', 'min_volatility', 'equal_weight']
+        configs = [{**base_config, 'optimization_objective': obj} for obj in objectives]
+
+        results = opt.optimize_multi(configs)
+
+        assert len(results) == len(objectives)
+        for config, result in zip(configs, results):
+            expected = opt.optimize(config)
+            for asset, weight in expected['optimal_portfolio']['weights'].items():
+                assert result['optimal_portfolio']['weights'][asset] == pytest.approx(weight)
+
+    def test_empty_configs(self):
+        """An empty sweep returns no results."""
+        opt = optimizer.PortfolioOptimizer()
+        assert opt.optimize_multi([]) == []
+
+
 class TestEfficientFrontier:
     """Test efficient frontier generation."""
 
@@ -290,6 +314,20 @@ class TestSimulationResults:
             values = simulations['portfolio_values']
             assert len(values) > 0
 
+    def test_var_and_cvar(self):
+        """Test VaR is the 5th percentile and CVaR the mean below it."""
+        opt = optimizer.PortfolioOptimizer()
+        config = create_test_optimizer_config()
+
+        results = opt.optimize(config)
+        simulations = results['simulation_results']
+        wealth = simulations['terminal_wealth']['wealth'].values
+        statistics = simulations['statistics']
+
+        var_95 = np.percentile(wealth, 5)
+        assert statistics['var_95'] == var_95
+        assert statistics['cvar_95'] == pytest.approx(wealth[wealth <= var_95].mean())
+
 
 class TestUserConstraints:
     """Test user constraint handling."""
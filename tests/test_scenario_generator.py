@@ -42,6 +42,36 @@ class TestScenarioGeneratorInitialization:
         gen = scenario_generator.ScenarioGenerator(random_seed=42)
         assert gen.random_seed == 42
 
+    def test_invalid_device(self):
+        """Test that unknown devices are rejected."""
+        with pytest.raises(ValueError):
+            scenario_generator.ScenarioGenerator(device='tpu')
+
+    def test_cuda_device_requires_numba(self):
+        """Test that device='cuda' fails clearly without numba."""
+        try:
+            import numba  # noqa: F401
+        except ImportError:
+            with pytest.raises(ImportError):
+                scenario_generator.ScenarioGenerator(device='cuda')
+        else:
+            pytest.skip("numba is installed")
+
+    def test_cuda_device_small_batch_stays_on_cpu(self, monkeypatch):
+        """Test that runs below CUDA_MIN_SCENARIOS use the CPU path."""
+        monkeypatch.setattr(scenario_generator, '_cuda_backend', lambda: None)
+        config = {
+            'num_scenarios': 10,
+            'time_horizon': 5,
+            'timestep': 1.0,
+            'use_stochastic': False
+        }
+
+        cpu = scenario_generator.ScenarioGenerator(random_seed=42).generate(config)
+        cuda = scenario_generator.ScenarioGenerator(random_seed=42, device='cuda').generate(config)
+
+        pd.testing.assert_frame_equal(cpu['scenarios'], cuda['scenarios'])
+
     def test_reproducibility_with_seed(self):
         """Test that same seed produces same results."""
         config = {
@@ -756,5 +786,137 @@ class TestYieldCurveGeneration:
         assert len(curve) == 60
 
 
+class TestScenarioArrays:
+    """Test the (scenarios × periods) array layout."""
+
+    def test_arrays_match_dataframe(self):
+        """Test that 'arrays' holds the DataFrame columns reshaped per scenario."""
+        gen = scenario_generator.ScenarioGenerator(random_seed=42)
+        results = gen.generate({
+            'num_scenarios': 20,
+            'time_horizon': 5,
+            'timestep': 1.0,
+            'use_stochastic': False
+        })
+
+        arrays = results['arrays']
+        scenarios_df = results['scenarios']
+
+        for col in scenario_generator.SCENARIO_COLUMNS:
+            assert arrays[col].shape == (20, 5)
+            np.testing.assert_array_equal(arrays[col].ravel(), scenarios_df[col].values)
+
+        assert results['num_scenarios'] == scenarios_df['scenario_id'].nunique() == 20
+        assert results['num_periods'] == scenarios_df['time_period'].nunique() == 5
+
+    def test_cuda_coefficients_match_cpu_paths(self):
+        """Test the GPU kernel's coefficient table mixes shocks like the CPU path."""
+        params = scenario_generator.ScenarioGenerator().default_params
+        shocks = np.random.default_rng(0).standard_normal((4, 3, 6))
+
+        coefficients = scenario_generator._simple_path_coefficients(params)
+        paths = scenario_generator._simulate_simple_paths(shocks, params)
+
+        for k, col in enumerate(scenario_generator.SCENARIO_COLUMNS):
+            mean, vol, w_base, w_inflation, w_market = coefficients[k]
+            expected = mean + vol * (w_base * shocks[:, 0] + w_inflation * shocks[:, 1]
+                                     + w_market * shocks[:, 2])
+            np.testing.assert_allclose(paths[col], expected)
+
+    def test_blocks_use_independent_streams(self, monkeypatch):
+        """Test that each block's scenarios do not depend on later blocks."""
+        monkeypatch.setattr(scenario_generator, 'GENERATION_BLOCK_SIZE', 7)
+        config = {
+            'time_horizon': 6,
+            'timestep': 1.0,
+            'use_stochastic': False
+        }
+
+        short = scenario_generator.ScenarioGenerator(random_seed=42).generate(
+            {**config, 'num_scenarios': 14}
+        )
+        long = scenario_generator.ScenarioGenerator(random_seed=42).generate(
+            {**config, 'num_scenarios': 25}
+        )
+
+        for col in scenario_generator.SCENARIO_COLUMNS:
+            np.testing.assert_array_equal(short['arrays'][col], long['arrays'][col][:14])
+            # Blocks draw from different streams
+            assert not np.array_equal(long['arrays'][col][:7], long['arrays'][col][7:14])
+
+    def test_repeated_generate_draws_new_scenarios(self):
+        """Test that a generator yields fresh scenarios on each call."""
+        gen = scenario_generator.ScenarioGenerator(random_seed=42)
+        config = {
+            'num_scenarios': 10,
+            'time_horizon': 5,
+            'timestep': 1.0,
+            'use_stochastic': False
+        }
+
+        first = gen.generate(config)['arrays']['stock_return']
+        second = gen.generate(config)['arrays']['stock_return']
+
+        assert not np.array_equal(first, second)
+
+    def test_generate_arrays_skips_dataframe(self):
+        """Test generate_arrays matches generate without the long DataFrame."""
+        config = {
+            'num_scenarios': 12,
+            'time_horizon': 4,
+            'timestep': 0.5,
+            'use_stochastic': False
+        }
+
+        full = scenario_generator.ScenarioGenerator(random_seed=42).generate(config)
+        gen = scenario_generator.ScenarioGenerator(random_seed=42)
+        results = gen.generate_arrays(config)
+
+        assert 'scenarios' not in results
+        assert results['timestep'] == 0.5
+        for col in scenario_generator.SCENARIO_COLUMNS:
+            np.testing.assert_array_equal(results['arrays'][col], full['arrays'][col])
+
+        scenarios_df = gen.to_dataframe(results['arrays'], results['timestep'])
+        pd.testing.assert_frame_equal(scenarios_df, full['scenarios'])
+
+    def test_scenarios_to_arrays_round_trip(self):
+        """Test reshaping a DataFrame reproduces the generated arrays."""
+        gen = scenario_generator.ScenarioGenerator(random_seed=42)
+        results = gen.generate({
+            'num_scenarios': 10,
+            'time_horizon': 4,
+            'timestep': 1.0,
+            'use_stochastic': False
+        })
+
+        arrays = scenario_generator.scenarios_to_arrays(results['scenarios'])
+
+        for col in scenario_generator.SCENARIO_COLUMNS:
+            np.testing.assert_array_equal(arrays[col], results['arrays'][col])
+
+    def test_scenarios_to_arrays_ungrouped_rows(self):
+        """Test that interleaved scenario rows are grouped before reshaping."""
+        scenarios_df = pd.DataFrame({
+            'scenario_id': ['a', 'b', 'a', 'b'],
+            'time_period': [1.0, 1.0, 2.0, 2.0],
+            'stock_return': [0.1, 0.3, 0.2, 0.4]
+        })
+
+        arrays = scenario_generator.scenarios_to_arrays(scenarios_df)
+
+        np.testing.assert_array_equal(arrays['stock_return'], [[0.1, 0.2], [0.3, 0.4]])
+
+    def test_scenarios_to_arrays_unequal_lengths(self):
+        """Test that ragged scenarios are rejected."""
+        scenarios_df = pd.DataFrame({
+            'scenario_id': ['a', 'a', 'b'],
+            'stock_return': [0.1, 0.2, 0.3]
+        })
+
+        with pytest.raises(ValueError, match="same number of time periods"):
+            scenario_generator.scenarios_to_arrays(scenarios_df)
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
@@ -6,7 +6,7 @@ import pytest
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
-from time_series_slicer import TimeSeriesSlicer, slice_by_time, slice_by_index, slice_by_window
+from time_series_slicer import TimeSeriesSlicer, ValueSliceStats, slice_by_time, slice_by_index, slice_by_window
 
 
 @pytest.fixture
@@ -106,6 +106,22 @@ class TestSliceByTime:
         result = slicer.slice_by_time('2024-01-01 10:00:00', '2024-01-01 20:00:00')
         assert len(result) == 11
 
+    def test_slice_by_time_with_time_column(self, sample_dataframe_with_time_column):
+        """Test slicing on a sorted time column."""
+        slicer = TimeSeriesSlicer(sample_dataframe_with_time_column, time_column='timestamp')
+        result = slicer.slice_by_time('2024-01-01 10:00:00', '2024-01-01 20:00:00')
+        assert len(result) == 11
+        assert result['timestamp'].iloc[0] == pd.Timestamp('2024-01-01 10:00:00')
+        assert result['timestamp'].iloc[-1] == pd.Timestamp('2024-01-01 20:00:00')
+
+    def test_slice_by_time_with_unsorted_time_column(self, sample_dataframe_with_time_column):
+        """Test slicing on an unsorted time column keeps original row order."""
+        shuffled = sample_dataframe_with_time_column.sample(frac=1, random_state=0)
+        slicer = TimeSeriesSlicer(shuffled, time_column='timestamp')
+        result = slicer.slice_by_time('2024-01-01 10:00:00', '2024-01-01 20:00:00')
+        assert len(result) == 11
+        assert list(result.index) == [i for i in shuffled.index if 10 <= i <= 20]
+
     def test_slice_by_time_convenience_function(self, sample_dataframe):
         """Test the convenience function slice_by_time."""
         result = slice_by_time(sample_dataframe, '2024-01-01 10:00:00', '2024-01-01 20:00:00')
@@ -205,6 +221,24 @@ class TestSliceByWindow:
         windows = list(slice_by_window(sample_dataframe, window_size=10))
         assert len(windows) == 10
 
+    def test_window_values_match_slice_by_window(self, sample_dataframe):
+        """Test window_values rows equal the windows from slice_by_window."""
+        slicer = TimeSeriesSlicer(sample_dataframe)
+        column = sample_dataframe.columns[0]
+
+        for kwargs in ({}, {'step_size': 5, 'overlap': True}, {'overlap': True}):
+            values = slicer.window_values(10, column, **kwargs)
+            windows = list(slicer.slice_by_window(window_size=10, **kwargs))
+            assert values.shape == (len(windows), 10)
+            for row, window in zip(values, windows):
+                np.testing.assert_array_equal(row, window[column].values)
+
+    def test_window_values_longer_than_data(self, sample_series):
+        """Test a window longer than the data yields no rows."""
+        slicer = TimeSeriesSlicer(sample_series)
+        values = slicer.window_values(len(sample_series) + 1)
+        assert values.shape == (0, len(sample_series) + 1)
+
 
 class TestSplitByRatio:
     """Test ratio-based splitting functionality."""
@@ -278,6 +312,44 @@ class TestSliceByValue:
         result = slicer.slice_by_value(column='value', min_value=20, max_value=30)
         assert len(result) == 11
 
+    def test_slice_by_value_no_bounds(self, sample_dataframe):
+        """Test that omitting both bounds returns all rows."""
+        slicer = TimeSeriesSlicer(sample_dataframe)
+        result = slicer.slice_by_value(column='value')
+        assert len(result) == len(sample_dataframe)
+        assert result is not sample_dataframe
+
+    def test_slice_by_value_stats_matches_slice(self, sample_dataframe):
+        """Test the one-pass summary agrees with the sliced DataFrame."""
+        slicer = TimeSeriesSlicer(sample_dataframe)
+        sliced = slicer.slice_by_value(column='value', min_value=20, max_value=30)
+        stats = slicer.slice_by_value_stats(column='value', min_value=20, max_value=30)
+
+        assert isinstance(stats, ValueSliceStats)
+        assert stats.count == len(sliced)
+        assert stats.total == sliced['value'].sum()
+        assert stats.period_min == sliced.index.min()
+        assert stats.period_max == sliced.index.max()
+
+    def test_slice_by_value_stats_period_column(self, sample_dataframe):
+        """Test taking the period range from a column."""
+        slicer = TimeSeriesSlicer(sample_dataframe)
+        stats = slicer.slice_by_value_stats(column='value', min_value=90, period_column='value')
+        assert stats.period_min == 90
+        assert stats.period_max == sample_dataframe['value'].max()
+
+    def test_slice_by_value_stats_empty(self, sample_dataframe):
+        """Test an empty selection."""
+        slicer = TimeSeriesSlicer(sample_dataframe)
+        stats = slicer.slice_by_value_stats(column='value', min_value=1e9)
+        assert stats == ValueSliceStats(count=0, total=0.0, period_min=None, period_max=None)
+
+    def test_slice_by_value_stats_invalid_period_column(self, sample_dataframe):
+        """Test that an invalid period column raises error."""
+        slicer = TimeSeriesSlicer(sample_dataframe)
+        with pytest.raises(ValueError, match="not found in DataFrame"):
+            slicer.slice_by_value_stats(column='value', period_column='nonexistent')
+
 
 class TestEdgeCases:
     """Test edge cases and boundary conditions."""
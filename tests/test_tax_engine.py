@@ -14,6 +14,7 @@ Tests cover:
 - Convenience functions
 """
 
+import pickle
 import pytest
 import numpy as np
 import pandas as pd
@@ -77,6 +78,26 @@ class TestTaxConfigPreset:
         with pytest.raises(ValueError, match="Unknown jurisdiction"):
             tax_engine.TaxConfigPreset.get_preset('XYZ')
 
+    def test_preset_is_shared_and_read_only(self):
+        """Test presets are built once and cannot be mutated by callers."""
+        config = tax_engine.TaxConfigPreset.get_preset('US')
+
+        assert tax_engine.TaxConfigPreset.get_preset('US') is config
+        with pytest.raises(TypeError):
+            config['social_charges'] = 0.0
+        with pytest.raises(TypeError):
+            config['account_types']['taxable']['dividend_tax_rate'] = 0.0
+
+    def test_copy_preset_is_mutable(self):
+        """Test a copied preset can be customised without touching the shared one."""
+        config = tax_engine.TaxConfigPreset.copy_preset('US')
+        config['account_types']['taxable']['dividend_tax_rate'] = 0.0
+
+        assert config['account_types']['taxable']['dividend_tax_rate'] == 0.0
+        shared = tax_engine.TaxConfigPreset.get_preset('US')
+        assert shared['account_types']['taxable']['dividend_tax_rate'] == 0.15
+        assert pickle.loads(pickle.dumps(config)) == config
+
     def test_all_presets_have_required_fields(self):
         """Test that all presets have required fields."""
         jurisdictions = ['US', 'FR', 'UK']
@@ -316,6 +337,18 @@ class TestAfterTaxScenarios:
         # Tax drag should be finite
         assert np.isfinite(after_tax_df['annual_tax_drag']).all()
 
+    def test_after_tax_arrays_match_dataframe(self):
+        """Test after-tax arrays hold the same values as the DataFrame columns."""
+        scenarios_df = create_test_scenarios()
+        engine = tax_engine.TaxEngine()
+
+        results = engine.apply_taxes({'scenarios': scenarios_df})
+        after_tax_df = results['after_tax_scenarios']
+
+        for col, values in results['after_tax_arrays'].items():
+            assert values.shape == (10, 5)
+            np.testing.assert_array_equal(values.ravel(), after_tax_df[col].values)
+
 
 class TestTaxTables:
     """Test tax table generation."""
@@ -316,6 +316,19 @@ class TestInvestmentTimeSeries:
             # First age should be current age
             assert ages[0] == 30
 
+    def test_time_series_records_match_dataframe(self):
+        """Test the record array holds the same rows as the DataFrame."""
+        manager = user_profile.UserProfileManager()
+        profile_config = create_simple_test_profile()
+
+        results = manager.process(profile_config)
+        records = results['investment_time_series_records']
+        time_series = results['investment_time_series']
+
+        assert isinstance(records, np.recarray)
+        assert list(records.dtype.names) == list(time_series.columns)
+        pd.testing.assert_frame_equal(pd.DataFrame(records), time_series)
+
 
 class TestSlicingCapabilities:
     """Test slicing capabilities."""
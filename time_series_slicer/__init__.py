@@ -5,10 +5,11 @@ Time Series Slicer - A Python library for slicing and segmenting time series dat
 __version__ = "0.1.0"
 __author__ = "Time Series Slicer Contributors"
 
-from .slicer import TimeSeriesSlicer, slice_by_time, slice_by_index, slice_by_window
+from .slicer import TimeSeriesSlicer, ValueSliceStats, slice_by_time, slice_by_index, slice_by_window
 
 __all__ = [
     "TimeSeriesSlicer",
+    "ValueSliceStats",
     "slice_by_time",
     "slice_by_index",
     "slice_by_window",
@@ -2,12 +2,30 @@
 Core time series slicing functionality.
 """
 
-from typing import List, Union, Tuple, Optional, Iterator
+from dataclasses import dataclass
+from typing import Any, List, Union, Tuple, Optional, Iterator
 from datetime import datetime, timedelta
 import pandas as pd
 import numpy as np
 
 
+@dataclass
+class ValueSliceStats:
+    """
+    Summary of the rows selected by a value filter.
+
+    Attributes:
+        count: Number of selected rows
+        total: Sum of the filtered column over the selected rows
+        period_min: Earliest period among the selected rows (None if no rows)
+        period_max: Latest period among the selected rows (None if no rows)
+    """
+    count: int
+    total: float
+    period_min: Optional[Any]
+    period_max: Optional[Any]
+
+
 class TimeSeriesSlicer:
     """
     A class for slicing time series data using various strategies.
@@ -60,13 +78,20 @@ class TimeSeriesSlicer:
         """
         if isinstance(self.data, pd.Series) or isinstance(self.data.index, pd.DatetimeIndex):
             return self.data.loc[start:end]
-        else:
-            mask = pd.Series([True] * len(self.data), index=self.data.index)
-            if start:
-                mask &= self.data[self.time_column] >= pd.to_datetime(start)
-            if end:
-                mask &= self.data[self.time_column] <= pd.to_datetime(end)
-            return self.data[mask]
+
+        times = self.data[self.time_column]
+        if times.is_monotonic_increasing:
+            # Sorted timestamps: binary-search the bounds and slice by position
+            start_pos = times.searchsorted(pd.to_datetime(start), side='left') if start else 0
+            end_pos = times.searchsorted(pd.to_datetime(end), side='right') if end else len(times)
+            return self.data.iloc[start_pos:end_pos]
+
+        mask = np.ones(len(self.data), dtype=bool)
+        if start:
+            mask &= (times >= pd.to_datetime(start)).to_numpy()
+        if end:
+            mask &= (times <= pd.to_datetime(end)).to_numpy()
+        return self.data[mask]
 
     def slice_by_index(
         self,
@@ -134,6 +159,48 @@ class TimeSeriesSlicer:
         else:
             raise ValueError("window_size must be int or timedelta")
 
+    def window_values(
+        self,
+        window_size: int,
+        column: Optional[str] = None,
+        step_size: Optional[int] = None,
+        overlap: bool = False
+    ) -> np.ndarray:
+        """
+        Get the values of fixed-size windows as one 2-D array.
+
+        Row i holds the same values as the i-th window from
+        slice_by_window(window_size, step_size, overlap), so per-window
+        statistics become a single reduction, e.g. ``.mean(axis=1)``.
+
+        Args:
+            window_size: Number of rows in each window
+            column: Column to take values from (for DataFrame)
+            step_size: Step size between windows (defaults to window_size if not overlapping)
+            overlap: Whether to allow overlapping windows
+
+        Returns:
+            Read-only array view of shape (num_windows, window_size)
+        """
+        if not isinstance(window_size, int):
+            raise ValueError("window_size must be int")
+        if step_size is None:
+            step_size = 1 if overlap else window_size
+        elif not isinstance(step_size, int):
+            raise ValueError("step_size must be int when window_size is int")
+
+        if isinstance(self.data, pd.Series):
+            values = self.data.to_numpy()
+        else:
+            if column not in self.data.columns:
+                raise ValueError(f"Column '{column}' not found in DataFrame")
+            values = self.data[column].to_numpy()
+
+        if len(values) < window_size:
+            return np.empty((0, window_size), dtype=values.dtype)
+
+        return np.lib.stride_tricks.sliding_window_view(values, window_size)[::step_size]
+
     def split_by_ratio(
         self,
         ratios: List[float],
@@ -189,21 +256,83 @@ class TimeSeriesSlicer:
         Returns:
             Filtered time series data
         """
-        if isinstance(self.data, pd.Series):
-            data_to_filter = self.data
+        values = self._column_values(column)
+        mask = self._value_mask(values, min_value, max_value)
+        if mask is None:
+            return self.data.copy()
+
+        return self.data[mask]
+
+    def slice_by_value_stats(
+        self,
+        column: str,
+        min_value: Optional[float] = None,
+        max_value: Optional[float] = None,
+        period_column: Optional[str] = None
+    ) -> ValueSliceStats:
+        """
+        Summarize the rows slice_by_value would select, without building the slice.
+
+        The mask is computed once on the raw arrays and reused for every
+        reduction.
+
+        Args:
+            column: Column name to filter on (for DataFrame)
+            min_value: Minimum value threshold
+            max_value: Maximum value threshold
+            period_column: Column holding the periods (defaults to the index)
+
+        Returns:
+            ValueSliceStats with the count, sum and period range of the selection
+        """
+        values = self._column_values(column)
+
+        if period_column is None:
+            periods = self.data.index.to_numpy()
+        elif isinstance(self.data, pd.DataFrame) and period_column in self.data.columns:
+            periods = self.data[period_column].to_numpy()
         else:
-            if column not in self.data.columns:
-                raise ValueError(f"Column '{column}' not found in DataFrame")
-            data_to_filter = self.data[column]
+            raise ValueError(f"Column '{period_column}' not found in DataFrame")
+
+        mask = self._value_mask(values, min_value, max_value)
+        if mask is not None:
+            values = values[mask]
+            periods = periods[mask]
+
+        if len(values) == 0:
+            return ValueSliceStats(count=0, total=0.0, period_min=None, period_max=None)
 
-        mask = pd.Series([True] * len(self.data), index=self.data.index)
+        return ValueSliceStats(
+            count=len(values),
+            total=values.sum(),
+            period_min=periods.min(),
+            period_max=periods.max()
+        )
 
+    def _column_values(self, column: str) -> np.ndarray:
+        """Get the raw values to filter on (the Series itself, or a DataFrame column)."""
+        if isinstance(self.data, pd.Series):
+            return self.data.to_numpy()
+        if column not in self.data.columns:
+            raise ValueError(f"Column '{column}' not found in DataFrame")
+        return self.data[column].to_numpy()
+
+    @staticmethod
+    def _value_mask(
+        values: np.ndarray,
+        min_value: Optional[float],
+        max_value: Optional[float]
+    ) -> Optional[np.ndarray]:
+        """Boolean mask of values within the bounds, or None if there are no bounds."""
+        # Build the mask on the raw array, combining bounds in place
         if min_value is not None:
-            mask &= data_to_filter >= min_value
+            mask = values >= min_value
+            if max_value is not None:
+                mask &= values <= max_value
+            return mask
         if max_value is not None:
-            mask &= data_to_filter <= max_value
-
-        return self.data[mask]
+            return values <= max_value
+        return None
 
     def _get_time_index(self) -> pd.DatetimeIndex:
         """Get the datetime index from the data."""